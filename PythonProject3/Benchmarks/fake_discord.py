@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_PATH = re.compile(r'^/api/webhooks/([^/?]+)/[^/?]+')
+_LINK = re.compile(r'https?://\S+')
+
+
+class FakeDiscord:
+    """
+    Local stand-in for Discord's webhook endpoint.
+
+    Every POST waits ``latency`` seconds (plus up to ``jitter``), then is
+    answered with a 429 (``Retry-After`` header and JSON ``retry_after``)
+    with probability ``rate_429``, a 5xx with probability ``rate_5xx``, or
+    accepted with 204.  Only accepted messages are recorded, per webhook
+    name, so ``links(name)`` is exactly what the channel would show.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, rate_429: float = 0.0,
+                 rate_5xx: float = 0.0, retry_after: float = 0.05, seed: int | None = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.received: dict[str, list[dict]] = {}
+        self.statuses: Counter = Counter()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def url(self, name: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/webhooks/{name}/token"
+
+    def _roll(self) -> int:
+        with self._lock:
+            roll = self._random.random()
+            delay = self.latency + self._random.uniform(0, self.jitter)
+        time.sleep(delay)
+        if roll < self.rate_429:
+            return 429
+        if roll < self.rate_429 + self.rate_5xx:
+            return 502
+        return 204
+
+    def _record(self, name: str, payload: dict):
+        with self._lock:
+            self.received.setdefault(name, []).append(payload)
+
+    def links(self, name: str) -> list[str]:
+        """Article links accepted for webhook ``name``, in delivery order."""
+        links = []
+        for payload in list(self.received.get(name, [])):
+            if payload.get('embeds'):
+                links.extend(embed.get('url') for embed in payload['embeds'])
+            else:
+                links.extend(_LINK.findall(payload.get('content', '')))
+        return links
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *_args):
+                pass
+
+            def _reply(self, status: int, body: dict | None = None, headers: dict | None = None):
+                data = json.dumps(body).encode() if body is not None else b''
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if data:
+                    self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length)
+                match = _PATH.match(self.path)
+                if not match:
+                    with fake._lock:
+                        fake.statuses[404] += 1
+                    self._reply(404, {'message': 'Unknown Webhook', 'code': 10015})
+                    return
+                status = fake._roll()
+                with fake._lock:
+                    fake.statuses[status] += 1
+                if status == 429:
+                    self._reply(429, {'message': 'You are being rate limited.', 'retry_after': fake.retry_after,
+                                      'global': False},
+                                {'Retry-After': f"{fake.retry_after:.3f}", 'X-RateLimit-Remaining': '0',
+                                 'X-RateLimit-Reset-After': f"{fake.retry_after:.3f}"})
+                elif status >= 500:
+                    self._reply(status, {'message': 'Bad Gateway'})
+                else:
+                    fake._record(match.group(1), json.loads(body or b'{}'))
+                    self._reply(204, headers={'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset-After': '0.1'})
+
+        return Handler
+
+    def start(self) -> FakeDiscord:
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-discord', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> FakeDiscord:
+        return self.start()
+
+    def __exit__(self, *_exc):
+        self.stop()
+
+
+__all__ = ['FakeDiscord']
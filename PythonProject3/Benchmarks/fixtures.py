@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from PythonProject3.Helpers.article import Article
+from PythonProject3.Helpers.dates import format_date
+
+# Filler that makes the synthetic pages roughly as heavy as the real ones
+_PAGE_HEAD = (
+    "<html><head><title>News</title>"
+    + "".join(f"<link rel='preload' href='/static/chunk-{i}.js'>" for i in range(50))
+    + "<script>" + "var a=1;" * 2000 + "</script></head><body>"
+    + "<nav>" + "".join(f"<a href='/section/{i}'>Section {i}</a>" for i in range(40)) + "</nav>"
+)
+_PAGE_TAIL = "<footer>" + "<p>Legal text.</p>" * 200 + "</footer></body></html>"
+_LOREM = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor. "
+
+
+def _dates(count: int, newest: date | None = None, per_day: int = 5):
+    newest = newest or date.today()
+    return [newest - timedelta(days=i // per_day) for i in range(count)]
+
+
+def steam_page(count: int = 2000) -> str:
+    """Steam app news page with ``count`` apphub_PostSummaryFull blocks."""
+    blocks = []
+    for i, day in enumerate(_dates(count)):
+        blocks.append(
+            '<div class="apphub_Card modalContentLink interactable">'
+            '<div class="apphub_PostSummaryFull">'
+            f'<a class="apphub_CardContentPreviewImageLink" href="https://store.steampowered.com/news/app/1422450/view/{i}">'
+            f'<img src="https://cdn.example.com/{i}.jpg"></a>'
+            f'<div class="apphub_CardContentTitle">Gameplay Update {i}</div>'
+            f'<div class="apphub_PostSummaryDate">{day.strftime("%b")} {day.day}, {day.year}</div>'
+            f'<div class="apphub_CardTextContent">{_LOREM * 4}</div>'
+            '</div></div>'
+        )
+    return _PAGE_HEAD + "".join(blocks) + _PAGE_TAIL
+
+
+def ea_page(count: int = 2000) -> str:
+    """EA Apex Legends news grid with ``count`` article cards."""
+    cards = []
+    for i, day in enumerate(_dates(count)):
+        cards.append(
+            f'<div class="grid-item"><a href="/games/apex-legends/apex-legends/news/article-{i}">'
+            f'<img src="https://media.contentapi.ea.com/{i}.jpg" alt="">'
+            f'<span class="label">Game Updates</span><span class="date">{format_date(day)}</span>'
+            f'<h3>Apex Legends: Article {i}</h3><p>{_LOREM}</p></a></div>'
+        )
+    return _PAGE_HEAD + '<div class="grid">' + "".join(cards) + "</div>" + _PAGE_TAIL
+
+
+def league_page(count: int = 2000, per_day: int = 5) -> str:
+    """League patch-notes listing with ``count`` featured cards, ``per_day`` per date."""
+    cards = []
+    for i, day in enumerate(_dates(count, per_day=per_day)):
+        cards.append(
+            f'<a data-testid="articlefeaturedcard-component" href="/en-us/news/game-updates/patch-{i}-notes/">'
+            f'<div data-testid="card-title">Patch {i} Notes</div>'
+            f'<time datetime="{day.isoformat()}T18:00:00.000Z">{day.strftime("%m/%d/%Y")}</time>'
+            f'<div data-testid="card-description">{_LOREM}</div></a>'
+        )
+    return _PAGE_HEAD + "".join(cards) + _PAGE_TAIL
+
+
+def arc_page(count: int = 2000) -> str:
+    """Arc Raiders news page with ``count`` article cards."""
+    cards = []
+    for i, day in enumerate(_dates(count)):
+        cards.append(
+            f'<a class="news-article-card_container__xsniv" href="/news/article-{i}">'
+            f'<div class="news-article-card_image__x1"><img src="/img/{i}.png"></div>'
+            f'<div class="news-article-card_title__7LpPs">Arc Raiders article {i}</div>'
+            f'<div class="news-article-card_date__fJqI_">{format_date(day)}</div></a>'
+        )
+    return _PAGE_HEAD + "".join(cards) + _PAGE_TAIL
+
+
+def rss_feed(count: int = 3000) -> bytes:
+    """RSS 2.0 feed with ``count`` items."""
+    now = datetime.now(timezone.utc)
+    items = []
+    for i in range(count):
+        published = format_datetime(now - timedelta(hours=i))
+        items.append(
+            f"<item><title>Security story {i}</title>"
+            f"<link>https://www.example.com/news/security/story-{i}/</link>"
+            f"<pubDate>{published}</pubDate>"
+            f"<dc:creator><![CDATA[Reporter {i % 7}]]></dc:creator>"
+            f"<category><![CDATA[Security]]></category>"
+            f"<description><![CDATA[<p>{_LOREM * 3}</p>]]></description>"
+            f"<guid isPermaLink='false'>https://www.example.com/?p={i}</guid></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>'
+        "<title>Example Security</title><link>https://www.example.com</link>"
+        "<description>Synthetic feed</description>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def articles(count: int = 5000, source: str = "bench") -> list[Article]:
+    """Articles dated today, as a parser would return them."""
+    today = date.today()
+    day = format_date(today)
+    return [
+        Article(f"{source} article {i}", f"https://example.com/{source}/{i}", day, today, source)
+        for i in range(count)
+    ]
+
+
+def write_history(path: str, count: int = 100_000, heading: str = "DeadlockNews", seed: int = 1) -> list[str]:
+    """Write a game-style history file with ``count`` entries; returns their links."""
+    rng = random.Random(seed)
+    links = []
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, day in enumerate(_dates(count, date.today() - timedelta(days=1))):
+            link = f"https://example.com/history/{i}-{rng.randrange(1 << 30)}"
+            links.append(link)
+            f.write(f"{heading}:\nTitle: Historic article {i}\nLink: {link}\nDate: {format_date(day)}\n\n")
+    return links
+
+
+__all__ = ['arc_page', 'articles', 'ea_page', 'league_page', 'rss_feed', 'steam_page', 'write_history']
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+
+from PythonProject3.Benchmarks import fixtures
+from PythonProject3.Benchmarks.fake_discord import FakeDiscord
+from PythonProject3.Benchmarks.replay import Cassette, ReplayAdapter
+from PythonProject3.Game.LeagueNews import LeagueNews
+from PythonProject3.Helpers import Discord
+from PythonProject3.Helpers.delivery import DeliveryQueue, set_delivery_queue
+from PythonProject3.Helpers.http_cache import ValidatorCache, set_cache
+from PythonProject3.Helpers.http_client import create_session, set_session
+from PythonProject3.Helpers.metrics import metrics
+from PythonProject3.Source.webhook import webhook
+
+
+def synthetic_source(index: int, workdir: str):
+    """A League-style parser class for load source ``index`` with its own host and history file."""
+
+    class LoadNews(LeagueNews):
+        history_file = os.path.join(workdir, f"load_{index}_news.txt")
+        source = f"Load{index}"
+
+        def __init__(self):
+            super().__init__()
+            self.base_url = f"https://load{index}.test"
+            self.feed_url = f"{self.base_url}/en-us/news/tags/patch-notes/"
+
+    LoadNews.__name__ = LoadNews.__qualname__ = f"Load{index}News"
+    return LoadNews
+
+
+@contextlib.contextmanager
+def offline(cassette: Cassette, fake: FakeDiscord, workdir: str, batch_size: int,
+            webhook_keys=(), max_attempts: int = 6):
+    """
+    Point the shared session, validator cache, delivery queue and webhooks
+    at the cassette / fake Discord for the duration of the block, then put
+    everything back.
+    """
+    session = create_session(retries=0)
+    session.trust_env = False  # never send localhost traffic through a proxy
+    adapter = ReplayAdapter(cassette)
+    session.mount('https://', adapter)
+    saved_webhooks = dict(webhook)
+    saved_batch = Discord.BATCH_SIZE
+    previous_dir = os.getcwd()
+    try:
+        os.chdir(workdir)  # relative history files and caches land in the workdir
+        set_session(session)
+        set_cache(ValidatorCache(os.path.join(workdir, 'http_cache.json')))
+        set_delivery_queue(DeliveryQueue(Discord._post, max_attempts=max_attempts,
+                                         backoff_base=0.02, backoff_max=0.5))
+        Discord.BATCH_SIZE = batch_size
+        for key in webhook_keys:
+            webhook[key] = fake.url(key)
+        yield adapter
+    finally:
+        set_delivery_queue(None)
+        set_session(None)
+        set_cache(None)
+        Discord.BATCH_SIZE = saved_batch
+        webhook.clear()
+        webhook.update(saved_webhooks)
+        os.chdir(previous_dir)
+        session.close()
+
+
+def _check(fake: FakeDiscord, expected: dict[str, set[str]]) -> dict:
+    duplicates = missing = unexpected = 0
+    for key, links in expected.items():
+        got = fake.links(key)
+        duplicates += len(got) - len(set(got))
+        missing += len(links - set(got))
+        unexpected += len(set(got) - links)
+    return {'duplicates': duplicates, 'missing': missing, 'unexpected': unexpected}
+
+
+def run_load_test(sources: int = 50, articles: int = 500, webhooks: int = 5, batch_size: int = 10,
+                  latency: float = 0.002, jitter: float = 0.002, rate_429: float = 0.02,
+                  rate_5xx: float = 0.02, retry_after: float = 0.05, max_workers: int = 8,
+                  rounds: int = 3, seed: int | None = 1, quiet: bool = True) -> dict:
+    """
+    Run ``sources`` synthetic sources of ``articles`` articles each through
+    ``run_sources`` against a fake Discord, fully offline.
+
+    Rounds are repeated (like consecutive cron runs) until nothing failed
+    or ``rounds`` is reached.  Returns timings plus delivery correctness:
+    every article must reach its webhook exactly once.
+    """
+    from PythonProject3.main import run_game_source, run_sources
+
+    with tempfile.TemporaryDirectory() as workdir, \
+            FakeDiscord(latency, jitter, rate_429, rate_5xx, retry_after, seed) as fake:
+        cassette = Cassette()
+        runners = {}
+        expected: dict[str, set[str]] = {}
+        page = fixtures.league_page(articles, per_day=articles).encode('utf-8')
+        for i in range(sources):
+            cls = synthetic_source(i, workdir)
+            parser = cls()
+            cassette.add(parser.feed_url, page, headers={'Content-Type': 'text/html; charset=utf-8'})
+            key = f"load{i % webhooks}"
+            runners[cls.source] = partial(run_game_source, f"Load {i}", cls, key)
+            expected.setdefault(key, set()).update(a['link'] for a in parser.get_news(page.decode('utf-8')))
+
+        report = {'sources': sources, 'articles': articles, 'webhooks': webhooks, 'batch_size': batch_size,
+                  'rounds': []}
+        metrics.reset()
+        with offline(cassette, fake, workdir, batch_size, expected) as adapter:
+            for _ in range(rounds):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+                    results = run_sources(runners, max_workers=max_workers)
+                seconds = time.perf_counter() - start
+                sent = sum(r['sent'] for r in results.values())
+                failed = sum(r['failed'] for r in results.values())
+                report['rounds'].append({'seconds': round(seconds, 3), 'sent': sent, 'failed': failed})
+                if failed == 0:
+                    break
+            report['replay_misses'] = len(adapter.misses)
+
+        total = sum(r['seconds'] for r in report['rounds'])
+        delivered = sum(len(set(fake.links(key))) for key in expected)
+        report.update(_check(fake, expected))
+        report.update({
+            'seconds': round(total, 3),
+            'articles_per_second': round(delivered / total, 1) if total else None,
+            'responses': {str(status): count for status, count in sorted(fake.statuses.items())},
+        })
+        return report
+
+
+def record(directory: str):
+    """Fetch every registered source's page once and save it as a cassette."""
+    from PythonProject3.Source.registry import REGISTRY, load
+    from PythonProject3.Source.srcs import hacking_rss_list
+
+    cassette = Cassette()
+    session = create_session()
+    session.mount('https://', ReplayAdapter(cassette, record=session.get_adapter('https://')))
+    urls = list(hacking_rss_list.values())
+    urls += [load(spec.target)().feed_url for spec in REGISTRY.values() if spec.kind == 'game']
+    for url in urls:
+        response = session.get(url)
+        print(f"{response.status_code} {url}")
+    cassette.save(directory)
+    return cassette
+
+
+def replay(directory: str, batch_size: int = 1, **fake_options) -> dict:
+    """Run the real registered sources from a recorded cassette against a fake Discord."""
+    from PythonProject3.main import build_sources, run_sources
+    from PythonProject3.Source.registry import REGISTRY
+
+    cassette = Cassette.load(directory)
+    keys = {spec.webhook_key for spec in REGISTRY.values()} | {'devNews'}
+    with tempfile.TemporaryDirectory() as workdir, FakeDiscord(**fake_options) as fake:
+        with offline(cassette, fake, workdir, batch_size, keys) as adapter:
+            start = time.perf_counter()
+            results = run_sources(build_sources())
+            seconds = time.perf_counter() - start
+        return {'seconds': round(seconds, 3), 'results': results, 'replay_misses': adapter.misses,
+                'delivered': {key: len(fake.links(key)) for key in sorted(keys)}}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline load test against a fake Discord webhook server.")
+    parser.add_argument('--sources', type=int, default=50)
+    parser.add_argument('--articles', type=int, default=500, help="articles per source page")
+    parser.add_argument('--webhooks', type=int, default=5)
+    parser.add_argument('--batch-size', type=int, default=10, help="articles per Discord message (1-10)")
+    parser.add_argument('--latency', type=float, default=0.002, help="fake Discord response time, seconds")
+    parser.add_argument('--rate-429', type=float, default=0.02, help="share of posts answered with 429")
+    parser.add_argument('--rate-5xx', type=float, default=0.02, help="share of posts answered with 502")
+    parser.add_argument('--workers', type=int, default=8, help="sources run at the same time")
+    parser.add_argument('--rounds', type=int, default=3, help="runs to repeat while deliveries fail")
+    parser.add_argument('--record', metavar='DIR', help="record the real source pages into DIR and exit")
+    parser.add_argument('--replay', metavar='DIR', help="run the real sources from a recorded DIR")
+    parser.add_argument('--verbose', action='store_true', help="show the sources' own output")
+    parser.add_argument('--json', help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record(args.record)
+        return 0
+    if args.replay:
+        report = replay(args.replay, args.batch_size, latency=args.latency, rate_429=args.rate_429,
+                        rate_5xx=args.rate_5xx)
+    else:
+        report = run_load_test(args.sources, args.articles, args.webhooks, args.batch_size, args.latency,
+                               rate_429=args.rate_429, rate_5xx=args.rate_5xx, max_workers=args.workers,
+                               rounds=args.rounds, quiet=not args.verbose)
+    print(json.dumps(report, indent=2, default=str))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, default=str)
+    return 1 if report.get('duplicates') or report.get('missing') else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
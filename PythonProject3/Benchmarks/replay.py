@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Response headers worth keeping in a cassette (validators, encoding)
+_KEEP_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class Cassette:
+    """
+    Recorded GET responses keyed by URL, stored as one body file per URL
+    plus an ``index.json`` in a directory.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+
+    def add(self, url: str, body: bytes, status: int = 200, headers: dict | None = None):
+        with self._lock:
+            self.entries[url] = {'status': status, 'headers': dict(headers or {}), 'body': body}
+
+    def get(self, url: str) -> dict | None:
+        with self._lock:
+            return self.entries.get(url)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def save(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        index = {}
+        with self._lock:
+            for url, entry in self.entries.items():
+                name = hashlib.blake2b(url.encode('utf-8'), digest_size=10).hexdigest() + '.body'
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(entry['body'])
+                index[url] = {'status': entry['status'], 'headers': entry['headers'], 'file': name}
+        with open(os.path.join(directory, 'index.json'), 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, directory: str) -> Cassette:
+        cassette = cls()
+        with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        for url, entry in index.items():
+            with open(os.path.join(directory, entry['file']), 'rb') as body:
+                cassette.add(url, body.read(), entry['status'], entry['headers'])
+        return cassette
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    requests transport adapter that answers GETs from a ``Cassette``.
+
+    Mount it on a session (e.g. for ``https://``) to run sources offline.
+    Unknown URLs get a 404, or with ``record`` set are fetched for real
+    through that adapter and added to the cassette.
+    """
+
+    def __init__(self, cassette: Cassette, record: HTTPAdapter | None = None):
+        super().__init__()
+        self.cassette = cassette
+        self.record = record
+        self.misses: list[str] = []
+
+    def send(self, request, **kwargs):
+        entry = self.cassette.get(request.url)
+        if entry is None and self.record is not None:
+            real = self.record.send(request, **kwargs)
+            headers = {name: real.headers[name] for name in _KEEP_HEADERS if name in real.headers}
+            self.cassette.add(request.url, real.content, real.status_code, headers)
+            entry = self.cassette.get(request.url)
+        if entry is None:
+            self.misses.append(request.url)
+            entry = {'status': 404, 'headers': {}, 'body': b''}
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.reason = 'OK' if entry['status'] < 400 else 'Not Found'
+        return response
+
+    def close(self):
+        if self.record is not None:
+            self.record.close()
+
+
+__all__ = ['Cassette', 'ReplayAdapter']
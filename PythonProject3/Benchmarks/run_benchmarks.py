@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from PythonProject3.Benchmarks import fixtures
+from PythonProject3.Helpers.dedup import close_seen_store
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+# A stage counts as a regression when it is this much slower than the baseline.
+DEFAULT_THRESHOLD = 1.25
+
+
+class Stage:
+    """One benchmarked step: ``setup()`` builds fresh input, ``run(arg)`` is timed."""
+
+    def __init__(self, name: str, run: Callable, setup: Callable | None = None):
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda: None)
+
+
+def _parser_stage(name, parser_cls, page):
+    return Stage(name, lambda _arg: parser_cls().get_news(page))
+
+
+def build_stages(scale: float, workdir: str) -> list[Stage]:
+    from PythonProject3.Cyber.HackingNews import parse_feed
+    from PythonProject3.Game.ApexNews import ApexNews
+    from PythonProject3.Game.DeadlockNews import DeadlockNews
+    from PythonProject3.Game.GamingNews import ArcRaidersNews
+    from PythonProject3.Game.LeagueNews import LeagueNews
+    from PythonProject3.Helpers.dedup import SeenStore, open_seen_store, remove_seen_store
+    from PythonProject3.Helpers.history import save_articles
+    from PythonProject3.Helpers.search import remove_search_index
+    from PythonProject3.Helpers.seen import remove_global_seen
+    from PythonProject3.Helpers.utils import get_existing_entries
+
+    def n(count):
+        return max(1, int(count * scale))
+
+    rss = fixtures.rss_feed(n(3000))
+    history = os.path.join(workdir, 'history_news.txt')
+    links = fixtures.write_history(history, n(100_000))
+    lookups = links[::max(1, len(links) // 10_000)] + [f"https://example.com/missing/{i}" for i in range(10_000)]
+
+    def fresh_index():
+        remove_seen_store(history)
+        return history
+
+    def open_index(path):
+        SeenStore(path).close()
+
+    def lookup(store):
+        return sum(1 for link in lookups if link in store)
+
+    def fresh_save_target():
+        target = os.path.join(workdir, 'save_news.txt')
+        if os.path.exists(target):
+            os.remove(target)
+        remove_seen_store(target)
+        remove_global_seen(target)
+        remove_search_index(target)
+        return target
+
+    batch = fixtures.articles(n(5000))
+
+    def build_articles(_arg):
+        # Hot-loop shape of a backfill: build many records, then read their fields
+        return sum(len(a.link) + len(a.title) for a in fixtures.articles(n(100_000)))
+
+    return [
+        _parser_stage('parse_arc', ArcRaidersNews, fixtures.arc_page(n(2000))),
+        _parser_stage('parse_league', LeagueNews, fixtures.league_page(n(2000))),
+        _parser_stage('parse_apex', ApexNews, fixtures.ea_page(n(2000))),
+        _parser_stage('parse_deadlock', DeadlockNews, fixtures.steam_page(n(2000))),
+        Stage('parse_rss', lambda _arg: parse_feed(rss)),
+        Stage('history_scan', lambda _arg: get_existing_entries(history)),
+        Stage('dedup_import', open_index, fresh_index),
+        Stage('dedup_lookup', lookup, lambda: open_seen_store(history)),
+        Stage('article_records', build_articles),
+        Stage('save_pipeline', lambda target: save_articles(batch, target, webhook=None), fresh_save_target),
+    ]
+
+
+def measure(stage: Stage, repeat: int) -> dict:
+    """Best wall time over ``repeat`` runs plus peak traced memory of one run."""
+    best = float('inf')
+    for _ in range(repeat):
+        arg = stage.setup()
+        start = time.perf_counter()
+        stage.run(arg)
+        best = min(best, time.perf_counter() - start)
+
+    arg = stage.setup()
+    tracemalloc.start()
+    try:
+        stage.run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': round(best, 6), 'peak_kb': round(peak / 1024, 1)}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return the names of stages slower than ``threshold`` x baseline."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('stages', {}).get(name)
+        if base and base['seconds'] > 0 and result['seconds'] / base['seconds'] > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def _report(results: dict, baseline: dict | None):
+    print(f"{'stage':<16}{'seconds':>12}{'peak KB':>12}{'vs baseline':>14}")
+    for name, result in results.items():
+        base = (baseline or {}).get('stages', {}).get(name)
+        ratio = f"{result['seconds'] / base['seconds']:.2f}x" if base and base['seconds'] else '-'
+        print(f"{name:<16}{result['seconds']:>12.4f}{result['peak_kb']:>12.1f}{ratio:>14}")
+
+
+def run(scale: float = 1.0, repeat: int = 3, only: list[str] | None = None) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        stages = build_stages(scale, workdir)
+        results = {}
+        for stage in stages:
+            if only and not any(fnmatch.fnmatch(stage.name, pattern) for pattern in only):
+                continue
+            results[stage.name] = measure(stage, repeat)
+        for name in ('history_news.txt', 'save_news.txt'):
+            close_seen_store(os.path.join(workdir, name))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks for parsers, dedup and the save pipeline.")
+    parser.add_argument('--scale', type=float, default=1.0, help="multiply every fixture size (default 1.0)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per stage; the best is kept")
+    parser.add_argument('--only', action='append', help="glob of stage names to run (repeatable)")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio reported as a regression (default 1.25)")
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.scale, args.repeat, args.only)
+    payload = {'scale': args.scale, 'python': sys.version.split()[0], 'stages': results}
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('scale') != args.scale:
+            print(f"Baseline was recorded at scale {baseline.get('scale')}, not comparing")
+            baseline = None
+
+    _report(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline or {}, args.threshold)
+    if regressions:
+        print(f"Slower than baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,15 @@
 from __future__ import annotations
-from datetime import datetime
 import feedparser
 from PythonProject3.Source.srcs import hacking_rss_list
 from PythonProject3.Helpers.Discord import try_send
+from PythonProject3.Helpers.article import Article
+from PythonProject3.Helpers.dates import article_date, parse_date
+from PythonProject3.Helpers.dedup import open_seen_store, remove_seen_store
+from PythonProject3.Helpers.history import preview_articles, save_articles
+from PythonProject3.Helpers.http_cache import conditional_get, get_cache
+from PythonProject3.Helpers.metrics import metrics
+from PythonProject3.Helpers.rss import FAST_RSS, FeedFormatError, ParseError, iter_entries
+from PythonProject3.Helpers.watermark import PageWalk
 
 
 def get_existing_entries(filename='news.txt'):
@@ -14,55 +21,112 @@ def get_existing_entries(filename='news.txt'):
                 if lines[i].startswith('Title: '):
                     title = lines[i].strip().split('Title: ')[1]
                     date = lines[i + 2].strip().split('Date: ')[1]
-                    entry_date = datetime.strptime(date, '%a, %d %b %Y %H:%M:%S %z').date()
-                    existing_entries.add((title, entry_date))
+                    entry_date = parse_date(date)
+                    if entry_date:
+                        existing_entries.add((title, entry_date))
     except FileNotFoundError:
         pass
     return existing_entries
 
 
+def _entry_key(entry) -> str:
+    entry_date = article_date(entry)
+    return f"{entry['title']}|{entry_date.isoformat()}"
+
+
+def _import_entries(filename):
+    # Seed the dedup index from the (title, date) pairs already in the file
+    return (f"{title}|{entry_date.isoformat()}" for title, entry_date in get_existing_entries(filename))
+
+
+def _feedparser_entries(content):
+    feed = feedparser.parse(content)
+    return [{'title': entry.title, 'link': entry.link, 'date': entry.published} for entry in feed.entries]
+
+
+def _articles(entries, source, watermark) -> list:
+    walk = PageWalk(watermark)
+    articles = []
+    for entry in entries:
+        article = Article(entry['title'], entry['link'], entry['date'], parse_date(entry['date']), source)
+        articles.append(article)
+        if walk.reached(article):
+            break
+    return articles
+
+
+def parse_feed(content, fast=None, source=None, watermark=None):
+    """
+    Turn raw RSS/Atom bytes into a list of Articles (title, link, date, published).
+
+    Plain RSS 2.0 / Atom feeds go through the streaming extractor in
+    Helpers/rss.py; anything it can't handle is parsed by feedparser.
+    With the feed's high-water ``watermark`` the rest of the feed is
+    skipped once it reaches already-seen entries.
+    """
+    if FAST_RSS if fast is None else fast:
+        try:
+            return _articles(iter_entries(content), source, watermark)
+        except (FeedFormatError, ParseError):
+            metrics.incr('rss_fallbacks')
+    return _articles(_feedparser_entries(content), source, watermark)
+
+
 class NewsFeed:
+    history_file = 'news.txt'
+
     def __init__(self):
         self.news = {}
-        self.get_news()
+        # feed key -> (url, response) waiting to have its validators cached
+        self._responses = {}
 
 
     def get_news(self):
+        # Every feed keeps its own high-water mark in the shared history index
+        seen_entries = open_seen_store(self.history_file, _import_entries)
         for key, value in hacking_rss_list.items():
-            feed = feedparser.parse(value)
-            self.news[key] = [
-                {
-                    'title': entry.title,
-                    'link': entry.link,
-                    'date': entry.published
-                }
-                for entry in feed.entries
-            ]
+            # Fetch through the shared session (keep-alive, timeout, retries)
+            # and only hand the bytes to feedparser.  A 304 means the feed is
+            # unchanged since the last fully delivered run, so skip it.
+            try:
+                response = conditional_get(value)
+            except Exception as e:
+                print(f"Failed to fetch {key} feed: {e}")
+                continue
+            if response is None:
+                continue
+            try:
+                with metrics.timer('parse'):
+                    self.news[key] = parse_feed(response.content, source=key, watermark=seen_entries.watermark(key))
+            except Exception as e:
+                # Not remembered, so the next run downloads and parses this body again
+                print(f"Failed to parse {key} feed: {e}")
+                continue
+            self._responses[key] = (value, response)
+            metrics.incr('articles_found', len(self.news[key]))
+
+    def preview(self, filename='news.txt', webhook=None):
+        """Feed key -> articles ``save_to_file`` would send, without sending anything."""
+        seen_entries = open_seen_store(filename, _import_entries)
+        return {
+            key: preview_articles(entries, filename, webhook, key=_entry_key, store=seen_entries)
+            for key, entries in self.news.items()
+        }
 
     def save_to_file(self, filename='news.txt', webhook=None):
-        current_date = datetime.now().date()
-        seen_entries = get_existing_entries(filename)
+        seen_entries = open_seen_store(filename, _import_entries)
         sent_count = 0
         failed_count = 0
 
-        with open(filename, 'a', encoding='utf-8') as file:  # Open in append mode
-            for key, entries in self.news.items():
-                file.write(f'\n\n{key}:\n')
-                for entry in entries:
-                    entry_date = datetime.strptime(entry['date'], '%a, %d %b %Y %H:%M:%S %z').date()
-                    entry_key = (entry['title'], entry_date)  # Corrected key
-                    if entry_date == current_date and entry_key not in seen_entries:
-                        should_save, sent_count, failed_count = try_send(webhook, entry, sent_count, failed_count)
-                        if not should_save:
-                            continue
-
-                        # Write to file only if Discord succeeded (or no webhook)
-                        file.write(f'Title: {entry["title"]}\n')
-                        file.write(f'Link: {entry["link"]}\n')
-                        file.write(f'Date: {entry["date"]}\n')
-                        file.write('\n')
-                        seen_entries.add(entry_key)
+        for key, entries in self.news.items():
+            result = save_articles(entries, filename, webhook, try_send, heading=key, key=_entry_key,
+                                   store=seen_entries)
+            sent_count += result['sent']
+            failed_count += result['failed']
 
+        if failed_count == 0:
+            for url, response in self._responses.values():
+                get_cache().remember(url, response)
         return {"sent": sent_count, "failed": failed_count}
 
 
@@ -71,4 +135,5 @@ class NewsFeed:
 # Clear the file
 def clear_file(filename='news.txt'):
     with open(filename, 'w', encoding='utf-8') as file:
-        file.write('')
\ No newline at end of file
+        file.write('')
+    remove_seen_store(filename)
\ No newline at end of file
@@ -1,35 +1,49 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
-
-from bs4 import BeautifulSoup
 
 from PythonProject3.Source.srcs import game_news_list
 from PythonProject3.Helpers.utils import get_existing_entries
 from PythonProject3.Helpers.Discord import try_send
+from PythonProject3.Helpers.article import Article
+from PythonProject3.Helpers.dates import parse_date
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.soup import SoupStrainer, make_soup
+from PythonProject3.Helpers.watermark import PageWalk
 
 _DATE_PATTERN = re.compile(
     r'\b(January|February|March|April|May|June|July|August|September|October|November|December)'
     r'\s+\d{1,2},\s+\d{4}\b'
 )
 
+# Articles are <a href> cards; nothing outside links is needed
+_LINKS = SoupStrainer('a', href=True)
+
 
 class ApexNews:
+    history_file = 'apex_news.txt'
+    source = 'Apex'
+
     def __init__(self):
         self.news = []
+        # High-water mark set by the runner; parsing stops once it is reached
+        self.watermark = None
         self.base_url = game_news_list['apexlegends']
-        self.feed_url = f"{self.base_url}/games/apex-legends/apex-legends/news?page=1&type=latest"
+        self.feed_url = self.page_url(1)
+
+    def page_url(self, page: int) -> str:
+        return f"{self.base_url}/games/apex-legends/apex-legends/news?page={page}&type=latest"
 
     def get_news(self, html: str):
         """
         Extracts Apex Legends news articles from HTML.
-        Returns a list of dicts: { 'title': str, 'date': str, 'link': str }
+        Returns a list of Articles (title, date, link, published).
 
         The EA news page structure wraps each article in an <a> tag containing
         an <img>, a category label, a date string, and an <h3> title.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, parse_only=_LINKS)
+        walk = PageWalk(self.watermark)
         articles = []
 
         for a in soup.find_all('a', href=True):
@@ -53,41 +67,16 @@ class ApexNews:
             date = match.group(0)
 
             link = href if href.startswith('http') else f"{self.base_url}{href}"
-            articles.append({'title': title, 'date': date, 'link': link})
+            articles.append(Article(title, link, date, parse_date(date), self.source))
+            if walk.reached(articles[-1]):
+                break
 
         self.news = articles
         return articles
 
-    def save_to_file(self, filename='apex_news.txt', webhook=None):
-        current_date = datetime.now().date()
-        seen_entries = get_existing_entries(filename)
-        sent_count = 0
-        failed_count = 0
-
-        with open(filename, 'a', encoding='utf-8') as f:
-            for article in self.news:
-                try:
-                    article_date = datetime.strptime(article['date'], '%B %d, %Y').date()
-                except Exception:
-                    continue
-
-                article_key = article['link']
-                if article_date == current_date and article_key not in seen_entries:
-                    should_save, sent_count, failed_count = try_send(webhook, article, sent_count, failed_count)
-                    if not should_save:
-                        continue
-
-                    # Write to file only if Discord succeeded (or no webhook)
-                    title = article['title'].replace('\n', ' ')
-                    link = article['link']
-                    date = article['date'].replace('\n', ' ')
-                    f.write("ApexNews_latest:\n")
-                    f.write(f"Title: {title}\n")
-                    f.write(f"Link: {link}\n")
-                    f.write(f"Date: {date}\n\n")
-                    seen_entries.add(article_key)
-
-        return {"sent": sent_count, "failed": failed_count}
+    def save_to_file(self, filename=None, webhook=None):
+        return save_articles(self.news, filename or self.history_file, webhook, try_send,
+                             entry_heading='ApexNews_latest')
 
 
 __all__ = ['ApexNews', 'get_existing_entries']
@@ -1,23 +1,35 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
-
 from PythonProject3.Source.srcs import game_news_list
 from PythonProject3.Helpers.utils import get_existing_entries
 from PythonProject3.Helpers.Discord import try_send
+from PythonProject3.Helpers.article import Article
+from PythonProject3.Helpers.dates import parse_date
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.soup import SoupStrainer, has_class, make_soup
+from PythonProject3.Helpers.watermark import PageWalk
+
+_CARDS = SoupStrainer('a', class_=has_class('news-article-card_container__xsniv'))
 
 
 class ArcRaidersNews:
+    history_file = 'arc_raiders_news.txt'
+    source = 'ArcRaiders'
+
     def __init__(self):
         self.news = []
+        # High-water mark set by the runner; parsing stops once it is reached
+        self.watermark = None
         self.base_url = game_news_list['arcraiders']
+        self.feed_url = f"{self.base_url}/news"
 
     def get_news(self, html: str):
         """
         Extracts game news articles from HTML using BeautifulSoup.
-        Returns a list of dicts: { 'href': str, 'title': str, 'date': str, 'link': str }
+        Returns a list of Articles (title, date, link, published, href).
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, parse_only=_CARDS)
+        walk = PageWalk(self.watermark)
         articles = []
         for a in soup.find_all('a', class_='news-article-card_container__xsniv'):
             href = a.get('href', '')
@@ -29,42 +41,15 @@ class ArcRaidersNews:
             date = date_div.get_text(strip=True) if date_div else ''
             # Build full link
             link = href if href.startswith('http') else f"{self.base_url}{href}"
-            articles.append({'href': href, 'title': title, 'date': date, 'link': link})
+            articles.append(Article(title, link, date, parse_date(date), self.source, extras=(('href', href),)))
+            if walk.reached(articles[-1]):
+                break
         self.news = articles
         return articles
 
-    def save_to_file(self, filename='arc_raiders_news.txt', webhook=None):
-        from datetime import datetime
-        current_date = datetime.now().date()
-
-        seen_entries = get_existing_entries(filename)
-        sent_count = 0
-        failed_count = 0
-
-        with open(filename, 'a', encoding='utf-8') as f:  # Append mode
-            for article in self.news:
-                # Parse date and only save today's entries
-                try:
-                    article_date = datetime.strptime(article['date'], '%B %d, %Y').date()
-                except Exception:
-                    continue
-                article_key = article['link']
-                if article_date == current_date and article_key not in seen_entries:
-                    should_save, sent_count, failed_count = try_send(webhook, article, sent_count, failed_count)
-                    if not should_save:
-                        continue
-
-                    # Write to file only if Discord succeeded (or no webhook)
-                    title = article['title'].replace('\n', ' ')
-                    link = article['link']
-                    date = article['date'].replace('\n', ' ')
-                    f.write("ArcRaidersNews_home:\n")
-                    f.write(f"Title: {title}\n")
-                    f.write(f"Link: {link}\n")
-                    f.write(f"Date: {date}\n\n")
-                    seen_entries.add(article_key)
-
-        return {"sent": sent_count, "failed": failed_count}
+    def save_to_file(self, filename=None, webhook=None):
+        return save_articles(self.news, filename or self.history_file, webhook, try_send,
+                             entry_heading='ArcRaidersNews_home')
 
 
 __all__ = ['ArcRaidersNews', 'get_existing_entries']
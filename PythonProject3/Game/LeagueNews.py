@@ -1,26 +1,35 @@
 from __future__ import annotations
 
-from datetime import datetime
-
-from bs4 import BeautifulSoup
-
 from PythonProject3.Source.srcs import game_news_list
 from PythonProject3.Helpers.utils import get_existing_entries
 from PythonProject3.Helpers.Discord import try_send
+from PythonProject3.Helpers.article import Article
+from PythonProject3.Helpers.dates import format_date, parse_date
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.soup import SoupStrainer, make_soup
+from PythonProject3.Helpers.watermark import PageWalk
+
+_CARDS = SoupStrainer('a', attrs={'data-testid': 'articlefeaturedcard-component'})
 
 
 class LeagueNews:
+    history_file = 'league_news.txt'
+    source = 'League'
+
     def __init__(self):
         self.news = []
+        # High-water mark set by the runner; parsing stops once it is reached
+        self.watermark = None
         self.base_url = game_news_list['leagueoflegends']
         self.feed_url = f"{self.base_url}/en-us/news/tags/patch-notes/"
 
     def get_news(self, html: str):
         """
         Extracts League of Legends patch note articles from HTML.
-        Returns a list of dicts: { 'title': str, 'date': str, 'link': str }
+        Returns a list of Articles (title, date, link, published).
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, parse_only=_CARDS)
+        walk = PageWalk(self.watermark)
         articles = []
 
         for a in soup.find_all('a', attrs={'data-testid': 'articlefeaturedcard-component'}):
@@ -34,50 +43,27 @@ class LeagueNews:
             title = title_div.get_text(strip=True) if title_div else ''
 
             # Use ISO datetime attribute for reliable parsing
+            published = None
+            date = ''
             if time_tag and time_tag.get('datetime'):
-                try:
-                    date_obj = datetime.fromisoformat(time_tag['datetime'].replace('Z', '+00:00')).date()
-                    date = date_obj.strftime('%B %d, %Y')  # e.g. "April 28, 2026"
-                except Exception:
+                published = parse_date(time_tag['datetime'])
+                if published:
+                    date = format_date(published)  # e.g. "April 28, 2026"
+                else:
                     date = time_tag.get_text(strip=True)
-            else:
-                date = ''
+                    published = parse_date(date)
 
             link = href if href.startswith('http') else f"{self.base_url}{href}"
-            articles.append({'title': title, 'date': date, 'link': link})
+            articles.append(Article(title, link, date, published, self.source))
+            if walk.reached(articles[-1]):
+                break
 
         self.news = articles
         return articles
 
-    def save_to_file(self, filename='league_news.txt', webhook=None):
-        current_date = datetime.now().date()
-        seen_entries = get_existing_entries(filename)
-        sent_count = 0
-        failed_count = 0
-
-        with open(filename, 'a', encoding='utf-8') as f:
-            for article in self.news:
-                try:
-                    article_date = datetime.strptime(article['date'], '%B %d, %Y').date()
-                except Exception:
-                    continue
-                article_key = article['link']
-                if article_date == current_date and article_key not in seen_entries:
-                    should_save, sent_count, failed_count = try_send(webhook, article, sent_count, failed_count)
-                    if not should_save:
-                        continue
-
-                    # Write to file only if Discord succeeded (or no webhook)
-                    title = article['title'].replace('\n', ' ')
-                    link = article['link']
-                    date = article['date'].replace('\n', ' ')
-                    f.write("LeagueNews_patchnotes:\n")
-                    f.write(f"Title: {title}\n")
-                    f.write(f"Link: {link}\n")
-                    f.write(f"Date: {date}\n\n")
-                    seen_entries.add(article_key)
-
-        return {"sent": sent_count, "failed": failed_count}
+    def save_to_file(self, filename=None, webhook=None):
+        return save_articles(self.news, filename or self.history_file, webhook, try_send,
+                             entry_heading='LeagueNews_patchnotes')
 
 
 __all__ = ['LeagueNews', 'get_existing_entries']
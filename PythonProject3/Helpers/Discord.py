@@ -1,6 +1,31 @@
 from __future__ import annotations
 
-import requests
+import os
+
+from PythonProject3.Helpers.delivery import get_delivery_queue
+from PythonProject3.Helpers.http_client import get_session
+from PythonProject3.Helpers.metrics import metrics
+
+# Discord limits for a single webhook message
+MAX_EMBEDS = 10
+MAX_EMBED_TITLE = 256
+MAX_EMBED_CHARS = 6000
+
+# Articles packed into one webhook message.  1 keeps the classic one
+# plain-text message per article; 2-10 sends them as embeds.
+BATCH_SIZE = max(1, min(MAX_EMBEDS, int(os.getenv("DISCORD_BATCH_SIZE", "1"))))
+
+
+def _post(webhook, data):
+    return get_session().post(webhook, json=data)
+
+
+def deliver(webhook, data):
+    """
+    Queue ``data`` for ``webhook`` on the rate-limit aware delivery queue.
+    Returns a Future resolving to a delivery.DeliveryResult.
+    """
+    return get_delivery_queue(_post).submit(webhook, data)
 
 
 def send_to_discord(webhook, entry):
@@ -10,9 +35,11 @@ def send_to_discord(webhook, entry):
         "content": content
     }
 
-    response = requests.post(webhook, json=data)
-    if response.status_code != 204:
-        print(f"Failed to send the message to Discord. Status code: {response.status_code}")
+    with metrics.timer('discord'):
+        result = deliver(webhook, data).result()
+    metrics.incr('discord_messages', labels={'status': result.status_code})
+    if not result.ok:
+        print(f"Failed to send the message to Discord. Status code: {result.status_code}")
         return False
     else:
         print("Message sent successfully to Discord!")
@@ -36,3 +63,81 @@ def try_send(webhook, article, sent_count: int, failed_count: int) -> tuple[bool
         return True, sent_count + 1, failed_count  # Success: save + increment sent
     else:
         return False, sent_count, failed_count + 1  # Failure: skip save + increment failed
+
+
+def build_embed(entry) -> dict:
+    title = entry['title']
+    if len(title) > MAX_EMBED_TITLE:
+        title = title[:MAX_EMBED_TITLE - 3] + '...'
+    return {
+        "title": title,
+        "url": entry['link'],
+        "description": f"Published on: {entry['date']}",
+    }
+
+
+def _embed_size(embed: dict) -> int:
+    return len(embed['title']) + len(embed['description'])
+
+
+def chunk_embeds(entries, batch_size: int = MAX_EMBEDS) -> list[list[tuple[int, dict]]]:
+    """
+    Split entries into messages of at most ``batch_size`` embeds whose combined
+    text stays under Discord's 6000 character limit.
+
+    Returns lists of (index into entries, embed) pairs.
+    """
+    batch_size = max(1, min(MAX_EMBEDS, batch_size))
+    chunks: list[list[tuple[int, dict]]] = []
+    current: list[tuple[int, dict]] = []
+    current_chars = 0
+    for index, entry in enumerate(entries):
+        embed = build_embed(entry)
+        size = _embed_size(embed)
+        if current and (len(current) >= batch_size or current_chars + size > MAX_EMBED_CHARS):
+            chunks.append(current)
+            current, current_chars = [], 0
+        current.append((index, embed))
+        current_chars += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def send_batch_to_discord(webhook, entries, batch_size: int = MAX_EMBEDS) -> list[bool]:
+    """
+    Send entries as embeds, packing several into each webhook message.
+    Returns one delivered flag per entry (all entries of a message share its outcome).
+    """
+    delivered = [False] * len(entries)
+    chunks = chunk_embeds(entries, batch_size)
+    # Queue every message up front; the webhook's worker sends them in order
+    futures = [deliver(webhook, {"embeds": [embed for _, embed in chunk]}) for chunk in chunks]
+    for chunk, future in zip(chunks, futures):
+        with metrics.timer('discord'):
+            result = future.result()
+        metrics.incr('discord_messages', labels={'status': result.status_code})
+        if not result.ok:
+            print(f"Failed to send {len(chunk)} embeds to Discord. Status code: {result.status_code}")
+            continue
+        print(f"Sent {len(chunk)} articles to Discord in one message!")
+        for index, _ in chunk:
+            delivered[index] = True
+    return delivered
+
+
+def try_send_batch(webhook, articles, sent_count: int, failed_count: int,
+                   batch_size: int | None = None) -> tuple[list[bool], int, int]:
+    """
+    Batched counterpart of ``try_send``.
+
+    Returns:
+        (should_save, sent_count, failed_count) where should_save holds one
+        flag per article, so only delivered articles are written to file.
+    """
+    if not webhook:
+        return [True] * len(articles), sent_count, failed_count
+
+    delivered = send_batch_to_discord(webhook, articles, batch_size or BATCH_SIZE)
+    sent = sum(delivered)
+    return delivered, sent_count + sent, failed_count + len(delivered) - sent
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date as date_type
+
+# Keys every article exposes through the mapping interface, in dict order
+_KEYS = ('title', 'date', 'link')
+# Dataclass fields a legacy dict may carry; ``published`` is an attribute only
+_FIELDS = frozenset(_KEYS) | {'published'}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Article(Mapping):
+    """
+    One news item as produced by the parsers.
+
+    Slotted and immutable, so thousands of them cost far less than dicts.
+    It still behaves like the old ``{'title', 'date', 'link'}`` dict for
+    reading: ``article['link']``, ``.get()``, ``dict(article)`` and ``==``
+    against a dict all work.  Source-specific fields (Arc Raiders'
+    ``href``) live in ``extras`` and are exposed as keys too; the parsed
+    ``published`` date and ``source`` are attributes only.  Articles hash
+    by ``link``, so they can go in sets and be used as dict keys.
+    """
+    title: str
+    link: str
+    date: str
+    published: date_type | None = None
+    source: str | None = None
+    extras: tuple[tuple[str, object], ...] = ()
+
+    @classmethod
+    def from_mapping(cls, mapping, source: str | None = None) -> Article:
+        """Build an Article from a legacy dict (unknown keys become extras)."""
+        if isinstance(mapping, Article):
+            return mapping
+        return cls(
+            title=mapping['title'],
+            link=mapping['link'],
+            date=mapping['date'],
+            published=mapping.get('published'),
+            source=source,
+            extras=tuple((key, value) for key, value in mapping.items() if key not in _FIELDS),
+        )
+
+    def __getitem__(self, key):
+        if key in _KEYS:
+            return getattr(self, key)
+        for name, value in self.extras:
+            if name == key:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from _KEYS
+        for name, _ in self.extras:
+            yield name
+
+    def __len__(self) -> int:
+        return len(_KEYS) + len(self.extras)
+
+    def __hash__(self) -> int:
+        # Equal articles (Mapping equality) always share their link
+        return hash(self.link)
+
+
+def as_article(article, source: str | None = None) -> Article:
+    return article if isinstance(article, Article) else Article.from_mapping(article, source)
+
+
+__all__ = ['Article', 'as_article']
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import secrets
+import socket
+import threading
+import time
+
+from PythonProject3.Helpers.dedup import connect
+from PythonProject3.Helpers.metrics import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# SQLite file holding source leases, shared by every instance (same
+# directory or a shared mount).  Unset (the default) runs without leases,
+# which is all a single instance needs.
+COORDINATION_PATH = os.getenv("NEWS_COORDINATION", "")
+# Seconds a lease lasts without renewal; a crashed instance's sources are
+# picked up by another one after this long.
+LEASE_TTL = float(os.getenv("NEWS_LEASE_TTL", "300"))
+# Identifies this process in the lease table.
+INSTANCE_ID = os.getenv("NEWS_INSTANCE_ID") or f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(3)}"
+
+
+@contextlib.contextmanager
+def file_lock(filename: str):
+    """
+    Exclusive lock on ``filename + '.lock'`` across threads and processes.
+
+    History files are appended to and rewritten (retention) under this
+    lock.  A separate lock file is used because compaction replaces the
+    history file itself.
+    """
+    with open(f"{filename}.lock", 'a+b') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after ~10s; keep waiting
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class LeaseStore:
+    """
+    Named, expiring leases in SQLite.
+
+    ``acquire`` is a single upsert that only succeeds when the lease is
+    free, expired or already ours, so at most one instance holds a name at
+    a time.  Holders renew before ``ttl`` runs out; a crashed holder simply
+    stops renewing and its lease lapses.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS leases ('
+            ' name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL, acquired_at REAL NOT NULL)'
+        )
+
+    def acquire(self, name: str, owner: str = INSTANCE_ID, ttl: float = LEASE_TTL,
+                now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            cursor = self._conn.execute(
+                'INSERT INTO leases (name, owner, expires_at, acquired_at) VALUES (?, ?, ?, ?)'
+                ' ON CONFLICT (name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at,'
+                '  acquired_at = CASE WHEN leases.owner = excluded.owner THEN leases.acquired_at'
+                '                     ELSE excluded.acquired_at END'
+                ' WHERE leases.owner = excluded.owner OR leases.expires_at <= ?',
+                (name, owner, now + ttl, now, now),
+            )
+            return cursor.rowcount == 1
+
+    def renew(self, name: str, owner: str = INSTANCE_ID, ttl: float = LEASE_TTL,
+              now: float | None = None) -> bool:
+        """Extend a lease we still hold; False if it lapsed and someone else took it."""
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._conn.execute('UPDATE leases SET expires_at = ? WHERE name = ? AND owner = ?',
+                                      (now + ttl, name, owner)).rowcount == 1
+
+    def release(self, name: str, owner: str = INSTANCE_ID) -> bool:
+        with self._lock:
+            return self._conn.execute('DELETE FROM leases WHERE name = ? AND owner = ?',
+                                      (name, owner)).rowcount == 1
+
+    def holder(self, name: str, now: float | None = None) -> str | None:
+        """Owner of an unexpired lease on ``name``, if any."""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute('SELECT owner FROM leases WHERE name = ? AND expires_at > ?',
+                                     (name, now)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+@contextlib.contextmanager
+def hold(store: LeaseStore, name: str, owner: str = INSTANCE_ID, ttl: float = LEASE_TTL):
+    """
+    Try to take lease ``name``; yields whether we got it.  While held, a
+    heartbeat thread renews it every ``ttl / 3`` seconds, and it is released
+    on exit.
+    """
+    if not store.acquire(name, owner, ttl):
+        metrics.incr('lease_conflicts', labels={'lease': name})
+        yield False
+        return
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(ttl / 3):
+            if not store.renew(name, owner, ttl):
+                print(f"Lost the lease on {name}")
+                return
+
+    thread = threading.Thread(target=heartbeat, name=f"lease-{name}", daemon=True)
+    thread.start()
+    try:
+        yield True
+    finally:
+        stop.set()
+        thread.join()
+        store.release(name, owner)
+
+
+_store: LeaseStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_lease_store() -> LeaseStore | None:
+    """The shared lease store at NEWS_COORDINATION, or None when running alone."""
+    global _store
+    if _store is None and COORDINATION_PATH:
+        with _store_lock:
+            if _store is None:
+                _store = LeaseStore(COORDINATION_PATH)
+    return _store
+
+
+def set_lease_store(store: LeaseStore | None):
+    global _store
+    with _store_lock:
+        old, _store = _store, store
+    if old is not None and old is not store:
+        old.close()
+
+
+@contextlib.contextmanager
+def lease(name: str, ttl: float = LEASE_TTL):
+    """``hold`` on the shared store; always granted when coordination is off."""
+    store = get_lease_store()
+    if store is None:
+        yield True
+        return
+    with hold(store, name, ttl=ttl) as held:
+        yield held
+
+
+__all__ = ['COORDINATION_PATH', 'INSTANCE_ID', 'LEASE_TTL', 'LeaseStore', 'file_lock', 'get_lease_store',
+           'hold', 'lease', 'set_lease_store']
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+from PythonProject3.Helpers.article import Article
+
+MONTH_NAMES = ['', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December']
+
+# "june" / "jun" / "sept" -> month number
+_MONTHS = {name.lower(): number for number, name in enumerate(MONTH_NAMES) if name}
+_MONTHS.update({name[:3].lower(): number for number, name in enumerate(MONTH_NAMES) if name})
+_MONTHS['sept'] = 9
+
+_ISO = re.compile(r'^(\d{4})-(\d{2})-(\d{2})')
+# "June 23, 2026" / "Jun 23 2026" / "23 June, 2026" / "Tue, 23 Jun 2026 08:00:00 +0000"
+_MONTH_DAY_YEAR = re.compile(r'\b([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b')
+_DAY_MONTH_YEAR = re.compile(r'\b(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9})\.?,?\s+(\d{4})\b')
+
+_FALLBACK_FORMATS = ['%d/%m/%Y', '%Y/%m/%d', '%d.%m.%Y']
+
+
+def _build(year, month, day) -> date | None:
+    try:
+        return date(int(year), month, int(day))
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=8192)
+def parse_date(raw: str) -> date | None:
+    """
+    Turn any date string our sources emit into a ``date`` (or None).
+
+    Handles ISO 8601 (League ``<time datetime>``, Atom), RFC 822 (RSS
+    ``pubDate``) and the "Month DD, YYYY" / "DD Month, YYYY" variants used
+    by the EA, Arc Raiders and Steam pages, including dates embedded in
+    longer text.  Results are cached because every run sees the same strings.
+    """
+    if not raw:
+        return None
+    text = ' '.join(raw.split())
+
+    match = _ISO.match(text)
+    if match:
+        return _build(match.group(1), int(match.group(2)), match.group(3))
+
+    # RFC 822 is "DD Mon YYYY", which _DAY_MONTH_YEAR covers after the weekday
+    for pattern, order in ((_DAY_MONTH_YEAR, 'dmy'), (_MONTH_DAY_YEAR, 'mdy')):
+        for match in pattern.finditer(text):
+            if order == 'dmy':
+                day, month_name, year = match.groups()
+            else:
+                month_name, day, year = match.groups()
+            month = _MONTHS.get(month_name.lower())
+            if month:
+                parsed = _build(year, month, day)
+                if parsed:
+                    return parsed
+
+    for fmt in _FALLBACK_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def format_date(value: date) -> str:
+    """Format like the history files do: 'June 05, 2026'."""
+    return f"{MONTH_NAMES[value.month]} {value.day:02d}, {value.year}"
+
+
+def article_date(article) -> date | None:
+    """The article's publication date, reusing the parser's ``published`` when present."""
+    if isinstance(article, Article):
+        published, raw = article.published, article.date
+    else:
+        published, raw = article.get('published'), article.get('date')
+    if isinstance(published, date):
+        return published
+    return parse_date(raw or '')
+
+
+__all__ = ['MONTH_NAMES', 'article_date', 'format_date', 'parse_date']
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Callable, Iterable
+
+from PythonProject3.Helpers.utils import get_existing_entries
+from PythonProject3.Helpers.watermark import Watermark
+
+# Suffix of the SQLite index kept next to every history file.
+INDEX_SUFFIX = '.seen.sqlite3'
+# Seconds an unconfirmed claim blocks other instances.  A run that crashed
+# between claiming an article and delivering it stops blocking after this
+# long, so another instance (or the next run) posts it.
+CLAIM_TTL = float(os.getenv("NEWS_CLAIM_TTL", "1800"))
+
+
+def index_path(filename: str) -> str:
+    return f"{filename}{INDEX_SUFFIX}"
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a SQLite database tuned for many small writes from several threads/processes."""
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+def add_claim_columns(conn: sqlite3.Connection, table: str):
+    """Add the ``owner`` / ``claimed_at`` columns to a table created before claims had them."""
+    columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+    for column, kind in (('owner', 'TEXT'), ('claimed_at', 'REAL')):
+        if column not in columns:
+            conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {kind}')
+
+
+class SeenStore:
+    """
+    Indexed dedup set for one history file.
+
+    Membership checks are a primary-key lookup instead of a rescan of the
+    whole text file.  The first time a history file is opened its existing
+    entries are imported once with ``importer`` (defaults to the ``Link:``
+    scanner in utils), after which the text file is never read again.
+
+    Keys are either recorded (``add``) or claimed by an ``owner`` that is
+    about to deliver them (``claim_many``).  A claim counts as seen until
+    it is confirmed by ``add`` / ``add_many``, released, or left
+    unconfirmed for ``CLAIM_TTL`` seconds.
+    """
+
+    def __init__(self, filename: str, importer: Callable[[str], Iterable[str]] = get_existing_entries):
+        self.filename = filename
+        self.path = index_path(filename)
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, added_at REAL NOT NULL,'
+            ' owner TEXT, claimed_at REAL);'
+            'CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);'
+        )
+        add_claim_columns(self._conn, 'seen')
+        self._import_once(importer)
+
+    def _import_once(self, importer):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                done = self._conn.execute("SELECT 1 FROM meta WHERE name = 'imported'").fetchone()
+                if not done:
+                    now = time.time()
+                    self._conn.executemany(
+                        'INSERT OR IGNORE INTO seen (key, added_at) VALUES (?, ?)',
+                        ((key, now) for key in importer(self.filename)),
+                    )
+                    self._conn.execute("INSERT INTO meta (name, value) VALUES ('imported', ?)", (str(now),))
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT 1 FROM seen WHERE key = ? AND (owner IS NULL OR claimed_at > ?)',
+                (key, time.time() - CLAIM_TTL)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+
+    def add(self, key: str) -> bool:
+        """Record ``key`` (confirming a claim on it); returns False if it was already recorded."""
+        return self.add_many([key]) == 1
+
+    def add_many(self, keys) -> int:
+        """``add`` for several keys in one transaction; returns how many were newly recorded."""
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                self._conn.executemany(
+                    'INSERT INTO seen (key, added_at) VALUES (?, ?)'
+                    ' ON CONFLICT (key) DO UPDATE SET added_at = excluded.added_at, owner = NULL, claimed_at = NULL'
+                    ' WHERE seen.owner IS NOT NULL',
+                    ((key, now) for key in keys))
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            return self._conn.total_changes - before
+
+    def claim_many(self, keys, owner: str, now: float | None = None, ttl: float = CLAIM_TTL) -> list[bool]:
+        """
+        Claim ``keys`` for ``owner`` in one transaction; one result per key.
+        A key is won when it is unknown or its claim went stale (older than
+        ``ttl`` and never confirmed), so a crashed run can't block it forever.
+        """
+        now = time.time() if now is None else now
+        results = []
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for key in keys:
+                    results.append(self._conn.execute(
+                        'INSERT INTO seen (key, added_at, owner, claimed_at) VALUES (?, ?, ?, ?)'
+                        ' ON CONFLICT (key) DO UPDATE SET added_at = excluded.added_at, owner = excluded.owner,'
+                        '  claimed_at = excluded.claimed_at'
+                        ' WHERE seen.owner IS NOT NULL AND seen.claimed_at <= ?',
+                        (key, now, owner, now, now - ttl)).rowcount == 1)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return results
+
+    def release_many(self, keys, owner: str):
+        """Drop ``owner``'s unconfirmed claims on ``keys`` so the next run can claim them again."""
+        with self._lock:
+            self._conn.executemany('DELETE FROM seen WHERE key = ? AND owner = ?', ((key, owner) for key in keys))
+
+    def discard(self, key: str):
+        with self._lock:
+            self._conn.execute('DELETE FROM seen WHERE key = ?', (key,))
+
+    def prune(self, older_than: float | None = None, keep_latest: int | None = None) -> int:
+        """
+        Forget keys added before ``older_than`` (a timestamp) and/or all but
+        the ``keep_latest`` most recent ones.  Returns the number removed.
+        """
+        removed = 0
+        with self._lock:
+            if older_than is not None:
+                removed += self._conn.execute('DELETE FROM seen WHERE added_at < ?', (older_than,)).rowcount
+            if keep_latest is not None:
+                removed += self._conn.execute(
+                    'DELETE FROM seen WHERE key NOT IN '
+                    '(SELECT key FROM seen ORDER BY added_at DESC, rowid DESC LIMIT ?)',
+                    (keep_latest,),
+                ).rowcount
+        return removed
+
+    @staticmethod
+    def _watermark_name(source: str | None) -> str:
+        return 'watermark' if source is None else f'watermark:{source}'
+
+    def watermark(self, source: str | None = None) -> Watermark | None:
+        """The high-water mark of ``source`` (several feeds may share one file), if any."""
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM meta WHERE name = ?',
+                                     (self._watermark_name(source),)).fetchone()
+        if not row:
+            return None
+        published, _, link = row[0].partition('\t')
+        return Watermark(date.fromisoformat(published), link)
+
+    def advance_watermark(self, source: str | None, published: date, link: str) -> bool:
+        """Move the mark to (``published``, ``link``) unless it is already newer; atomic."""
+        name = self._watermark_name(source)
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+                moved = not row or date.fromisoformat(row[0].partition('\t')[0]) <= published
+                if moved:
+                    self._conn.execute('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)',
+                                       (name, f"{published.isoformat()}\t{link}"))
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return moved
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_stores: dict[str, SeenStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_seen_store(filename: str, importer: Callable[[str], Iterable[str]] = get_existing_entries) -> SeenStore:
+    """Return the (cached) SeenStore for ``filename`` so repeated runs reuse one connection."""
+    path = os.path.abspath(filename)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = SeenStore(filename, importer)
+        return store
+
+
+def close_seen_store(filename: str):
+    with _stores_lock:
+        store = _stores.pop(os.path.abspath(filename), None)
+    if store is not None:
+        store.close()
+
+
+def remove_seen_store(filename: str):
+    """Close and delete the index for ``filename`` (used when a history file is cleared)."""
+    close_seen_store(filename)
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.remove(index_path(filename) + suffix)
+        except FileNotFoundError:
+            pass
+
+
+__all__ = ['CLAIM_TTL', 'SeenStore', 'add_claim_columns', 'close_seen_store', 'connect', 'index_path',
+           'open_seen_store', 'remove_seen_store']
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, NamedTuple
+
+MAX_ATTEMPTS = int(os.getenv("DISCORD_MAX_ATTEMPTS", "6"))
+BACKOFF_BASE = float(os.getenv("DISCORD_BACKOFF_BASE", "1.0"))
+BACKOFF_MAX = float(os.getenv("DISCORD_BACKOFF_MAX", "60.0"))
+
+
+class DeliveryResult(NamedTuple):
+    ok: bool
+    status_code: int | None
+    attempts: int
+
+
+def _header(response, name: str):
+    headers = getattr(response, 'headers', None) or {}
+    return headers.get(name)
+
+
+def _float(value, default: float | None = None) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def retry_after(response) -> float:
+    """Seconds Discord asked us to wait after a 429 (header first, then JSON body)."""
+    seconds = _float(_header(response, 'Retry-After'))
+    if seconds is None:
+        try:
+            seconds = _float(response.json().get('retry_after'))
+        except Exception:
+            seconds = None
+    return seconds if seconds is not None else 1.0
+
+
+def never_sent(error: Exception) -> bool:
+    """
+    True when ``error`` happened before the request reached Discord (DNS,
+    refused or timed-out connects), so sending again can't post twice.
+    Read timeouts and dropped connections are ambiguous: Discord may have
+    accepted the message already.
+    """
+    from requests.exceptions import ConnectionError, ConnectTimeout
+    from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = error.args[0] if isinstance(error, ConnectionError) and error.args else None
+    return (isinstance(reason, MaxRetryError)
+            and isinstance(reason.reason, (NewConnectionError, ConnectTimeoutError)))
+
+
+class _WebhookWorker:
+    """Sends one webhook's messages in order, honouring its rate-limit bucket."""
+
+    def __init__(self, owner: DeliveryQueue, webhook: str):
+        self.owner = owner
+        self.webhook = webhook
+        self.jobs: queue.Queue = queue.Queue()
+        # Bucket state from the X-RateLimit-* headers of the last response
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+        self.thread = threading.Thread(target=self._run, name=f"discord-{len(owner._workers)}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            payload, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._deliver(payload))
+            except Exception as e:  # never let one message kill the worker
+                future.set_exception(e)
+
+    def _wait_for_bucket(self):
+        if self.remaining == 0:
+            delay = self.reset_at - time.monotonic()
+            if delay > 0:
+                self.owner._sleep(delay)
+        self.owner._wait_global()
+
+    def _update_bucket(self, response):
+        remaining = _float(_header(response, 'X-RateLimit-Remaining'))
+        reset_after = _float(_header(response, 'X-RateLimit-Reset-After'))
+        if remaining is not None:
+            self.remaining = int(remaining)
+        if reset_after is not None:
+            self.reset_at = time.monotonic() + reset_after
+
+    def _deliver(self, payload) -> DeliveryResult:
+        status = None
+        attempt = 0
+        while attempt < self.owner.max_attempts and not self.owner._abort.is_set():
+            attempt += 1
+            self._wait_for_bucket()
+            try:
+                response = self.owner.post(self.webhook, payload)
+            except Exception as e:
+                print(f"Discord request failed ({e}), attempt {attempt}")
+                if not never_sent(e):
+                    break  # it may have been posted; a retry could duplicate it
+                self.owner._sleep(self.owner.backoff(attempt))
+                continue
+
+            status = response.status_code
+            self._update_bucket(response)
+            if 200 <= status < 300:
+                return DeliveryResult(True, status, attempt)
+            if status == 429:
+                wait = retry_after(response)
+                if _header(response, 'X-RateLimit-Global'):
+                    self.owner._block_global(wait)
+                # Small jitter so several workers don't retry in lock-step
+                self.owner._sleep(wait + random.uniform(0, 0.25))
+                continue
+            if status >= 500:
+                self.owner._sleep(self.owner.backoff(attempt))
+                continue
+            break  # other 4xx: retrying won't help
+        return DeliveryResult(False, status, attempt)
+
+
+class DeliveryQueue:
+    """
+    Discord delivery queue with one worker thread per webhook.
+
+    ``submit`` returns a Future resolving to a DeliveryResult.  Each worker
+    follows Discord's per-bucket rate limits (X-RateLimit-Remaining /
+    Reset-After), waits out 429s using Retry-After and retries 5xx and
+    failed connects with jittered exponential backoff.  Other request
+    errors (read timeouts, dropped connections) fail without a retry, since
+    Discord may already have posted the message.  Different webhooks
+    deliver in parallel; messages to the same webhook stay in order.
+    """
+
+    def __init__(self, post: Callable, max_attempts: int = MAX_ATTEMPTS,
+                 backoff_base: float = BACKOFF_BASE, backoff_max: float = BACKOFF_MAX):
+        self.post = post
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._workers: dict[str, _WebhookWorker] = {}
+        self._lock = threading.Lock()
+        self._global_until = 0.0
+        self._closed = False
+        # Set by close(wait=False) to cut any backoff/rate-limit sleeps short
+        self._abort = threading.Event()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given attempt number."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def _sleep(self, seconds: float):
+        if seconds > 0:
+            self._abort.wait(seconds)
+
+    def _block_global(self, seconds: float):
+        with self._lock:
+            self._global_until = max(self._global_until, time.monotonic() + seconds)
+
+    def _wait_global(self):
+        self._sleep(self._global_until - time.monotonic())
+
+    def submit(self, webhook: str, payload: dict) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("delivery queue is closed")
+            worker = self._workers.get(webhook)
+            if worker is None:
+                worker = self._workers[webhook] = _WebhookWorker(self, webhook)
+        worker.jobs.put((payload, future))
+        return future
+
+    def close(self, wait: bool = True):
+        """
+        Stop accepting messages.  With ``wait`` the workers finish everything
+        already queued; without it pending retries give up as soon as possible.
+        """
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers.values())
+            self._workers.clear()
+        if not wait:
+            self._abort.set()
+        for worker in workers:
+            worker.jobs.put(None)
+        if wait:
+            for worker in workers:
+                worker.thread.join()
+
+
+_queue: DeliveryQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_delivery_queue(post: Callable) -> DeliveryQueue:
+    """
+    Return the process-wide queue, creating it on first use.
+
+    ``post(webhook, payload)`` performs the HTTP request; it is only used
+    when the queue is created.
+    """
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = DeliveryQueue(post=post)
+    return _queue
+
+
+def set_delivery_queue(delivery_queue: DeliveryQueue | None):
+    global _queue
+    with _queue_lock:
+        old, _queue = _queue, delivery_queue
+    if old is not None and old is not delivery_queue:
+        old.close(wait=False)
+
+
+__all__ = ['DeliveryQueue', 'DeliveryResult', 'get_delivery_queue', 'never_sent', 'retry_after', 'set_delivery_queue']
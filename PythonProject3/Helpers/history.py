@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from PythonProject3.Helpers.article import Article, as_article
+from PythonProject3.Helpers.coordination import INSTANCE_ID, file_lock
+from PythonProject3.Helpers.dates import article_date
+from PythonProject3.Helpers.dedup import SeenStore, open_seen_store
+from PythonProject3.Helpers.metrics import metrics
+from PythonProject3.Helpers.outbox import Outbox, get_outbox
+from PythonProject3.Helpers.search import SearchIndex, open_search_index
+from PythonProject3.Helpers.seen import GlobalSeen, destination_key, open_global_seen
+from PythonProject3.Helpers.watermark import window_start
+
+
+def link_key(article) -> str:
+    return article.link if isinstance(article, Article) else article['link']
+
+
+def in_window(published, today=None, since=None) -> bool:
+    """
+    Whether an article published on ``published`` may still be sent: not
+    in the future and not before ``since`` (default: the lookback window
+    of watermark.window_start without a mark).
+    """
+    today = today or datetime.now().date()
+    since = since or window_start(None, today)
+    return since <= published <= today
+
+
+def is_new_article(article, store, key=link_key, today=None, since=None) -> bool:
+    """True if the article is inside the send window and not in ``store``."""
+    published = article_date(article)
+    return published is not None and in_window(published, today, since) and key(article) not in store
+
+
+def _source(articles, source):
+    # Watermarks are per source; game parsers and feeds stamp it on every Article
+    if source is not None:
+        return source
+    return next((article.source for article in articles), None)
+
+
+def _destinations(webhook):
+    """``webhook`` is a URL (or None) or a router with ``destinations(article)``."""
+    route = getattr(webhook, 'destinations', None)
+    return route if route is not None else (lambda _article: [webhook])
+
+
+def _deliver(webhook, articles, send, batch_size, Discord) -> tuple[list[bool], int, int]:
+    """Send ``articles`` to one webhook; returns (delivered flags, sent, failed)."""
+    if batch_size > 1 and webhook and articles:
+        return Discord.try_send_batch(webhook, articles, 0, 0, batch_size)
+    delivered = []
+    sent_count = failed_count = 0
+    for article in articles:
+        should_save, sent_count, failed_count = send(webhook, article, sent_count, failed_count)
+        delivered.append(should_save)
+    return delivered, sent_count, failed_count
+
+
+def save_articles(articles, filename, webhook=None, send=None, *, heading=None, entry_heading=None,
+                  key=link_key, store: SeenStore | None = None,
+                  global_seen: GlobalSeen | None = None, batch_size: int | None = None,
+                  source: str | None = None, outbox: Outbox | None = None,
+                  search_index: SearchIndex | None = None):
+    """
+    Shared body of every ``save_to_file``: send today's unseen articles to
+    Discord and append the delivered ones to the history file.  Legacy
+    article dicts are accepted and converted to ``Article``.
+
+    - ``webhook`` is one URL, or a ``Source.routing.Router`` that fans each
+      article out to several webhooks.  Webhooks are served concurrently;
+      an article is written to the history file once every destination it
+      still needed has accepted it.  A failed channel is retried next run;
+      with the global seen-set on, the channels that succeeded are skipped,
+      without it they are posted to again.
+    - ``heading`` is written once before the first delivered entry
+      (HackingNews feed keys), ``entry_heading`` before every entry (game
+      sources).  A run that saves nothing leaves the file untouched.
+    - ``key`` maps an article to its dedup key in the file's SeenStore.
+    - ``global_seen`` is the cross-source set of canonical links per webhook
+      (defaults to the one next to ``filename``); an article already posted
+      to a webhook by any source is not posted there again.
+    - ``send`` is the caller's ``try_send`` so tests can patch it per module.
+    - ``batch_size`` > 1 packs that many articles into each webhook message
+      (defaults to Discord.BATCH_SIZE).
+    - ``source`` names the high-water mark kept in the store (defaults to
+      the articles' ``source``).  The send window reaches back to it after
+      downtime, and it moves to the newest article once a run delivered
+      everything it tried.
+    - ``outbox`` (default: the NEWS_OUTBOX one, if configured) takes the
+      new articles instead of Discord: they are queued in one transaction
+      and recorded at once, and ``Outbox.drain`` delivers them later.
+    - ``search_index`` (default: the one next to ``filename``) is handed
+      every recorded article, so the history stays searchable; they are
+      indexed when it is flushed (after the source's run).
+
+    Returns { 'sent': int, 'failed': int } counted per delivery.
+    """
+    from PythonProject3.Helpers import Discord
+
+    if send is None:
+        send = Discord.try_send
+    if batch_size is None:
+        batch_size = Discord.BATCH_SIZE
+    if outbox is None:
+        outbox = get_outbox()
+
+    current_date = datetime.now().date()
+    seen_entries = store if store is not None else open_seen_store(filename)
+    if global_seen is None:
+        global_seen = open_global_seen(filename)
+    if search_index is None:
+        search_index = open_search_index(filename)
+    destinations_for = _destinations(webhook)
+    articles = [as_article(article) for article in articles]
+    source = _source(articles, source)
+    since = window_start(seen_entries.watermark(source), current_date)
+
+    # Pick the window's unseen articles first so they can be delivered together
+    pending = []
+    pending_keys = set()
+    dedup_hits = 0
+    # destination webhook -> indexes into pending, in article order
+    routes: dict = {}
+    with metrics.timer('dedup'):
+        candidates = []
+        for article in articles:
+            published = article_date(article)
+            if published is None or not in_window(published, current_date, since):
+                continue
+            article_key = key(article)
+            if article_key in pending_keys or (global_seen is not None and article_key in seen_entries):
+                dedup_hits += 1
+                continue
+            candidates.append((article_key, article))
+            pending_keys.add(article_key)
+        if global_seen is None:
+            # Without the global seen-set, claiming the key in the history index is the claim
+            claimed = seen_entries.claim_many([article_key for article_key, _ in candidates], INSTANCE_ID)
+            dedup_hits += claimed.count(False)
+            candidates = [item for item, won in zip(candidates, claimed) if won]
+        for article_key, article in candidates:
+            for destination in destinations_for(article):
+                routes.setdefault(destination, []).append(len(pending))
+            pending.append((article_key, article))
+        # Claimed up front so a source running concurrently can't post them too
+        if global_seen is not None:
+            for destination, indexes in routes.items():
+                claimed = global_seen.claim_many(destination, [pending[i][1].link for i in indexes])
+                metrics.incr('global_dedup_hits', claimed.count(False))
+                routes[destination] = [i for i, won in zip(indexes, claimed) if won]
+    metrics.incr('dedup_hits', dedup_hits)
+    routes = {destination: indexes for destination, indexes in routes.items() if indexes}
+    if outbox is not None:
+        # Durable from here on: the drainer owns delivery and its retries
+        outbox.enqueue({destination: [pending[i][1] for i in indexes]
+                        for destination, indexes in routes.items() if destination})
+
+    def deliver(destination):
+        if outbox is not None and destination:
+            return [True] * len(routes[destination]), 0, 0
+        return _deliver(destination, [pending[i][1] for i in routes[destination]], send, batch_size, Discord)
+
+    # Each webhook has its own delivery worker, so only the waiting needs threads
+    if len(routes) > 1 and outbox is None:
+        with ThreadPoolExecutor(max_workers=len(routes)) as pool:
+            futures = {d: pool.submit(contextvars.copy_context().run, deliver, d) for d in routes}
+            outcomes = {d: future.result() for d, future in futures.items()}
+    else:
+        outcomes = {d: deliver(d) for d in routes}
+
+    sent_count = failed_count = 0
+    needed = [0] * len(pending)
+    accepted = [0] * len(pending)
+    for destination, (delivered, sent, failed) in outcomes.items():
+        sent_count += sent
+        failed_count += failed
+        ok_links, failed_links = [], []
+        for i, ok in zip(routes[destination], delivered):
+            needed[i] += 1
+            accepted[i] += ok
+            (ok_links if ok else failed_links).append(pending[i][1].link)
+        if global_seen is not None:
+            # Delivered (or queued) claims become permanent; failed ones are given back
+            global_seen.confirm_many(destination, ok_links)
+            global_seen.release_many(destination, failed_links)
+        label = destination_key(destination)
+        metrics.incr('deliveries', sent, labels={'destination': label, 'ok': True})
+        metrics.incr('deliveries', failed, labels={'destination': label, 'ok': False})
+
+    written = []
+    unclaimed = []
+    # Locked so other instances' appends (and compaction) never interleave with ours
+    with file_lock(filename), open(filename, 'a', encoding='utf-8') as f:  # Append mode
+        with metrics.timer('write'):
+            for i, (article_key, article) in enumerate(pending):
+                # Write to file only if every channel it still needed took it.  With no
+                # channel left (each already had it from another source or instance)
+                # it is left to the history of whoever delivered it.
+                if not needed[i] or accepted[i] < needed[i]:
+                    unclaimed.append(article_key)
+                    continue
+                title = article.title.replace('\n', ' ')
+                link = article.link
+                date = article.date.replace('\n', ' ')
+                if heading is not None:
+                    f.write(f'\n\n{heading}:\n')
+                    heading = None
+                if entry_heading is not None:
+                    f.write(f"{entry_heading}:\n")
+                f.write(f"Title: {title}\n")
+                f.write(f"Link: {link}\n")
+                f.write(f"Date: {date}\n\n")
+                written.append((article_key, article))
+            f.flush()
+            # Recorded together once the entries are on disk; this confirms our claims
+            seen_entries.add_many(article_key for article_key, _ in written)
+    if global_seen is None and unclaimed:
+        seen_entries.release_many(unclaimed, INSTANCE_ID)  # let the next run claim them again
+
+    if search_index is not None and written:
+        # Indexed in one batch per source run (SearchIndex.flush), not on every save
+        search_index.defer([article for _, article in written], source)
+    if global_seen is not None:
+        global_seen.save()
+    # A failed article must stay inside next run's window, so only advance on a clean run
+    if pending and failed_count == 0:
+        newest = max(pending, key=lambda item: article_date(item[1]))[1]
+        seen_entries.advance_watermark(source, article_date(newest), newest.link)
+    return {"sent": sent_count, "failed": failed_count}
+
+
+def preview_articles(articles, filename, webhook=None, *, key=link_key, store: SeenStore | None = None,
+                     global_seen: GlobalSeen | None = None, source: str | None = None) -> list:
+    """The articles ``save_articles`` would send right now, without sending or recording anything."""
+    seen_entries = store if store is not None else open_seen_store(filename)
+    if global_seen is None:
+        global_seen = open_global_seen(filename)
+    destinations_for = _destinations(webhook)
+    current_date = datetime.now().date()
+    articles = [as_article(article) for article in articles]
+    since = window_start(seen_entries.watermark(_source(articles, source)), current_date)
+    pending = []
+    pending_keys = set()
+    for article in articles:
+        # Same order as save_articles: keys are only built for dated articles inside the window
+        published = article_date(article)
+        if published is None or not in_window(published, current_date, since):
+            continue
+        article_key = key(article)
+        if article_key in pending_keys or article_key in seen_entries:
+            continue
+        if global_seen is not None and all(
+                (destination, article.link) in global_seen for destination in destinations_for(article)):
+            continue
+        pending.append(article)
+        pending_keys.add(article_key)
+    return pending
+
+
+__all__ = ['in_window', 'is_new_article', 'link_key', 'preview_articles', 'save_articles']
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+
+try:  # xxhash is optional and much faster on multi-MB pages
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from PythonProject3.Helpers.http_client import get_session
+from PythonProject3.Helpers.metrics import metrics
+
+# Where ETag / Last-Modified validators are persisted between runs.
+# Set NEWS_HTTP_CACHE to an empty string to disable conditional requests.
+DEFAULT_CACHE_PATH = os.getenv("NEWS_HTTP_CACHE", "http_cache.json")
+
+
+def body_hash(content: bytes) -> str:
+    """Fast fingerprint of a response body."""
+    if xxhash is not None:
+        return 'xxh3:' + xxhash.xxh3_128_hexdigest(content)
+    return 'b2:' + hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ValidatorCache:
+    """
+    Persistent per-URL store of HTTP validators (ETag / Last-Modified).
+
+    Validators are only remembered once the caller has fully processed a
+    response (see ``remember``), so a run whose Discord sends failed will
+    download and retry the same content next time instead of getting a 304.
+
+    A hash of the body is stored alongside, because many pages send no
+    usable ETag / Last-Modified: a byte-identical body is treated like a 304.
+    """
+
+    def __init__(self, path: str | None = DEFAULT_CACHE_PATH):
+        self.path = path or None
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        if self.path:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as file:
+                    self._entries = json.load(file)
+            except (FileNotFoundError, ValueError):
+                self._entries = {}
+
+    def get(self, url: str) -> dict:
+        with self._lock:
+            return dict(self._entries.get(url, {}))
+
+    def headers_for(self, url: str) -> dict[str, str]:
+        entry = self.get(url)
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def remember(self, url: str, response, **extra):
+        """Store the validators from ``response`` (plus any ``extra`` fields) and persist."""
+        content = getattr(response, 'content', None)
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': body_hash(content) if content is not None else None,
+            **extra,
+        }
+        entry = {k: v for k, v in entry.items() if v}
+        with self._lock:
+            if entry:
+                self._entries[url] = entry
+            else:
+                self._entries.pop(url, None)
+        self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._entries, indent=2, sort_keys=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as file:
+                file.write(data)
+            os.replace(tmp, self.path)
+
+
+_cache: ValidatorCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ValidatorCache:
+    """Return the process-wide validator cache, loading it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ValidatorCache()
+    return _cache
+
+
+def set_cache(cache: ValidatorCache | None):
+    """Replace the shared cache (``None`` reloads the default on next use)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def conditional_get(url: str, cache: ValidatorCache | None = None, **kwargs):
+    """
+    GET ``url`` with If-None-Match / If-Modified-Since from the cache.
+
+    Returns the response, or ``None`` when the server answered 304 Not Modified
+    or sent a body identical to the last fully processed one.  Raises for any
+    other HTTP error status.
+    """
+    cache = cache or get_cache()
+    headers = {**cache.headers_for(url), **(kwargs.pop('headers', None) or {})}
+    with metrics.timer('fetch'):
+        response = get_session().get(url, headers=headers, **kwargs)
+    metrics.incr('http_responses', labels={'status': response.status_code})
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    metrics.incr('bytes_downloaded', len(response.content))
+
+    known = cache.get(url).get('content_hash')
+    if known and known == body_hash(response.content):
+        metrics.incr('unchanged_bodies')
+        return None
+    return response
+
+
+__all__ = ['ValidatorCache', 'body_hash', 'conditional_get', 'get_cache', 'set_cache']
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # urllib3 only decodes brotli responses when a brotli package is installed
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+# All knobs can be overridden from the environment (or the .env file).
+POOL_SIZE = int(os.getenv("NEWS_HTTP_POOL_SIZE", "20"))
+RETRIES = int(os.getenv("NEWS_HTTP_RETRIES", "2"))
+TIMEOUT = float(os.getenv("NEWS_HTTP_TIMEOUT", "15"))
+# Steam (Deadlock) rejects the default python-requests agent, so send a browser-like one everywhere.
+USER_AGENT = os.getenv("NEWS_HTTP_USER_AGENT", "Mozilla/5.0 (compatible; NewsFeedBot/1.0)")
+
+
+class Session(requests.Session):
+    """requests.Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout: float = TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(pool_size: int = POOL_SIZE, retries: int = RETRIES, timeout: float = TIMEOUT,
+                   user_agent: str = USER_AGENT) -> Session:
+    """
+    Build a keep-alive session with a connection pool sized for concurrent runs.
+
+    Idempotent requests (GET/HEAD) are retried on connection errors and 5xx
+    responses.  POSTs are never retried here so a Discord message can't be
+    posted twice; Discord.py decides how to handle those.
+    """
+    session = Session(timeout=timeout)
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': user_agent,
+        'Accept-Encoding': _ACCEPT_ENCODING,
+    })
+    return session
+
+
+_session: Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> Session:
+    """Return the process-wide shared session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def set_session(session: Session | None):
+    """Replace the shared session (``None`` resets it to the default on next use)."""
+    global _session
+    with _session_lock:
+        _session = session
+
+
+__all__ = ['Session', 'create_session', 'get_session', 'set_session']
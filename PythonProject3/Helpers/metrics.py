@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Where to export metrics at the end of main(); unset means don't write.
+METRICS_JSON = os.getenv("NEWS_METRICS_JSON")
+METRICS_PROM = os.getenv("NEWS_METRICS_PROM")
+
+_current_source: contextvars.ContextVar[str] = contextvars.ContextVar('news_source', default='unknown')
+
+
+def _label_key(labels: dict | None) -> tuple:
+    return tuple(sorted((str(k), str(v)) for k, v in (labels or {}).items()))
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    """
+    Thread-safe per-source counters and stage timings for one process.
+
+    Stages (fetch, parse, dedup, discord, write, run) are timed with
+    ``timer`` and counters bumped with ``incr``; both default to the source
+    set by ``source()`` in the current thread.  ``snapshot`` gives a plain
+    dict, ``write_json`` / ``write_prometheus`` export it at the end of a run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._counters: dict[tuple, float] = {}
+            self._timings: dict[tuple, list[float]] = {}  # key -> [count, sum, max]
+
+    @contextmanager
+    def source(self, name: str):
+        """Attribute everything recorded inside the block to source ``name``."""
+        token = _current_source.set(name)
+        try:
+            yield
+        finally:
+            _current_source.reset(token)
+
+    def incr(self, name: str, value: float = 1, source: str | None = None, labels: dict | None = None):
+        key = (source or _current_source.get(), name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, stage: str, seconds: float, source: str | None = None):
+        key = (source or _current_source.get(), stage)
+        with self._lock:
+            stats = self._timings.setdefault(key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    @contextmanager
+    def timer(self, stage: str, source: str | None = None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, source)
+
+    def snapshot(self) -> dict:
+        """{ source: { 'stages': {stage: {count, seconds, max_seconds}}, 'counters': {name: value} } }"""
+        with self._lock:
+            sources: dict[str, dict] = {}
+            for (source, stage), (count, total, longest) in sorted(self._timings.items()):
+                entry = sources.setdefault(source, {'stages': {}, 'counters': {}})
+                entry['stages'][stage] = {'count': count, 'seconds': round(total, 6),
+                                          'max_seconds': round(longest, 6)}
+            for (source, name, labels), value in sorted(self._counters.items()):
+                entry = sources.setdefault(source, {'stages': {}, 'counters': {}})
+                label = ','.join(f"{k}={v}" for k, v in labels)
+                entry['counters'][f"{name}{{{label}}}" if label else name] = value
+            return {'started_at': self.started_at, 'finished_at': time.time(), 'sources': sources}
+
+    def to_prometheus(self) -> str:
+        """Render in the Prometheus text format (for the node-exporter textfile collector)."""
+        with self._lock:
+            timings = sorted(self._timings.items())
+            counters = sorted(self._counters.items())
+        lines = [
+            '# HELP news_stage_seconds Time spent per source and stage.',
+            '# TYPE news_stage_seconds summary',
+        ]
+        for (source, stage), (count, total, _) in timings:
+            labels = f'source="{_escape(source)}",stage="{_escape(stage)}"'
+            lines.append(f'news_stage_seconds_sum{{{labels}}} {total:.6f}')
+            lines.append(f'news_stage_seconds_count{{{labels}}} {count}')
+        lines += ['# HELP news_stage_max_seconds Slowest single observation per source and stage.',
+                  '# TYPE news_stage_max_seconds gauge']
+        for (source, stage), (_, _, longest) in timings:
+            lines.append(f'news_stage_max_seconds{{source="{_escape(source)}",stage="{_escape(stage)}"}} {longest:.6f}')
+        names = sorted({name for (_, name, _), _ in counters})
+        for name in names:
+            lines.append(f'# TYPE news_{name}_total counter')
+            for (source, counter, labels), value in counters:
+                if counter != name:
+                    continue
+                label = ''.join(f',{k}="{_escape(v)}"' for k, v in labels)
+                lines.append(f'news_{name}_total{{source="{_escape(source)}"{label}}} {value:g}')
+        lines += ['# TYPE news_last_run_timestamp_seconds gauge',
+                  f'news_last_run_timestamp_seconds {time.time():.0f}']
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _write_atomic(path: str, data: str):
+        # The textfile collector may read at any moment, so never expose a half-written file
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def write_json(self, path: str):
+        self._write_atomic(path, json.dumps(self.snapshot(), indent=2))
+
+    def write_prometheus(self, path: str):
+        self._write_atomic(path, self.to_prometheus())
+
+
+metrics = Metrics()
+
+
+__all__ = ['METRICS_JSON', 'METRICS_PROM', 'Metrics', 'metrics']
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import argparse
+import contextvars
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable
+
+from PythonProject3.Helpers.article import Article
+from PythonProject3.Helpers.dedup import connect
+from PythonProject3.Helpers.metrics import metrics
+from PythonProject3.Helpers.seen import destination_key
+
+# SQLite outbox of articles waiting for Discord.  Unset (the default) keeps
+# sending inline; set e.g. NEWS_OUTBOX=outbox.sqlite3 to commit new
+# articles here first and deliver them from ``drain``.
+OUTBOX_PATH = os.getenv("NEWS_OUTBOX", "")
+# Drain attempts before a message is parked as dead (see the ``requeue`` command).
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("NEWS_OUTBOX_MAX_ATTEMPTS", "20"))
+# Backoff between drain attempts: base * 2**n seconds with full jitter, capped.
+OUTBOX_BACKOFF_BASE = float(os.getenv("NEWS_OUTBOX_BACKOFF_BASE", "30"))
+OUTBOX_BACKOFF_MAX = float(os.getenv("NEWS_OUTBOX_BACKOFF_MAX", "3600"))
+# Seconds a drainer holds the rows it is sending before another may retry them.
+OUTBOX_LEASE = float(os.getenv("NEWS_OUTBOX_LEASE", "300"))
+
+PENDING, DEAD = 'pending', 'dead'
+
+
+class Outbox:
+    """
+    Durable journal of (webhook, article) deliveries.
+
+    ``save_articles`` enqueues new articles and records them straight away,
+    so a run never waits for Discord.  ``drain`` sends what is due, deletes
+    it once Discord accepted it and otherwise reschedules it with jittered
+    exponential backoff, across runs and restarts, until it is parked as
+    dead after ``max_attempts``.  Webhooks are stored as
+    ``seen.destination_key`` hashes and resolved against the configured
+    webhooks when sending, so no token lands on disk.  Due rows are leased
+    inside a write transaction, so concurrent drainers never send one
+    message twice.
+    """
+
+    def __init__(self, path: str, max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+                 backoff_base: float = OUTBOX_BACKOFF_BASE, backoff_max: float = OUTBOX_BACKOFF_MAX,
+                 lease: float = OUTBOX_LEASE):
+        self.path = path
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease = lease
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS outbox ('
+            ' id INTEGER PRIMARY KEY, dest TEXT NOT NULL, link TEXT NOT NULL, title TEXT NOT NULL,'
+            ' date TEXT NOT NULL, source TEXT, created_at REAL NOT NULL,'
+            " attempts INTEGER NOT NULL DEFAULT 0, next_at REAL NOT NULL, status TEXT NOT NULL DEFAULT 'pending',"
+            ' last_error TEXT, UNIQUE (dest, link));'
+            'CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_at);'
+        )
+
+    def _transaction(self, work):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = work(self._conn)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def backoff(self, attempts: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1)))
+
+    def enqueue(self, routes: dict, now: float | None = None) -> int:
+        """
+        Queue ``routes`` ({webhook: [articles]}) in one transaction.
+        Already queued (webhook, link) pairs are ignored.  Returns rows added.
+        """
+        now = time.time() if now is None else now
+        rows = [
+            (destination_key(webhook), article.link, article.title, article.date, article.source, now, now)
+            for webhook, articles in routes.items() if webhook
+            for article in articles
+        ]
+
+        def insert(conn):
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO outbox (dest, link, title, date, source, created_at, next_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            return conn.total_changes - before
+
+        added = self._transaction(insert) if rows else 0
+        metrics.incr('outbox_queued', added)
+        return added
+
+    def _lease_due(self, now: float, limit: int | None) -> list[tuple]:
+        # ``now`` is only the "due before" cutoff (``drain --all`` passes inf); the
+        # lease runs on the wall clock, so an interrupted drain's rows come due again
+        until = time.time() + self.lease
+
+        def lease(conn):
+            rows = conn.execute(
+                'SELECT id, dest, link, title, date, source, attempts FROM outbox'
+                ' WHERE status = ? AND next_at <= ? ORDER BY next_at, id LIMIT ?',
+                (PENDING, now, -1 if limit is None else limit),
+            ).fetchall()
+            conn.executemany('UPDATE outbox SET next_at = ? WHERE id = ?', ((until, row[0]) for row in rows))
+            return rows
+        return self._transaction(lease)
+
+    def _settle(self, done: list[int], failed: list[tuple[tuple, str]], now: float) -> int:
+        """Delete delivered rows and reschedule (or park) failed ones; returns rows parked dead."""
+        def settle(conn):
+            dead = 0
+            conn.executemany('DELETE FROM outbox WHERE id = ?', ((row_id,) for row_id in done))
+            for row, error in failed:
+                attempts = row[6] + 1
+                status = DEAD if attempts >= self.max_attempts else PENDING
+                dead += status == DEAD
+                conn.execute('UPDATE outbox SET attempts = ?, next_at = ?, status = ?, last_error = ? WHERE id = ?',
+                             (attempts, now + self.backoff(attempts), status, error, row[0]))
+            return dead
+        return self._transaction(settle)
+
+    def drain(self, send: Callable | None = None, webhooks: dict | None = None, now: float | None = None,
+              limit: int | None = None) -> dict:
+        """
+        Deliver every due message.  ``send(webhook, articles)`` returns one
+        delivered flag per article (default: Discord, batched per
+        Discord.BATCH_SIZE); ``webhooks`` defaults to Source.webhook.
+        Returns {'sent', 'failed', 'dead'} for this pass.
+        """
+        if send is None:
+            send = _send
+        if webhooks is None:
+            from PythonProject3.Source.webhook import webhook as webhooks
+        urls = {destination_key(url): url for url in webhooks.values() if url and url != 'None'}
+        now = time.time() if now is None else now
+
+        by_dest: dict[str, list[tuple]] = {}
+        for row in self._lease_due(now, limit):
+            by_dest.setdefault(row[1], []).append(row)
+
+        def deliver(dest):
+            rows = by_dest[dest]
+            url = urls.get(dest)
+            if url is None:
+                # Webhook removed or rotated: keep the messages until it's back (or requeued)
+                return [False] * len(rows), 'unknown webhook'
+            try:
+                return send(url, [Article(row[3], row[2], row[4], None, row[5]) for row in rows]), \
+                    'rejected by Discord'
+            except Exception as e:
+                return [False] * len(rows), str(e)
+
+        # Webhooks are independent, so one slow channel doesn't hold up the rest
+        if len(by_dest) > 1:
+            with ThreadPoolExecutor(max_workers=len(by_dest)) as pool:
+                futures = {d: pool.submit(contextvars.copy_context().run, deliver, d) for d in by_dest}
+                outcomes = {d: future.result() for d, future in futures.items()}
+        else:
+            outcomes = {d: deliver(d) for d in by_dest}
+
+        done, failed = [], []
+        for dest, (delivered, error) in outcomes.items():
+            for row, ok in zip(by_dest[dest], delivered):
+                if ok:
+                    done.append(row[0])
+                else:
+                    failed.append((row, error))
+
+        dead = self._settle(done, failed, time.time())
+        metrics.incr('outbox_sent', len(done))
+        metrics.incr('outbox_failed', len(failed))
+        metrics.incr('outbox_dead', dead)
+        return {'sent': len(done), 'failed': len(failed), 'dead': dead}
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM outbox GROUP BY status').fetchall()
+        return {PENDING: 0, DEAD: 0, **dict(rows)}
+
+    def entries(self, status: str | None = None, limit: int = 50) -> list[dict]:
+        query = 'SELECT id, dest, link, title, source, attempts, next_at, status, last_error FROM outbox'
+        args: tuple = ()
+        if status is not None:
+            query += ' WHERE status = ?'
+            args = (status,)
+        with self._lock:
+            rows = self._conn.execute(query + ' ORDER BY next_at, id LIMIT ?', (*args, limit)).fetchall()
+        names = ('id', 'dest', 'link', 'title', 'source', 'attempts', 'next_at', 'status', 'last_error')
+        return [dict(zip(names, row)) for row in rows]
+
+    def requeue(self, ids=None, now: float | None = None) -> int:
+        """Make dead (or the given) messages due again with a fresh attempt count."""
+        now = time.time() if now is None else now
+
+        def update(conn):
+            if ids is None:
+                return conn.execute('UPDATE outbox SET status = ?, attempts = 0, next_at = ? WHERE status = ?',
+                                    (PENDING, now, DEAD)).rowcount
+            return sum(conn.execute('UPDATE outbox SET status = ?, attempts = 0, next_at = ? WHERE id = ?',
+                                    (PENDING, now, row_id)).rowcount for row_id in ids)
+        return self._transaction(update)
+
+    def purge(self, status: str = DEAD) -> int:
+        return self._transaction(lambda conn: conn.execute('DELETE FROM outbox WHERE status = ?',
+                                                           (status,)).rowcount)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM outbox').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _send(webhook: str, articles: list) -> list[bool]:
+    from PythonProject3.Helpers import Discord
+
+    if Discord.BATCH_SIZE > 1:
+        return Discord.send_batch_to_discord(webhook, articles, Discord.BATCH_SIZE)
+    return [Discord.send_to_discord(webhook, article) for article in articles]
+
+
+_outbox: Outbox | None = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> Outbox | None:
+    """The process-wide outbox at NEWS_OUTBOX, or None when sending inline."""
+    global _outbox
+    if _outbox is None and OUTBOX_PATH:
+        with _outbox_lock:
+            if _outbox is None:
+                _outbox = Outbox(OUTBOX_PATH)
+    return _outbox
+
+
+def set_outbox(outbox: Outbox | None):
+    global _outbox
+    with _outbox_lock:
+        old, _outbox = _outbox, outbox
+    if old is not None and old is not outbox:
+        old.close()
+
+
+def drain_outbox() -> dict | None:
+    """Drain the configured outbox once; None when there is none."""
+    outbox = get_outbox()
+    if outbox is None:
+        return None
+    return outbox.drain()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect and drain the Discord delivery outbox.")
+    parser.add_argument('--path', default=OUTBOX_PATH or 'outbox.sqlite3', help="outbox database (NEWS_OUTBOX)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    show = commands.add_parser('list', help="show queued messages")
+    show.add_argument('--status', choices=(PENDING, DEAD))
+    show.add_argument('--limit', type=int, default=50)
+    commands.add_parser('stats', help="count messages by status")
+    drain = commands.add_parser('drain', help="send everything that is due")
+    drain.add_argument('--all', action='store_true', help="ignore backoff and send every pending message now")
+    requeue = commands.add_parser('requeue', help="retry dead (or the given) messages")
+    requeue.add_argument('ids', nargs='*', type=int)
+    commands.add_parser('purge', help="delete dead messages")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        print(f"{args.path}: no outbox")
+        return 1
+    outbox = Outbox(args.path)
+    try:
+        if args.command == 'list':
+            for entry in outbox.entries(args.status, args.limit):
+                due = datetime.fromtimestamp(entry['next_at']).strftime('%Y-%m-%d %H:%M:%S')
+                error = f" ({entry['last_error']})" if entry['last_error'] else ''
+                print(f"#{entry['id']} {entry['status']} try {entry['attempts']} due {due} "
+                      f"[{entry['source']}] {entry['title']} {entry['link']}{error}")
+        elif args.command == 'stats':
+            for status, count in outbox.stats().items():
+                print(f"{status}: {count}")
+        elif args.command == 'drain':
+            result = outbox.drain(now=float('inf') if args.all else None)
+            print(f"Sent {result['sent']}, Failed: {result['failed']}, Dead: {result['dead']}")
+        elif args.command == 'requeue':
+            print(f"Requeued {outbox.requeue(args.ids or None)}")
+        elif args.command == 'purge':
+            print(f"Purged {outbox.purge()}")
+    finally:
+        outbox.close()
+    return 0
+
+
+__all__ = ['DEAD', 'OUTBOX_PATH', 'Outbox', 'PENDING', 'drain_outbox', 'get_outbox', 'set_outbox']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import contextvars
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PythonProject3.Helpers.dedup import open_seen_store
+from PythonProject3.Helpers.history import is_new_article, link_key
+from PythonProject3.Helpers.http_client import get_session
+from PythonProject3.Helpers.metrics import metrics
+from PythonProject3.Helpers.parse_pool import parse_news
+from PythonProject3.Helpers.watermark import window_start
+
+# Highest page fetched for paginated sources (Apex, Deadlock).  Page 2+ is
+# only requested when every article on the previous pages is new.
+MAX_PAGES = int(os.getenv("NEWS_MAX_PAGES", "5"))
+# Extra pages fetched at the same time once we know page 1 wasn't enough.
+PAGE_CONCURRENCY = int(os.getenv("NEWS_PAGE_CONCURRENCY", "3"))
+
+
+def _fetch_page(parser, page: int) -> list:
+    page_parser = copy.copy(parser)
+    with metrics.timer('fetch'):
+        response = get_session().get(parser.page_url(page))
+    response.raise_for_status()
+    metrics.incr('bytes_downloaded', len(response.content))
+    with metrics.timer('parse'):
+        return parse_news(page_parser, response.text)
+
+
+def _merge(pages) -> list:
+    merged = []
+    links = set()
+    for articles in pages:
+        for article in articles:
+            link = link_key(article)
+            if link not in links:
+                links.add(link)
+                merged.append(article)
+    return merged
+
+
+def fetch_more_pages(parser, max_pages: int | None = None, store=None) -> list:
+    """
+    Extend ``parser.news`` (already parsed from page 1) with later pages.
+
+    Nothing extra is fetched unless every article on page 1 is new (inside
+    the send window, which reaches back to the source's high-water mark
+    after downtime, and not in the history index), which is the normal case
+    that keeps this to zero extra requests.  Otherwise pages 2..N are
+    fetched concurrently and merged in order up to and including the first
+    page that holds an already-seen or out-of-window article; later pages
+    are cancelled or discarded.  Returns the merged article list, which is
+    also stored on ``parser.news``.
+    """
+    max_pages = MAX_PAGES if max_pages is None else max_pages
+    first = list(parser.news)
+    if max_pages <= 1 or not first or not hasattr(parser, 'page_url'):
+        return first
+
+    store = store if store is not None else open_seen_store(parser.history_file)
+
+    since = window_start(store.watermark(getattr(parser, 'source', None)))
+
+    def all_new(articles) -> bool:
+        return bool(articles) and all(is_new_article(article, store, since=since) for article in articles)
+
+    if not all_new(first):
+        return first
+
+    pages = [first]
+    workers = max(1, min(PAGE_CONCURRENCY, max_pages - 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Each page runs in the caller's context so its metrics land under the running source
+        futures = [pool.submit(contextvars.copy_context().run, _fetch_page, parser, page)
+                   for page in range(2, max_pages + 1)]
+        for page, future in enumerate(futures, start=2):
+            try:
+                articles = future.result()
+            except Exception as e:
+                print(f"Failed to fetch page {page}: {e}")
+                break
+            pages.append(articles)
+            metrics.incr('pages_fetched')
+            if not all_new(articles):
+                break
+        for future in futures:
+            future.cancel()
+
+    parser.news = _merge(pages)
+    return parser.news
+
+
+__all__ = ['MAX_PAGES', 'fetch_more_pages']
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# Worker processes used for HTML parsing.  0 (the default) parses in-process;
+# set NEWS_PARSE_WORKERS=N to spread BeautifulSoup work over N cores.
+PARSE_WORKERS = int(os.getenv("NEWS_PARSE_WORKERS", "0"))
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _parse_worker(parser, html):
+    # Runs in the child: the parser arrives pickled with its configuration
+    # (base_url, ...) and only the plain article records travel back.
+    return parser.get_news(html)
+
+
+def get_parse_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    """Return the shared process pool, (re)creating it for ``workers`` processes."""
+    global _pool, _pool_workers
+    workers = max(1, workers or PARSE_WORKERS or 1)
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=True)
+            # spawn, not fork: the parent has live threads (thread pool, Discord workers)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_parse_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def parse_news(parser, html, workers: int | None = None):
+    """
+    Drop-in for ``parser.get_news(html)`` that can run in a worker process.
+
+    With ``workers`` (or NEWS_PARSE_WORKERS) > 0 the parser and raw HTML are
+    shipped to the process pool and the returned articles are stored on
+    ``parser.news`` exactly as get_news would.  Otherwise it just calls
+    get_news in the current process.
+    """
+    workers = PARSE_WORKERS if workers is None else workers
+    if workers <= 0:
+        return parser.get_news(html)
+
+    parser.news = []  # don't ship stale results to the child
+    articles = get_parse_pool(workers).submit(_parse_worker, parser, html).result()
+    parser.news = articles
+    return articles
+
+
+__all__ = ['PARSE_WORKERS', 'get_parse_pool', 'parse_news', 'shutdown_parse_pool']
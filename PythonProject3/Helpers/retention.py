@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import gzip
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
+
+from PythonProject3.Helpers.coordination import file_lock
+from PythonProject3.Helpers.dates import parse_date
+from PythonProject3.Helpers.dedup import index_path, open_seen_store
+from PythonProject3.Helpers.seen import global_seen_path, open_global_seen
+
+# Automatic policy applied at the end of main(); unset means keep everything.
+RETENTION_DAYS = int(os.getenv("NEWS_RETENTION_DAYS", "0")) or None
+RETENTION_ENTRIES = int(os.getenv("NEWS_RETENTION_ENTRIES", "0")) or None
+
+_FIELDS = ('Title: ', 'Link: ', 'Date: ')
+
+
+class Record(NamedTuple):
+    heading: str | None
+    title: str
+    link: str
+    date: str
+
+
+def read_sections(filename: str) -> list[tuple[str | None, list[Record]]]:
+    """Parse a history file into (heading, entries) sections, in file order."""
+    sections: list[tuple[str | None, list[Record]]] = [(None, [])]
+    fields: dict[str, str] = {}
+
+    def flush():
+        if fields:
+            heading, entries = sections[-1]
+            entries.append(Record(heading, fields.get('Title: ', ''), fields.get('Link: ', ''),
+                                  fields.get('Date: ', '')))
+        fields.clear()
+
+    try:
+        opener = gzip.open if filename.endswith('.gz') else open  # retention archives too
+        with opener(filename, 'rt', encoding='utf-8') as f:
+            for raw in f:
+                line = raw.rstrip('\r\n')
+                if not line.strip():
+                    flush()
+                    continue
+                prefix = next((p for p in _FIELDS if line.startswith(p)), None)
+                if prefix is None:
+                    if line.endswith(':'):
+                        flush()
+                        sections.append((line[:-1], []))
+                    continue
+                if prefix in fields:
+                    flush()
+                fields[prefix] = line[len(prefix):]
+            flush()
+    except FileNotFoundError:
+        pass
+    return sections
+
+
+def read_records(filename: str) -> tuple[list[Record], bool]:
+    """
+    Return the file's entries and whether it uses grouped sections.
+
+    Game files put a heading above every entry; news.txt opens a section
+    per feed and lists entries under it (possibly none).
+    """
+    sections = read_sections(filename)
+    grouped = any(len(entries) != 1 for heading, entries in sections if heading is not None)
+    return [record for _, entries in sections for record in entries], grouped
+
+
+def write_records(fileobj, records, grouped: bool):
+    """Write records in the history format, without empty section headers."""
+    current = object()
+    for record in records:
+        if not grouped:
+            if record.heading is not None:
+                fileobj.write(f"{record.heading}:\n")
+        elif record.heading != current:
+            if record.heading is not None:
+                fileobj.write(f"\n\n{record.heading}:\n")
+            current = record.heading
+        fileobj.write(f"Title: {record.title}\nLink: {record.link}\nDate: {record.date}\n\n")
+
+
+def archive_path(filename: str, today: date | None = None) -> str:
+    today = today or datetime.now().date()
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{today:%Y%m%d}{ext or '.txt'}.gz"
+
+
+def compact(filename: str, keep_days: int | None = None, keep_entries: int | None = None,
+            archive: bool = True, today: date | None = None) -> dict:
+    """
+    Trim ``filename`` to the retention window and rotate the rest away.
+
+    Keeps entries dated within the last ``keep_days`` days and/or only the
+    newest ``keep_entries`` entries; entries without a parseable date are
+    kept.  Dropped entries are appended to a gzip archive next to the file
+    (unless ``archive`` is False) and the file is rewritten atomically
+    without empty section headers.  The dedup index (and, for ``keep_days``,
+    the cross-source seen-set) is pruned the same way,
+    so both stay constant-size while everything inside the window still
+    dedups.  Returns { 'kept': int, 'archived': int, 'archive': path | None }.
+    """
+    today = today or datetime.now().date()
+    # Appenders (this or another instance) wait until the rewrite is in place
+    with file_lock(filename):
+        records, grouped = read_records(filename)
+        keep = list(records)
+
+        if keep_days is not None:
+            cutoff = today - timedelta(days=keep_days)
+            keep = [r for r in keep if (parse_date(r.date) or today) >= cutoff]
+        if keep_entries is not None and len(keep) > keep_entries:
+            keep = keep[len(keep) - keep_entries:]
+
+        kept_ids = {id(r) for r in keep}
+        dropped = [r for r in records if id(r) not in kept_ids]
+
+        target = None
+        if dropped and archive:
+            target = archive_path(filename, today)
+            with gzip.open(target, 'at', encoding='utf-8') as gz:
+                write_records(gz, dropped, grouped)
+
+        if os.path.exists(filename):
+            tmp = f"{filename}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                write_records(f, keep, grouped)
+            os.replace(tmp, filename)
+
+    if os.path.exists(index_path(filename)):
+        older_than = None
+        if keep_days is not None:
+            # Index rows carry insert time; keep a day of slack over the window
+            older_than = time.time() - (keep_days + 1) * 86400
+        open_seen_store(filename).prune(older_than=older_than, keep_latest=keep_entries)
+    if keep_days is not None and os.path.exists(global_seen_path(filename) or ''):
+        open_global_seen(filename).prune(time.time() - (keep_days + 1) * 86400)
+
+    return {'kept': len(keep), 'archived': len(dropped), 'archive': target}
+
+
+def compact_all(filenames, keep_days=None, keep_entries=None, archive=True) -> dict:
+    """Apply the retention policy (defaults from NEWS_RETENTION_*) to several files."""
+    keep_days = RETENTION_DAYS if keep_days is None else keep_days
+    keep_entries = RETENTION_ENTRIES if keep_entries is None else keep_entries
+    if keep_days is None and keep_entries is None:
+        return {}
+    return {
+        name: compact(name, keep_days, keep_entries, archive)
+        for name in filenames
+        if os.path.exists(name)
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compact news history files to a retention window.")
+    parser.add_argument('files', nargs='*', help="history files (default: *news.txt in the current directory)")
+    parser.add_argument('--days', type=int, default=RETENTION_DAYS, help="keep entries from the last N days")
+    parser.add_argument('--entries', type=int, default=RETENTION_ENTRIES, help="keep only the newest N entries")
+    parser.add_argument('--no-archive', action='store_true', help="drop old entries instead of archiving them")
+    args = parser.parse_args(argv)
+
+    if args.days is None and args.entries is None:
+        parser.error("give --days and/or --entries (or set NEWS_RETENTION_DAYS / NEWS_RETENTION_ENTRIES)")
+
+    files = args.files or sorted(glob.glob('*news.txt'))
+    for name, result in compact_all(files, args.days, args.entries, not args.no_archive).items():
+        where = f" -> {result['archive']}" if result['archive'] else ''
+        print(f"{name}: kept {result['kept']}, archived {result['archived']}{where}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import io
+import os
+from xml.etree.ElementTree import ParseError, iterparse
+
+# Set NEWS_FAST_RSS=0 to always hand feeds to feedparser.
+FAST_RSS = os.getenv("NEWS_FAST_RSS", "1") != "0"
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_ROOTS = {'rss', 'feed', 'RDF'}
+_ENTRIES = {'item', 'entry'}
+# First match wins: RSS 2.0 pubDate, Atom published/updated, RSS 1.0 dc:date
+_DATE_FIELDS = ('pubDate', 'published', 'updated', 'date')
+
+
+class FeedFormatError(ValueError):
+    """The document isn't a plain RSS/Atom feed the fast path understands."""
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(element) -> str:
+    return ''.join(element.itertext()).strip()
+
+
+def _link(element) -> str | None:
+    # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/> (rel defaults to alternate)
+    href = element.get('href')
+    if href is None:
+        return _text(element) or None
+    if element.get('rel', 'alternate') == 'alternate':
+        return href.strip()
+    return None
+
+
+def _entry(element) -> dict:
+    fields: dict[str, str] = {}
+    for child in element:
+        name = _local(child.tag)
+        if name == 'title' and 'title' not in fields:
+            fields['title'] = _text(child)
+        elif name == 'link' and 'link' not in fields:
+            link = _link(child)
+            if link:
+                fields['link'] = link
+        elif name in _DATE_FIELDS and name not in fields:
+            fields[name] = _text(child)
+    date = next((fields[name] for name in _DATE_FIELDS if fields.get(name)), None)
+    if not fields.get('title') or not fields.get('link') or date is None:
+        raise FeedFormatError(f"entry without title, link or date: {fields}")
+    return {'title': fields['title'], 'link': fields['link'], 'date': date}
+
+
+def iter_entries(content: bytes | str):
+    """
+    Stream ``title``, ``link`` and the publish date out of an RSS 2.0,
+    RSS 1.0 or Atom document, yielding one dict per entry.
+
+    Each ``<item>`` / ``<entry>`` is read as soon as it closes and then
+    detached from the tree, so memory stays flat however long the feed is,
+    and a caller that stops iterating never parses the rest.  Nothing is
+    sanitised or normalised beyond stripping whitespace.  Raises
+    ``FeedFormatError`` (or ``ParseError``) for anything unexpected so the
+    caller can fall back to feedparser.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    stack = []
+    for event, element in iterparse(io.BytesIO(content), events=('start', 'end')):
+        if event == 'start':
+            if not stack and _local(element.tag) not in _ROOTS:
+                raise FeedFormatError(f"not a feed: <{_local(element.tag)}>")
+            stack.append(element)
+            continue
+        stack.pop()
+        name = _local(element.tag)
+        if name in _ENTRIES and (name == 'item' or element.tag == f'{ATOM_NS}entry'):
+            entry = _entry(element)
+            if stack:
+                # Detach the finished entry so the tree never holds more than one
+                stack[-1].remove(element)
+            yield entry
+
+
+def extract_entries(content: bytes | str) -> list[dict]:
+    """Every entry of the feed; see ``iter_entries``."""
+    return list(iter_entries(content))
+
+
+__all__ = ['FAST_RSS', 'FeedFormatError', 'ParseError', 'extract_entries', 'iter_entries']
@@ -0,0 +1,485 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import re
+import sys
+import threading
+import time
+from datetime import date
+from typing import NamedTuple
+
+from PythonProject3.Helpers.dates import article_date, parse_date
+from PythonProject3.Helpers.dedup import connect
+
+# File name of the search index, created next to the history files like the
+# global seen-set.  Set NEWS_SEARCH_INDEX to an empty string to disable it.
+SEARCH_INDEX_NAME = os.getenv("NEWS_SEARCH_INDEX", "search_index.sqlite3")
+
+_WORD = re.compile(r'\w+')
+# Below this many candidates an AND probes the index per doc instead of loading a whole postings list
+_PROBE_LIMIT = 2000
+_CHUNK = 500
+# Query tokens: parentheses, "phrases", or runs of anything else
+_QUERY_TOKEN = re.compile(r'\(|\)|"[^"]*"|[^\s()"]+')
+
+
+def tokens(text: str) -> set[str]:
+    """Lower-cased words of ``text``, as indexed and as matched."""
+    return set(_WORD.findall(text.lower()))
+
+
+def source_terms(source: str | None) -> set[str]:
+    # The whole name and its parts: "TheHackerNews_home" -> thehackernews_home, thehackernews, home
+    if not source:
+        return set()
+    words = tokens(source) | {part for word in tokens(source) for part in word.split('_') if part}
+    return {f"source:{word}" for word in words}
+
+
+class Hit(NamedTuple):
+    title: str
+    link: str
+    date: str
+    source: str | None
+    published: date | None
+
+
+class QueryError(ValueError):
+    """The search query can't be parsed."""
+
+
+def _parse(query: str):
+    """
+    Parse a query into a tree of ('and'|'or', [...]), ('not', x),
+    ('term', t), ('prefix', p) and ('date', since, until) nodes.
+
+    Words are ANDed; ``OR`` / ``NOT`` / ``-word``, parentheses, "phrases"
+    (all of their words), ``word*`` prefixes, ``source:name`` and
+    ``date:2026-06`` / ``date:2026-06-01..2026-06-30`` are understood.
+    """
+    items = _QUERY_TOKEN.findall(query)
+    position = 0
+
+    def peek():
+        return items[position] if position < len(items) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return items[position - 1]
+
+    def or_expr():
+        children = [and_expr()]
+        while peek() == 'OR':
+            take()
+            children.append(and_expr())
+        return children[0] if len(children) == 1 else ('or', children)
+
+    def and_expr():
+        children = []
+        while peek() not in (None, ')', 'OR'):
+            if peek() == 'AND':
+                take()
+                continue
+            children.append(not_expr())
+        if not children:
+            raise QueryError(f"expected a search term in {query!r}")
+        return children[0] if len(children) == 1 else ('and', children)
+
+    def not_expr():
+        item = peek()
+        if item == 'NOT':
+            take()
+            return ('not', not_expr())
+        if item.startswith('-') and len(item) > 1:
+            items[position] = item[1:]
+            return ('not', not_expr())
+        return atom()
+
+    def atom():
+        item = take()
+        if item == '(':
+            node = or_expr()
+            if peek() != ')':
+                raise QueryError(f"missing ')' in {query!r}")
+            take()
+            return node
+        if item == ')':
+            raise QueryError(f"unexpected ')' in {query!r}")
+        field, _, value = item.partition(':')
+        if value and field.lower() == 'date':
+            return _date_node(value)
+        prefix = ''
+        if value and field.lower() == 'source':
+            prefix, item = 'source:', value
+        words = sorted(tokens(item.strip('"')))
+        if not words:
+            raise QueryError(f"nothing searchable in {item!r}")
+        if item.endswith('*') and len(words) == 1:
+            return ('prefix', prefix + words[0])
+        nodes = [('term', prefix + word) for word in words]
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    if not items:
+        return None
+    tree = or_expr()
+    if peek() is not None:
+        raise QueryError(f"unexpected {peek()!r} in {query!r}")
+    return tree
+
+
+def _bound(value: str, end: bool) -> str:
+    # "2026", "2026-06" or "2026-06-01" -> first / last matching ISO day
+    parts = value.split('-')
+    if not 1 <= len(parts) <= 3 or not all(part.isdigit() for part in parts):
+        raise QueryError(f"bad date {value!r} (use YYYY, YYYY-MM or YYYY-MM-DD)")
+    defaults = ('12', '31') if end else ('01', '01')
+    parts += defaults[len(parts) - 1:]
+    return '-'.join(part.zfill(2) for part in parts)
+
+
+def _date_node(value: str):
+    since, dots, until = value.partition('..')
+    if not dots:
+        until = since  # date:2026-06 is the whole month
+    return ('date', _bound(since, False) if since else None, _bound(until, True) if until else None)
+
+
+class SearchIndex:
+    """
+    Inverted index over the articles in the history files.
+
+    Every article is a row in ``docs``; ``postings`` maps each lower-cased
+    title word (and ``source:<name>`` term) to the docs containing it, with
+    (term, doc) as the primary key, so a word lookup is one index range
+    scan.  ``save_articles`` only queues what it records (``defer``); the
+    queue is indexed in one batch by ``flush``, which ``main.run_source``
+    calls after each source and reads call first.  ``rebuild`` loads
+    existing history files and retention archives, and also recovers
+    anything queued by a process that died before flushing.  Entries stay
+    indexed after retention drops them from the history file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        # (articles, source) batches waiting for the next flush
+        self._pending: list[tuple[list, str | None]] = []
+        self._conn = connect(path)
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS docs (id INTEGER PRIMARY KEY, link TEXT NOT NULL UNIQUE,'
+            ' title TEXT NOT NULL, date TEXT NOT NULL, source TEXT, day TEXT);'
+            'CREATE INDEX IF NOT EXISTS docs_day ON docs (day);'
+            'CREATE TABLE IF NOT EXISTS postings (term TEXT NOT NULL, doc INTEGER NOT NULL,'
+            ' PRIMARY KEY (term, doc)) WITHOUT ROWID;'
+        )
+
+    def _insert(self, conn, articles, source):
+        rows = {}
+        for article in articles:
+            if article['link'] in rows:
+                continue
+            article_source = getattr(article, 'source', None) or source
+            published = article_date(article)
+            rows[article['link']] = (article['link'], article['title'], article['date'], article_source,
+                                     published.isoformat() if published else None)
+        # Row ids only grow, so everything above the old maximum is what this batch added
+        last = conn.execute('SELECT COALESCE(MAX(id), 0) FROM docs').fetchone()[0]
+        conn.executemany('INSERT OR IGNORE INTO docs (link, title, date, source, day) VALUES (?, ?, ?, ?, ?)',
+                         rows.values())
+        added = conn.execute('SELECT id, link FROM docs WHERE id > ?', (last,)).fetchall()
+        # Sorted, the inserts walk the postings b-tree in order instead of jumping around it
+        conn.executemany('INSERT OR IGNORE INTO postings (term, doc) VALUES (?, ?)',
+                         sorted((term, doc) for doc, link in added
+                                for term in tokens(rows[link][1]) | source_terms(rows[link][3])))
+        return len(added)
+
+    def _transaction(self, work):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = work(self._conn)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def add(self, articles, source: str | None = None) -> int:
+        """Index ``articles`` (Articles or dicts) in one transaction; known links are skipped."""
+        return self._transaction(lambda conn: self._insert(conn, articles, source))
+
+    def defer(self, articles, source: str | None = None):
+        """Queue ``articles`` for the next ``flush`` instead of indexing them now."""
+        articles = list(articles)
+        if articles:
+            with self._pending_lock:
+                self._pending.append((articles, source))
+
+    def flush(self) -> int:
+        """Index everything ``defer`` queued in one transaction; returns how many docs were added."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        try:
+            return self._transaction(lambda conn: sum(self._insert(conn, articles, source)
+                                                      for articles, source in pending))
+        except BaseException:
+            with self._pending_lock:
+                self._pending[:0] = pending  # keep them for the next flush
+            raise
+
+    def rebuild(self, filenames) -> int:
+        """Replace the whole index with the entries of ``filenames`` (history files or .gz archives)."""
+        from PythonProject3.Helpers.retention import read_sections
+
+        def load(conn):
+            conn.execute('DELETE FROM postings')
+            conn.execute('DELETE FROM docs')
+            added = 0
+            for filename in filenames:
+                file_source = _file_source(filename)
+                for heading, records in read_sections(filename):
+                    source = file_source or heading
+                    added += self._insert(conn, (
+                        {'title': r.title, 'link': r.link, 'date': r.date} for r in records if r.link), source)
+            return added
+        return self._transaction(load)
+
+    @staticmethod
+    def _condition(node) -> tuple[str, str, tuple]:
+        """(table, WHERE clause, args) selecting the docs of a term / prefix / date node."""
+        kind = node[0]
+        if kind == 'term':
+            return 'postings', 'term = ?', (node[1],)
+        if kind == 'prefix':
+            prefix = node[1]
+            return 'postings', 'term >= ? AND term < ?', (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        clauses, args = ['day IS NOT NULL'], []
+        if node[1]:
+            clauses.append('day >= ?')
+            args.append(node[1])
+        if node[2]:
+            clauses.append('day <= ?')
+            args.append(node[2])
+        return 'docs', ' AND '.join(clauses), tuple(args)
+
+    def _estimate(self, conn, node) -> float:
+        # Cheap size estimate so ANDs start from their rarest part; negations go last
+        kind = node[0]
+        if kind == 'not':
+            return float('inf')
+        if kind == 'or':
+            return sum(self._estimate(conn, child) for child in node[1])
+        if kind == 'and':
+            return min(self._estimate(conn, child) for child in node[1])
+        table, where, args = self._condition(node)
+        return conn.execute(f'SELECT COUNT(*) FROM {table} WHERE {where}', args).fetchone()[0]
+
+    def _leaf(self, conn, node, within: set[int] | None) -> set[int]:
+        table, where, args = self._condition(node)
+        column = 'doc' if table == 'postings' else 'id'
+        if within is not None and len(within) <= _PROBE_LIMIT:
+            # Few candidates left: probe the index for just those instead of reading the whole list
+            found = set()
+            candidates = list(within)
+            for start in range(0, len(candidates), _CHUNK):
+                chunk = candidates[start:start + _CHUNK]
+                found.update(row[0] for row in conn.execute(
+                    f'SELECT {column} FROM {table} WHERE {where} AND {column} IN ({",".join("?" * len(chunk))})',
+                    (*args, *chunk)))
+            return found
+        found = {row[0] for row in conn.execute(f'SELECT {column} FROM {table} WHERE {where}', args)}
+        return found if within is None else found & within
+
+    def _match(self, conn, node, within: set[int] | None = None) -> set[int]:
+        """Doc ids matching ``node``, restricted to ``within`` (None = every doc)."""
+        kind = node[0]
+        if kind == 'or':
+            return set().union(*(self._match(conn, child, within) for child in node[1]))
+        if kind == 'not':
+            base = within if within is not None else {row[0] for row in conn.execute('SELECT id FROM docs')}
+            return base - self._match(conn, node[1], base)
+        if kind == 'and':
+            result = within
+            for child in sorted(node[1], key=lambda child: self._estimate(conn, child)):
+                result = self._match(conn, child, result)
+                if not result:
+                    break
+            return result
+        return self._leaf(conn, node, within)
+
+    def search(self, query: str = '', since: date | str | None = None, until: date | str | None = None,
+               limit: int | None = 50) -> list[Hit]:
+        """
+        Articles matching ``query`` (see ``_parse``; empty matches everything)
+        published between ``since`` and ``until`` inclusive, newest first.
+        Raises QueryError for a malformed query.
+        """
+        tree = _parse(query)
+        self.flush()
+        where, args = [], []
+        if since:
+            where.append('day >= ?')
+            args.append(since.isoformat() if isinstance(since, date) else _bound(since, False))
+        if until:
+            where.append('day <= ?')
+            args.append(until.isoformat() if isinstance(until, date) else _bound(until, True))
+        sql = 'SELECT id, title, link, date, source, day FROM docs'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY day DESC, id DESC'  # NULL days sort last; served by docs_day
+
+        with self._lock:
+            if tree is None:
+                rows = self._conn.execute(sql + ' LIMIT ?', (*args, -1 if limit is None else limit)).fetchall()
+            else:
+                rows = []
+                # "NOT x" alone: walk everything except x rather than materialising every id
+                excluded = self._match(self._conn, tree[1]) if tree[0] == 'not' else None
+                ids = self._match(self._conn, tree) if excluded is None else None
+                if ids is not None and len(ids) <= _PROBE_LIMIT:
+                    # Few hits: fetch exactly those and sort them here
+                    candidates = list(ids)
+                    for start in range(0, len(candidates), _CHUNK):
+                        chunk = candidates[start:start + _CHUNK]
+                        clauses = ' AND '.join([*where, f"id IN ({','.join('?' * len(chunk))})"])
+                        rows += self._conn.execute(
+                            f'SELECT id, title, link, date, source, day FROM docs WHERE {clauses}',
+                            (*args, *chunk)).fetchall()
+                    # Same order as the SQL: dated first, newest first
+                    rows.sort(key=lambda row: (row[5] is not None, row[5] or '', row[0]), reverse=True)
+                    rows = rows[:limit]
+                else:
+                    # Many hits: walk the docs newest first until the limit is reached
+                    for row in self._conn.execute(sql, args):
+                        if (row[0] in ids) if excluded is None else (row[0] not in excluded):
+                            rows.append(row)
+                            if len(rows) == limit:
+                                break
+        return [Hit(title, link, raw, source, date.fromisoformat(day) if day else parse_date(raw))
+                for _, title, link, raw, source, day in rows]
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM docs').fetchone()[0]
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+def _file_source(filename: str) -> str | None:
+    """Registry name of a game history file (or its archive); None for feeds, which use the heading."""
+    from PythonProject3.Source.registry import REGISTRY
+
+    name = os.path.basename(filename)
+    for spec in REGISTRY.values():
+        stem = spec.history_file[:-len('.txt')] if spec.history_file.endswith('.txt') else spec.history_file
+        if name == spec.history_file or (name.startswith(f"{stem}.") and name.endswith('.txt.gz')):
+            return spec.name if spec.kind != 'rss' else None
+    return None
+
+
+_indexes: dict[str, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def search_index_path(filename: str) -> str | None:
+    if not SEARCH_INDEX_NAME:
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(filename)), SEARCH_INDEX_NAME)
+
+
+def open_search_index(filename: str) -> SearchIndex | None:
+    """Return the (cached) index shared by history files in ``filename``'s directory."""
+    path = search_index_path(filename)
+    if path is None:
+        return None
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = SearchIndex(path)
+        return index
+
+
+def flush_search_indexes() -> int:
+    """``flush`` every open index; returns how many docs were added."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    return sum(index.flush() for index in indexes)
+
+
+def close_search_index(filename: str):
+    path = search_index_path(filename)
+    with _indexes_lock:
+        index = _indexes.pop(path, None) if path else None
+    if index is not None:
+        index.close()
+
+
+def remove_search_index(filename: str):
+    """Close and delete the index next to ``filename``."""
+    path = search_index_path(filename)
+    close_search_index(filename)
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.remove(path + suffix)
+        except (FileNotFoundError, TypeError):
+            pass
+
+
+def history_files(directory: str = '.') -> list[str]:
+    """History files and their retention archives in ``directory``."""
+    return sorted(glob.glob(os.path.join(directory, '*news.txt'))
+                  + glob.glob(os.path.join(directory, '*news.*.txt.gz')))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Search the posted news history.")
+    parser.add_argument('--index', default=SEARCH_INDEX_NAME or 'search_index.sqlite3', help="index database")
+    commands = parser.add_subparsers(dest='command', required=True)
+    query = commands.add_parser('query', help='e.g. \'apex wraith\', \'(cve OR exploit) -linux\', \'source:league\'')
+    query.add_argument('terms', nargs='*')
+    query.add_argument('--since', help="YYYY[-MM[-DD]], inclusive")
+    query.add_argument('--until', help="YYYY[-MM[-DD]], inclusive")
+    query.add_argument('--limit', type=int, default=20)
+    rebuild = commands.add_parser('rebuild', help="index existing history files and archives from scratch")
+    rebuild.add_argument('files', nargs='*', help="default: *news.txt and *news.*.txt.gz here")
+    args = parser.parse_args(argv)
+
+    index = SearchIndex(args.index)
+    try:
+        if args.command == 'rebuild':
+            files = args.files or history_files()
+            start = time.perf_counter()
+            added = index.rebuild(files)
+            print(f"Indexed {added} articles from {len(files)} files in {time.perf_counter() - start:.2f}s")
+            return 0
+        start = time.perf_counter()
+        try:
+            hits = index.search(' '.join(args.terms), args.since, args.until, args.limit)
+        except QueryError as e:
+            parser.error(str(e))
+        elapsed = (time.perf_counter() - start) * 1000
+        for hit in hits:
+            day = hit.published.isoformat() if hit.published else hit.date
+            print(f"{day}  [{hit.source}] {hit.title}\n            {hit.link}")
+        print(f"{len(hits)} result(s) in {elapsed:.1f} ms")
+        return 0
+    finally:
+        index.close()
+
+
+__all__ = ['Hit', 'QueryError', 'SEARCH_INDEX_NAME', 'SearchIndex', 'close_search_index', 'flush_search_indexes',
+           'open_search_index', 'remove_search_index', 'search_index_path']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
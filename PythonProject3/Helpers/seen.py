@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+import time
+
+from PythonProject3.Helpers.coordination import INSTANCE_ID
+from PythonProject3.Helpers.dedup import CLAIM_TTL, add_claim_columns, connect
+from PythonProject3.Helpers.urls import canonical_url
+
+# File name of the cross-source seen-set, created next to the history files.
+# Set NEWS_GLOBAL_SEEN to an empty string to only dedup per history file.
+GLOBAL_SEEN_NAME = os.getenv("NEWS_GLOBAL_SEEN", "seen_urls.sqlite3")
+# Sizing of the in-memory Bloom filter; it is rebuilt larger once exceeded.
+BLOOM_CAPACITY = int(os.getenv("NEWS_BLOOM_CAPACITY", "100000"))
+BLOOM_ERROR_RATE = float(os.getenv("NEWS_BLOOM_ERROR_RATE", "0.001"))
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings, serialisable to bytes.
+
+    ``size`` and ``hashes`` are derived from ``capacity`` and ``error_rate``
+    unless given; a stored filter must be reopened with the values it was
+    built with (see ``params``), whatever the current configuration says.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE, bits: bytes | None = None,
+                 size: int | None = None, hashes: int | None = None):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = size or max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = hashes or max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits is not None else bytearray((self.size + 7) // 8)
+        if len(self.bits) != (self.size + 7) // 8:
+            raise ValueError("bit array does not match the filter size")
+
+    @property
+    def params(self) -> tuple[int, float, int, int]:
+        """(capacity, error_rate, size, hashes): everything needed to reopen ``bits``."""
+        return self.capacity, self.error_rate, self.size, self.hashes
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, item: str):
+        bits = self.bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        for pos in self._positions(item):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+def destination_key(webhook: str | None) -> str:
+    """Short stable id for a webhook, so its token never lands on disk."""
+    return hashlib.blake2b((webhook or '').encode('utf-8'), digest_size=8).hexdigest()
+
+
+class GlobalSeen:
+    """
+    Seen-set of canonical article URLs per destination webhook, shared by
+    every source.
+
+    Lookups go through a Bloom filter first, so the common "never seen"
+    answer needs no disk access; a filter hit is confirmed against the
+    SQLite table, which holds the exact set.  ``claim`` is an atomic insert,
+    so two sources finding the same story at once post it only once.  The
+    filter is stored in the database with its sizing and rebuilt from the
+    table whenever it is missing, stale or full.
+
+    A claim records its ``owner`` and time and stays provisional until the
+    owner confirms it (delivered or queued) or releases it (failed).  An
+    unconfirmed claim older than ``CLAIM_TTL`` (its owner crashed) no
+    longer counts and can be claimed again, like an expired source lease.
+    """
+
+    def __init__(self, path: str, capacity: int = BLOOM_CAPACITY, error_rate: float = BLOOM_ERROR_RATE):
+        self.path = path
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._conn = connect(path)
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS seen ('
+            ' dest TEXT NOT NULL, url TEXT NOT NULL, added_at REAL NOT NULL, owner TEXT, claimed_at REAL,'
+            ' PRIMARY KEY (dest, url));'
+        )
+        add_claim_columns(self._conn, 'seen')
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(bloom)')}
+        if columns and 'hashes' not in columns:
+            # Saved without its sizing, so it can't be read back safely; it is only a cache
+            self._conn.execute('DROP TABLE bloom')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS bloom (id INTEGER PRIMARY KEY CHECK (id = 0),'
+            ' capacity INTEGER, error_rate REAL, size INTEGER, hashes INTEGER, count INTEGER, bits BLOB)'
+        )
+        self._count = self._conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+        row = self._conn.execute(
+            'SELECT capacity, error_rate, size, hashes, count, bits FROM bloom WHERE id = 0').fetchone()
+        self._bloom = None
+        if row and row[4] == self._count and row[4] <= row[0]:
+            try:
+                self._bloom = BloomFilter(row[0], row[1], row[5], size=row[2], hashes=row[3])
+            except ValueError:
+                pass
+        if self._bloom is None:
+            self._rebuild(max(capacity, self._count * 2))
+
+    @staticmethod
+    def _item(dest: str, url: str) -> str:
+        return f"{dest} {url}"
+
+    def _rebuild(self, capacity: int):
+        self._bloom = BloomFilter(capacity, self.error_rate)
+        for dest, url in self._conn.execute('SELECT dest, url FROM seen'):
+            self._bloom.add(self._item(dest, url))
+        self._dirty = True
+
+    def __contains__(self, entry: tuple[str | None, str]) -> bool:
+        webhook, link = entry
+        dest, url = destination_key(webhook), canonical_url(link)
+        with self._lock:
+            if self._item(dest, url) not in self._bloom:
+                return False
+            return self._conn.execute(
+                'SELECT 1 FROM seen WHERE dest = ? AND url = ? AND (owner IS NULL OR claimed_at > ?)',
+                (dest, url, time.time() - CLAIM_TTL)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
+
+    def claim(self, webhook: str | None, link: str, owner: str = INSTANCE_ID) -> bool:
+        """Claim ``link`` for ``webhook``; False if it is already posted or claimed."""
+        return self.claim_many(webhook, [link], owner)[0]
+
+    def claim_many(self, webhook: str | None, links, owner: str = INSTANCE_ID, now: float | None = None,
+                   ttl: float = CLAIM_TTL) -> list[bool]:
+        """``claim`` for several links in one transaction; one result per link."""
+        dest = destination_key(webhook)
+        urls = [canonical_url(link) for link in links]
+        results = []
+        now = time.time() if now is None else now
+        stale = now - ttl
+        inserted = 0
+        with self._lock:
+            # Definite filter misses skip the lookup.  The filter only knows this
+            # process's claims, so their insert still checks the table itself.
+            maybe_taken = [url for url in urls if self._item(dest, url) in self._bloom]
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                # The write lock is held, so look up the possibly taken ones and insert the rest
+                existing = {}
+                for start in range(0, len(maybe_taken), 500):
+                    chunk = maybe_taken[start:start + 500]
+                    existing.update(self._conn.execute(
+                        'SELECT url, owner IS NULL OR claimed_at > ? FROM seen'
+                        f" WHERE dest = ? AND url IN ({','.join('?' * len(chunk))})",
+                        (stale, dest, *chunk)))
+                for url in urls:
+                    if existing.get(url):
+                        results.append(False)
+                        continue
+                    won = False
+                    if url not in existing:
+                        won = self._conn.execute(
+                            'INSERT OR IGNORE INTO seen (dest, url, added_at, owner, claimed_at)'
+                            ' VALUES (?, ?, ?, ?, ?)', (dest, url, now, owner, now)).rowcount == 1
+                        inserted += won
+                    if not won:
+                        # Take over a claim its owner never confirmed in time
+                        won = self._conn.execute(
+                            'UPDATE seen SET added_at = ?, owner = ?, claimed_at = ?'
+                            ' WHERE dest = ? AND url = ? AND owner IS NOT NULL AND claimed_at <= ?',
+                            (now, owner, now, dest, url, stale)).rowcount == 1
+                    results.append(won)
+                    existing[url] = True
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            # Losers were claimed by someone else (maybe another process); keep the filter in step
+            self._count += inserted
+            if self._count > self._bloom.capacity:
+                self._rebuild(max(self._bloom.capacity * 2, self._count * 2))
+            else:
+                for url in urls:
+                    self._bloom.add(self._item(dest, url))
+            self._dirty = True
+        return results
+
+    def confirm_many(self, webhook: str | None, links, owner: str = INSTANCE_ID):
+        """Make ``owner``'s claims on ``links`` permanent once they are delivered (or queued)."""
+        dest = destination_key(webhook)
+        now = time.time()
+        rows = [(now, dest, canonical_url(link), owner) for link in links]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany(
+                    'UPDATE seen SET added_at = ?, owner = NULL, claimed_at = NULL'
+                    ' WHERE dest = ? AND url = ? AND owner = ?', rows)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def release(self, webhook: str | None, link: str, owner: str = INSTANCE_ID):
+        """Undo a claim whose delivery failed (the filter keeps a harmless false positive)."""
+        self.release_many(webhook, [link], owner)
+
+    def release_many(self, webhook: str | None, links, owner: str = INSTANCE_ID):
+        dest = destination_key(webhook)
+        rows = [(dest, canonical_url(link), owner) for link in links]
+        if not rows:
+            return
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                # Only our own unconfirmed claim: a confirmed or taken-over row stays
+                self._conn.executemany('DELETE FROM seen WHERE dest = ? AND url = ? AND owner = ?', rows)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            removed = self._conn.total_changes - before
+            self._count -= removed
+            self._dirty = self._dirty or removed > 0
+
+    def prune(self, older_than: float) -> int:
+        """Forget links claimed before ``older_than`` (a timestamp); the filter is rebuilt."""
+        with self._lock:
+            removed = self._conn.execute('DELETE FROM seen WHERE added_at < ?', (older_than,)).rowcount
+            if removed:
+                self._count -= removed
+                self._rebuild(max(self._bloom.capacity, self._count * 2))
+            return removed
+
+    def save(self):
+        """Persist the Bloom filter so the next start doesn't rebuild it."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._conn.execute(
+                'INSERT OR REPLACE INTO bloom (id, capacity, error_rate, size, hashes, count, bits)'
+                ' VALUES (0, ?, ?, ?, ?, ?, ?)',
+                (*self._bloom.params, self._count, bytes(self._bloom.bits)))
+            self._dirty = False
+
+    def close(self):
+        self.save()
+        with self._lock:
+            self._conn.close()
+
+
+_stores: dict[str, GlobalSeen] = {}
+_stores_lock = threading.Lock()
+
+
+def global_seen_path(filename: str) -> str | None:
+    if not GLOBAL_SEEN_NAME:
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(filename)), GLOBAL_SEEN_NAME)
+
+
+def open_global_seen(filename: str) -> GlobalSeen | None:
+    """Return the (cached) seen-set shared by history files in ``filename``'s directory."""
+    path = global_seen_path(filename)
+    if path is None:
+        return None
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = GlobalSeen(path)
+        return store
+
+
+def close_global_seen(filename: str):
+    path = global_seen_path(filename)
+    with _stores_lock:
+        store = _stores.pop(path, None) if path else None
+    if store is not None:
+        store.close()
+
+
+def remove_global_seen(filename: str):
+    """Close and delete the seen-set next to ``filename``."""
+    path = global_seen_path(filename)
+    close_global_seen(filename)
+    for suffix in ('', '-wal', '-shm'):
+        try:
+            os.remove(path + suffix)
+        except (FileNotFoundError, TypeError):
+            pass
+
+
+__all__ = ['BloomFilter', 'GlobalSeen', 'close_global_seen', 'destination_key', 'global_seen_path',
+           'open_global_seen', 'remove_global_seen']
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:  # lxml is optional but several times faster than the pure-Python parser
+    import lxml  # noqa: F401
+    _DEFAULT_PARSER = 'lxml'
+except ImportError:
+    _DEFAULT_PARSER = 'html.parser'
+
+# Force a backend with NEWS_HTML_PARSER=html.parser|lxml|html5lib
+HTML_PARSER = os.getenv("NEWS_HTML_PARSER") or _DEFAULT_PARSER
+
+
+def has_class(name: str):
+    """
+    SoupStrainer matcher for elements carrying CSS class ``name``.
+
+    At parse time a strainer sees the raw ``class`` attribute string, so a
+    plain ``class_='x'`` misses elements like ``<div class="x y">``.
+    """
+    def match(value) -> bool:
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return name in classes
+    return match
+
+
+def make_soup(html, parse_only: SoupStrainer | None = None, parser: str | None = None) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup tree with the configured backend.
+
+    Pass ``parse_only`` to keep only the matching subtrees (e.g. the article
+    cards) instead of building the whole multi-MB page.
+    """
+    return BeautifulSoup(html, parser or HTML_PARSER, parse_only=parse_only)
+
+
+__all__ = ['HTML_PARSER', 'SoupStrainer', 'has_class', 'make_soup']
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from.
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid', 'yclid',
+    'ref', 'ref_src', 'ref_url', 'source', 'cmpid', 'ncid', 'sr_share', '_hsenc', '_hsmi',
+})
+TRACKING_PREFIXES = ('utm_', 'ga_', 'pk_', 'mtm_')
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_SLASHES = re.compile(r'/{2,}')
+# Already canonical: https, lower-case host without www./port, no query or fragment
+_CANONICAL = re.compile(r'https://(?!www\.)[a-z0-9.-]+[a-z0-9](?:/[^?#/]+)*')
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=8192)
+def canonical_url(url: str) -> str:
+    """
+    Normalise an article URL so the same story found through different
+    feeds maps to one key.
+
+    http is treated as https, the host is lower-cased without ``www.`` or a
+    default port, tracking parameters and the fragment are dropped, the
+    remaining query is sorted and trailing slashes are removed.  Anything
+    that isn't an http(s) URL is returned stripped but otherwise unchanged.
+    """
+    url = (url or '').strip()
+    if _CANONICAL.fullmatch(url):
+        return url
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = _SLASHES.sub('/', parts.path).rstrip('/')
+    query = parts.query and urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(name)
+    ))
+    return urlunsplit(('https', host, path, query, ''))
+
+
+__all__ = ['TRACKING_PARAMS', 'canonical_url']
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
+
+from PythonProject3.Helpers.dates import article_date
+
+# Days before today that are always inside the send window (1 = yesterday
+# too, so a story published just before midnight isn't lost).
+LOOKBACK_DAYS = int(os.getenv("NEWS_LOOKBACK_DAYS", "1"))
+# After downtime the window reaches back to the source's high-water mark,
+# but never further than this many days.
+MAX_CATCHUP_DAYS = int(os.getenv("NEWS_MAX_CATCHUP_DAYS", "7"))
+# Consecutive items from before the window after which a page walk stops
+# (a few, so one pinned old post at the top doesn't end it).
+STOP_AFTER = int(os.getenv("NEWS_STOP_AFTER", "3"))
+
+
+class Watermark(NamedTuple):
+    """Publish date and link of the newest article a source has settled."""
+    published: date
+    link: str
+
+
+def window_start(mark: Watermark | None = None, today: date | None = None) -> date:
+    """
+    Oldest publish date that may still be sent: ``LOOKBACK_DAYS`` ago, or
+    the high-water mark's date if that is older (catching up after an
+    outage), capped at ``MAX_CATCHUP_DAYS``.
+    """
+    today = today or datetime.now().date()
+    start = today - timedelta(days=LOOKBACK_DAYS)
+    if mark is not None:
+        floor = today - timedelta(days=max(MAX_CATCHUP_DAYS, LOOKBACK_DAYS))
+        start = min(start, max(mark.published, floor))
+    return start
+
+
+class PageWalk:
+    """
+    Tells a parser walking a newest-first page when the rest is old news.
+
+    ``reached(article)`` turns True on the mark's own link, or on the
+    ``patience``-th article in a row published before the window.  The
+    parser keeps that last article and stops; it is already seen or out of
+    the window, so pagination knows not to fetch further pages either.
+    Without a mark (first run, tests, benchmarks) the whole page is walked.
+    """
+
+    def __init__(self, mark: Watermark | None, today: date | None = None, patience: int = STOP_AFTER):
+        self.mark = mark
+        self.since = window_start(mark, today) if mark is not None else None
+        self.patience = max(1, patience)
+        self._older = 0
+
+    def reached(self, article) -> bool:
+        if self.mark is None:
+            return False
+        if article.link == self.mark.link:
+            return True
+        published = article_date(article)
+        if published is not None and published < self.since:
+            self._older += 1
+            return self._older >= self.patience
+        self._older = 0
+        return False
+
+
+__all__ = ['LOOKBACK_DAYS', 'MAX_CATCHUP_DAYS', 'PageWalk', 'STOP_AFTER', 'Watermark', 'window_start']
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import importlib
+from typing import NamedTuple
+
+
+class SourceSpec(NamedTuple):
+    """
+    Everything needed to run a source without importing it.
+
+    ``target`` is "module:attribute" and is only imported when the source
+    actually runs, so selecting one source never loads the others' parsers
+    (or bs4 / feedparser).  ``history_file`` mirrors the parser's own
+    attribute for housekeeping that shouldn't import the parser.
+    """
+    name: str
+    target: str
+    webhook_key: str
+    history_file: str
+    label: str
+    kind: str = 'game'
+    aliases: tuple[str, ...] = ()
+
+
+REGISTRY: dict[str, SourceSpec] = {spec.name: spec for spec in (
+    SourceSpec('HackerNews', 'PythonProject3.Cyber.HackingNews:NewsFeed', 'hackerNews', 'news.txt',
+               'Hacker News', kind='rss', aliases=('hacker', 'hacking', 'cyber')),
+    SourceSpec('ArcRaiders', 'PythonProject3.Game.GamingNews:ArcRaidersNews', 'arcRaiderNews',
+               'arc_raiders_news.txt', 'Arc Raiders', aliases=('arc',)),
+    SourceSpec('League', 'PythonProject3.Game.LeagueNews:LeagueNews', 'leagueNews', 'league_news.txt',
+               'League', aliases=('lol', 'leagueoflegends')),
+    SourceSpec('Apex', 'PythonProject3.Game.ApexNews:ApexNews', 'apexNews', 'apex_news.txt',
+               'Apex Legends', aliases=('apexlegends',)),
+    SourceSpec('Deadlock', 'PythonProject3.Game.DeadlockNews:DeadlockNews', 'deadlockNews',
+               'deadlock_news.txt', 'Deadlock'),
+)}
+
+
+def load(target: str):
+    """Import and return the object named by "package.module:attribute"."""
+    module, _, attr = target.partition(':')
+    return getattr(importlib.import_module(module), attr)
+
+
+def resolve(name: str) -> SourceSpec:
+    """Find a source by name or alias, case-insensitively."""
+    wanted = name.strip().lower()
+    for spec in REGISTRY.values():
+        if wanted == spec.name.lower() or wanted in spec.aliases:
+            return spec
+    raise KeyError(f"unknown source {name!r} (choose from {', '.join(REGISTRY)})")
+
+
+def _names(value) -> list[str]:
+    if isinstance(value, str):
+        value = value.split(',')
+    return [item for item in (value or []) if item.strip()]
+
+
+def select(only=None, exclude=None) -> list[SourceSpec]:
+    """
+    Specs to run, in registry order.  ``only`` / ``exclude`` are lists of
+    names or comma-separated strings; unknown names raise ``KeyError``.
+    """
+    chosen = {resolve(name).name for name in _names(only)} or set(REGISTRY)
+    chosen -= {resolve(name).name for name in _names(exclude)}
+    return [spec for name, spec in REGISTRY.items() if name in chosen]
+
+
+__all__ = ['REGISTRY', 'SourceSpec', 'load', 'resolve', 'select']
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import NamedTuple
+
+
+class Rule(NamedTuple):
+    """
+    Send matching articles to the webhook named ``destination`` as well.
+
+    An article matches when its source is in ``sources`` (empty = any
+    source) and its title contains one of ``keywords`` as a whole word
+    (empty = every article of those sources).
+    """
+    destination: str
+    sources: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
+
+
+# Security stories about developer tooling and package registries also go to
+# the dev channel.  Opt-in with NEWS_DEFAULT_ROUTES=1; NEWS_ROUTES rules
+# always apply.
+DEFAULT_RULES = (
+    Rule('devNews', sources=('HackerNews',), keywords=(
+        'supply chain', 'supply-chain', 'npm', 'PyPI', 'RubyGems', 'crates.io', 'Maven', 'NuGet',
+        'GitHub', 'GitLab', 'typosquatting', 'dependency confusion', 'OpenSSL',
+    )),
+)
+DEFAULT_ROUTES = os.getenv("NEWS_DEFAULT_ROUTES", "0") != "0"
+
+
+def parse_rules(value: str | None) -> list[Rule]:
+    """
+    Parse NEWS_ROUTES: "destination:Source,Source:keyword|keyword;..."
+    e.g. "devNews:HackerNews:cve|exploit;leagueNews:Apex:" (``*`` = any source).
+    """
+    rules = []
+    for item in (value or '').split(';'):
+        destination, _, rest = item.strip().partition(':')
+        if not destination:
+            continue
+        sources, _, keywords = rest.partition(':')
+        rules.append(Rule(
+            destination.strip(),
+            tuple(s.strip() for s in sources.split(',') if s.strip() and s.strip() != '*'),
+            tuple(k.strip() for k in keywords.split('|') if k.strip()),
+        ))
+    return rules
+
+
+def configured(url) -> bool:
+    # Source/webhook.py stores unset variables as the string "None"
+    return bool(url) and url != 'None'
+
+
+class Router:
+    """
+    Picks the webhooks an article goes to: the source's own webhook first,
+    then every other destination whose rule matches.  Passed to
+    ``save_articles`` in place of a single webhook URL.
+    """
+
+    def __init__(self, source: str, primary: str, rules=None, webhooks: dict | None = None):
+        if webhooks is None:
+            from PythonProject3.Source.webhook import webhook as webhooks
+        if rules is None:
+            rules = [*(DEFAULT_RULES if DEFAULT_ROUTES else ()), *parse_rules(os.getenv("NEWS_ROUTES"))]
+        self.source = source
+        self.primary = webhooks.get(primary)
+        self._routes = []
+        for rule in rules:
+            url = webhooks.get(rule.destination)
+            if rule.destination == primary or not configured(url):
+                continue
+            if rule.sources and source not in rule.sources:
+                continue
+            pattern = None
+            if rule.keywords:
+                words = '|'.join(re.escape(keyword) for keyword in rule.keywords)
+                pattern = re.compile(rf'(?<!\w)(?:{words})(?!\w)', re.IGNORECASE)
+            self._routes.append((url, pattern))
+
+    def destinations(self, article) -> list[str]:
+        urls = [self.primary]
+        for url, pattern in self._routes:
+            if url not in urls and (pattern is None or pattern.search(article['title'])):
+                urls.append(url)
+        return urls
+
+
+__all__ = ['DEFAULT_ROUTES', 'DEFAULT_RULES', 'Router', 'Rule', 'configured', 'parse_rules']
@@ -8,4 +8,12 @@ import pytest
 
 if __name__ == "__main__":
     root = pathlib.Path(__file__).resolve().parents[2]
+
+    # `python run_tests.py --bench [benchmark options]` runs the offline benchmarks instead
+    if "--bench" in sys.argv[1:]:
+        sys.path.insert(0, str(root))
+        from PythonProject3.Benchmarks.run_benchmarks import main as run_benchmarks
+
+        sys.exit(run_benchmarks([arg for arg in sys.argv[1:] if arg != "--bench"]))
+
     sys.exit(pytest.main([str(root / "PythonProject3" / "Tests")]))
\ No newline at end of file
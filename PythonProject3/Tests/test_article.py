@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import dataclasses
+import pickle
+from datetime import date
+
+import pytest
+
+from PythonProject3.Helpers.article import Article, as_article
+from PythonProject3.Helpers.dates import article_date
+
+
+def test_article_reads_like_the_legacy_dict():
+    article = Article("Update 1", "https://arcraiders.com/news/update-1", "June 23, 2026", date(2026, 6, 23),
+                      source="ArcRaiders", extras=(("href", "/news/update-1"),))
+    legacy = {"href": "/news/update-1", "title": "Update 1", "date": "June 23, 2026",
+              "link": "https://arcraiders.com/news/update-1"}
+
+    assert article == legacy and legacy == article
+    assert dict(article) == legacy
+    assert article["href"] == "/news/update-1" and article.get("missing") is None
+    assert "source" not in article and article.source == "ArcRaiders"
+    assert "published" not in article and article.published == date(2026, 6, 23)
+    assert {article, dataclasses.replace(article, source=None)} == {article}
+    assert article_date(article) == date(2026, 6, 23)
+    assert pickle.loads(pickle.dumps(article)) == article
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        article.title = "changed"
+    with pytest.raises(AttributeError):
+        article.__dict__
+
+
+def test_as_article_converts_dicts_once():
+    legacy = {"title": "t", "link": "https://example.com/t", "date": "June 23, 2026"}
+
+    article = as_article(legacy, source="Apex")
+
+    assert isinstance(article, Article) and article.published is None and article.source == "Apex"
+    assert as_article(article) is article
+    assert article == legacy
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from PythonProject3.Benchmarks.run_benchmarks import compare, run
+
+
+def test_benchmark_suite_runs_every_stage_at_tiny_scale():
+    results = run(scale=0.001, repeat=1)
+
+    assert {"parse_deadlock", "parse_rss", "dedup_import", "dedup_lookup", "save_pipeline"} <= set(results)
+    assert all(r["seconds"] >= 0 and r["peak_kb"] >= 0 for r in results.values())
+    slow = {"stages": {name: {"seconds": r["seconds"] / 10 or 1e-9} for name, r in results.items()}}
+    assert compare(results, {"stages": {}}, 1.25) == []
+    assert set(compare(results, slow, 1.25)) <= set(results)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from PythonProject3.Helpers.coordination import LeaseStore, hold
+from PythonProject3.Helpers.dedup import CLAIM_TTL, SeenStore
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.seen import GlobalSeen, global_seen_path
+
+
+def test_lease_is_exclusive_until_it_expires(tmp_path):
+    store = LeaseStore(str(tmp_path / "leases.sqlite3"))
+
+    assert store.acquire("source:Apex", "a", ttl=60, now=0)
+    assert not store.acquire("source:Apex", "b", ttl=60, now=30)
+    assert store.renew("source:Apex", "a", ttl=60, now=30)
+    assert store.holder("source:Apex", now=80) == "a"
+    # "a" crashed and stopped renewing: the lease lapses and "b" takes over
+    assert store.acquire("source:Apex", "b", ttl=60, now=91)
+    assert not store.renew("source:Apex", "a", now=92)
+    assert not store.release("source:Apex", "a")
+    assert store.release("source:Apex", "b")
+    assert store.holder("source:Apex", now=92) is None
+    store.close()
+
+
+def test_hold_renews_while_running_and_releases_on_exit(tmp_path):
+    path = str(tmp_path / "leases.sqlite3")
+    mine, theirs = LeaseStore(path), LeaseStore(path)
+
+    with hold(mine, "compact", "a", ttl=0.3) as held:
+        assert held
+        time.sleep(0.5)  # longer than the ttl: only the heartbeat keeps it
+        assert not theirs.acquire("compact", "b", ttl=0.3)
+    assert theirs.acquire("compact", "b", ttl=0.3)
+    mine.close()
+    theirs.close()
+
+
+@pytest.mark.parametrize("shared_seen", [True, False])
+def test_concurrent_instances_post_each_article_once(tmp_path, monkeypatch, shared_seen):
+    if not shared_seen:  # NEWS_GLOBAL_SEEN="": the history index is the only claim
+        monkeypatch.setattr("PythonProject3.Helpers.history.open_global_seen", lambda _filename: None)
+    today = datetime.now().strftime("%B %d, %Y")
+    history = str(tmp_path / "apex_news.txt")
+    articles = [{"title": f"T{i}", "link": f"https://ea.test/{i}", "date": today} for i in range(50)]
+    posted = []
+    start = threading.Barrier(3)
+
+    def send(webhook, article, sent, failed):
+        posted.append(article["link"])
+        time.sleep(0.001)  # a real post takes a while, so the instances overlap
+        return True, sent + 1, failed
+
+    def instance():
+        # Own connections, as a separate process would have
+        store = SeenStore(history)
+        seen = GlobalSeen(global_seen_path(history)) if shared_seen else None
+        start.wait()
+        save_articles(articles, history, "https://discord.test/apex", send, store=store, global_seen=seen)
+        store.close()
+
+    threads = [threading.Thread(target=instance) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(posted) == sorted(a["link"] for a in articles)
+    with open(history, encoding="utf-8") as f:
+        assert f.read().count("Title: ") == 50
+
+
+@pytest.mark.parametrize("shared_seen", [True, False])
+def test_stale_claim_of_a_crashed_instance_is_posted_and_confirmed(tmp_path, monkeypatch, shared_seen):
+    if not shared_seen:
+        monkeypatch.setattr("PythonProject3.Helpers.history.open_global_seen", lambda _filename: None)
+    today = datetime.now().strftime("%B %d, %Y")
+    history = str(tmp_path / "apex_news.txt")
+    webhook = "https://discord.test/apex"
+    articles = [{"title": "Crashed", "link": "https://ea.test/crashed", "date": today},
+                {"title": "In flight", "link": "https://ea.test/busy", "date": today}]
+    store = SeenStore(history)
+    seen = GlobalSeen(global_seen_path(history)) if shared_seen else None
+    claim = (lambda links, owner, now: seen.claim_many(webhook, links, owner, now)) if shared_seen \
+        else (lambda links, owner, now: store.claim_many(links, owner, now))
+    # "dead" claimed an article and crashed before posting it; "busy" is still posting its own
+    assert claim(["https://ea.test/crashed"], "dead", time.time() - CLAIM_TTL - 1) == [True]
+    assert claim(["https://ea.test/busy"], "busy", time.time()) == [True]
+    posted = []
+    send = lambda _w, article, sent, failed: (posted.append(article["link"]) or True, sent + 1, failed)
+
+    save_articles(articles, history, webhook, send, store=store, global_seen=seen)
+    save_articles(articles, history, webhook, send, store=store, global_seen=seen)
+
+    assert posted == ["https://ea.test/crashed"]
+    # Confirmed once delivered: it never expires, unlike the claim it replaced
+    assert claim(["https://ea.test/crashed"], "late", time.time() + 10 * CLAIM_TTL) == [False]
+    assert claim(["https://ea.test/busy"], "late", time.time() + 10 * CLAIM_TTL) == [True]
+    store.close()
+    if seen is not None:
+        seen.close()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from PythonProject3.daemon import NewsDaemon, parse_intervals
+
+
+def test_parse_intervals_reads_name_seconds_pairs():
+    assert parse_intervals("HackerNews=120, Deadlock=900,") == {"HackerNews": 120.0, "Deadlock": 900.0}
+    assert parse_intervals(None) == {}
+
+
+def test_daemon_polls_on_interval_and_skips_overlapping_runs():
+    calls = {"fast": 0, "slow": 0}
+
+    def fast():
+        calls["fast"] += 1
+        return {"sent": 0, "failed": 0}
+
+    def slow():
+        calls["slow"] += 1
+        time.sleep(0.4)
+        return {"sent": 0, "failed": 0}
+
+    daemon = NewsDaemon(sources={"fast": fast, "slow": slow},
+                        intervals={"fast": 0.05, "slow": 0.05}, jitter=0, max_workers=2)
+    threading.Timer(0.6, daemon.stop).start()
+    daemon.run(install_signals=False)
+
+    assert calls["fast"] >= 3
+    assert calls["slow"] <= 2
+    assert daemon.skipped["slow"] >= 1
+
+
+def test_daemon_keeps_running_when_compaction_fails(monkeypatch, capsys):
+    def broken():
+        raise NameError("compact_all")
+
+    monkeypatch.setattr("PythonProject3.daemon.compact_history", broken)
+    daemon = NewsDaemon(sources={})
+
+    daemon._compact_due(now=0.0)
+
+    assert "Failed to compact history: compact_all" in capsys.readouterr().out
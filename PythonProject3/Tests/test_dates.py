@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import date
+
+from PythonProject3.Helpers.dates import article_date, format_date, parse_date
+
+
+def test_parse_date_handles_every_source_format():
+    expected = date(2026, 6, 23)
+    assert parse_date("2026-06-23T10:00:00Z") == expected
+    assert parse_date("Tue, 23 Jun 2026 08:00:00 +0000") == expected
+    assert parse_date("Tue, 23 Jun 2026 08:00:00 GMT") == expected
+    assert parse_date("June 23, 2026") == expected
+    assert parse_date("Jun 23, 2026") == expected
+    assert parse_date("23 June, 2026") == expected
+    assert parse_date("News  Published June 23, 2026 - 5 min read") == expected
+
+
+def test_parse_date_rejects_garbage():
+    assert parse_date("Yesterday") is None
+    assert parse_date("") is None
+    assert parse_date("February 30, 2026") is None
+
+
+def test_format_date_matches_history_file_format():
+    assert format_date(date(2026, 6, 5)) == "June 05, 2026"
+
+
+def test_article_date_prefers_parsed_published_value():
+    assert article_date({"date": "not a date", "published": date(2026, 1, 2)}) == date(2026, 1, 2)
+    assert article_date({"date": "January 02, 2026"}) == date(2026, 1, 2)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from PythonProject3.Helpers.dedup import SeenStore, index_path
+
+
+def test_seen_store_imports_existing_history_once(tmp_path):
+    history = tmp_path / "apex_news.txt"
+    history.write_text(
+        "ApexNews_latest:\n"
+        "Title: Old\n"
+        "Link: https://www.ea.com/news/old\n"
+        "Date: June 23, 2026\n\n",
+        encoding="utf-8",
+    )
+
+    store = SeenStore(str(history))
+    assert "https://www.ea.com/news/old" in store
+    store.close()
+
+    # Later appends are tracked by the index, not by re-reading the text file
+    history.write_text("Link: https://www.ea.com/news/not-indexed\n", encoding="utf-8")
+    reopened = SeenStore(str(history))
+
+    assert "https://www.ea.com/news/old" in reopened
+    assert "https://www.ea.com/news/not-indexed" not in reopened
+    assert (tmp_path / "apex_news.txt.seen.sqlite3").exists()
+    assert index_path(str(history)).endswith(".seen.sqlite3")
+    reopened.close()
+
+
+def test_seen_store_add_is_atomic_membership_insert(tmp_path):
+    store = SeenStore(str(tmp_path / "league_news.txt"))
+
+    assert store.add("https://example.com/1") is True
+    assert store.add("https://example.com/1") is False
+    assert "https://example.com/1" in store
+    assert len(store) == 1
+    store.close()
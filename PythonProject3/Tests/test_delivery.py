@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from PythonProject3.Helpers.delivery import DeliveryQueue
+
+
+def _response(status_code, **headers):
+    return SimpleNamespace(status_code=status_code, headers=headers, json=lambda: {})
+
+
+def _queue_for(statuses, **kwargs):
+    statuses = iter(statuses)
+    calls = []
+
+    def post(webhook, payload):
+        calls.append((webhook, payload))
+        return next(statuses)
+
+    return DeliveryQueue(post=post, backoff_base=0, **kwargs), calls
+
+
+def test_delivery_queue_retries_429_after_retry_after():
+    queue, calls = _queue_for([_response(429, **{"Retry-After": "0"}), _response(204)])
+
+    result = queue.submit("https://discord.test/a", {"content": "hi"}).result(timeout=5)
+    queue.close()
+
+    assert result.ok is True
+    assert result.attempts == 2
+    assert len(calls) == 2
+
+
+def test_delivery_queue_gives_up_after_max_attempts_on_5xx():
+    queue, calls = _queue_for([_response(503)] * 3, max_attempts=3)
+
+    result = queue.submit("https://discord.test/a", {"content": "hi"}).result(timeout=5)
+    queue.close()
+
+    assert (result.ok, result.status_code, result.attempts) == (False, 503, 3)
+
+
+def test_delivery_queue_does_not_retry_client_errors():
+    queue, calls = _queue_for([_response(400), _response(204)])
+
+    result = queue.submit("https://discord.test/a", {"content": "hi"}).result(timeout=5)
+    queue.close()
+
+    assert result.ok is False
+    assert len(calls) == 1
+
+
+def test_delivery_queue_keeps_per_webhook_order():
+    queue, calls = _queue_for([_response(204)] * 5)
+
+    futures = [queue.submit("https://discord.test/a", {"n": n}) for n in range(5)]
+    assert all(f.result(timeout=5).ok for f in futures)
+    queue.close()
+
+    assert [payload["n"] for _, payload in calls] == [0, 1, 2, 3, 4]
+
+
+def test_delivery_queue_retries_failed_connects_but_not_read_timeouts():
+    from requests.exceptions import ConnectTimeout, ReadTimeout
+
+    def raising(error):
+        def post(webhook, payload):
+            calls.append(payload)
+            if len(calls) == 1:
+                raise error
+            return _response(204)
+        return post
+
+    calls = []
+    queue = DeliveryQueue(post=raising(ConnectTimeout("connect timed out")), backoff_base=0)
+    assert queue.submit("https://discord.test/a", {"n": 1}).result(timeout=5).ok is True
+    queue.close()
+    assert len(calls) == 2
+
+    # Discord may have posted it before the read timed out: report a failure instead of re-posting
+    calls = []
+    queue = DeliveryQueue(post=raising(ReadTimeout("read timed out")), backoff_base=0)
+    result = queue.submit("https://discord.test/a", {"n": 1}).result(timeout=5)
+    queue.close()
+    assert (result.ok, result.status_code, result.attempts) == (False, None, 1)
+    assert len(calls) == 1
@@ -33,7 +33,7 @@ def test_send_to_discord_returns_true_on_204(monkeypatch):
         assert "content" in json
         return SimpleNamespace(status_code=204)
 
-    monkeypatch.setattr("PythonProject3.Helpers.Discord.requests.post", fake_post)
+    monkeypatch.setattr("PythonProject3.Helpers.Discord.get_session", lambda: SimpleNamespace(post=fake_post))
 
     ok = send_to_discord(
         "https://discord.test/webhook",
@@ -68,4 +68,54 @@ def test_try_send_failure_increments_failed(monkeypatch):
 
     assert should_save is False
     assert sent_count == 2
-    assert failed_count == 2
\ No newline at end of file
+    assert failed_count == 2
+
+def test_create_session_applies_defaults(monkeypatch):
+    from PythonProject3.Helpers.http_client import create_session
+
+    session = create_session(pool_size=7, retries=1, timeout=3, user_agent="TestAgent/1.0")
+    captured = {}
+
+    def fake_request(_self, method, url, **kwargs):
+        captured.update(kwargs, method=method, url=url)
+        return SimpleNamespace(status_code=200)
+
+    monkeypatch.setattr("requests.Session.request", fake_request)
+    session.get("https://example.com/feed")
+
+    assert captured["timeout"] == 3
+    assert session.headers["User-Agent"] == "TestAgent/1.0"
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.get_adapter("https://discord.com")._pool_maxsize == 7
+
+
+def test_chunk_embeds_respects_embed_count_and_character_limits():
+    from PythonProject3.Helpers.Discord import chunk_embeds
+
+    entries = [{"title": f"t{i}", "link": f"https://x/{i}", "date": "June 23, 2026"} for i in range(23)]
+    assert [len(chunk) for chunk in chunk_embeds(entries)] == [10, 10, 3]
+
+    long_entries = [{"title": "x" * 300, "link": "https://x", "date": "d" * 2000} for _ in range(5)]
+    chunks = chunk_embeds(long_entries)
+    assert all(sum(len(e["title"]) + len(e["description"]) for _, e in chunk) <= 6000 for chunk in chunks)
+    assert all(len(e["title"]) <= 256 for chunk in chunks for _, e in chunk)
+
+
+def test_try_send_batch_tracks_delivery_per_message(monkeypatch):
+    from PythonProject3.Helpers.Discord import try_send_batch
+
+    statuses = iter([204, 400])
+    posts = []
+
+    def fake_post(_webhook, json):
+        posts.append(json)
+        return SimpleNamespace(status_code=next(statuses))
+
+    monkeypatch.setattr("PythonProject3.Helpers.Discord.get_session", lambda: SimpleNamespace(post=fake_post))
+    articles = [{"title": f"t{i}", "link": f"https://x/{i}", "date": "June 23, 2026"} for i in range(12)]
+
+    delivered, sent_count, failed_count = try_send_batch("https://discord.test/webhook", articles, 0, 0, 10)
+
+    assert len(posts) == 2 and len(posts[0]["embeds"]) == 10
+    assert delivered == [True] * 10 + [False] * 2
+    assert (sent_count, failed_count) == (10, 2)
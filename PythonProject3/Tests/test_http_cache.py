@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from PythonProject3.Helpers.http_cache import ValidatorCache, conditional_get
+from PythonProject3.Helpers.seen import close_global_seen
+
+
+def _response(status_code, headers=None):
+    return SimpleNamespace(status_code=status_code, headers=headers or {}, raise_for_status=lambda: None)
+
+
+def test_validator_cache_persists_and_builds_conditional_headers(tmp_path):
+    path = tmp_path / "http_cache.json"
+    cache = ValidatorCache(str(path))
+    cache.remember("https://example.com/feed",
+                   _response(200, {"ETag": '"abc"', "Last-Modified": "Tue, 23 Jun 2026 08:00:00 GMT"}))
+
+    reloaded = ValidatorCache(str(path))
+
+    assert reloaded.headers_for("https://example.com/feed") == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 23 Jun 2026 08:00:00 GMT",
+    }
+    assert reloaded.headers_for("https://example.com/other") == {}
+
+
+def test_conditional_get_returns_none_on_304(tmp_path, monkeypatch):
+    cache = ValidatorCache(str(tmp_path / "http_cache.json"))
+    cache.remember("https://example.com/feed", _response(200, {"ETag": '"abc"'}))
+    sent_headers = {}
+
+    def fake_get(url, headers=None, **_kwargs):
+        sent_headers.update(headers)
+        return _response(304)
+
+    monkeypatch.setattr("PythonProject3.Helpers.http_cache.get_session", lambda: SimpleNamespace(get=fake_get))
+
+    assert conditional_get("https://example.com/feed", cache=cache) is None
+    assert sent_headers["If-None-Match"] == '"abc"'
+
+
+def test_conditional_get_skips_byte_identical_body_without_validators(tmp_path, monkeypatch):
+    cache = ValidatorCache(str(tmp_path / "http_cache.json"))
+    body = b"<html>same cards</html>"
+    page = SimpleNamespace(status_code=200, headers={}, content=body, raise_for_status=lambda: None)
+    cache.remember("https://example.com/news", page)
+    changed = SimpleNamespace(status_code=200, headers={}, content=body + b"!", raise_for_status=lambda: None)
+    responses = iter([page, changed])
+
+    monkeypatch.setattr("PythonProject3.Helpers.http_cache.get_session",
+                        lambda: SimpleNamespace(get=lambda url, headers=None, **kw: next(responses)))
+
+    assert conditional_get("https://example.com/news", cache=cache) is None
+    assert conditional_get("https://example.com/news", cache=cache) is changed
+
+
+def test_body_that_failed_to_parse_is_not_remembered(tmp_path, monkeypatch):
+    from PythonProject3.Cyber import HackingNews
+
+    cache = ValidatorCache(str(tmp_path / "http_cache.json"))
+    feeds = {"good": "https://feeds.test/good", "broken": "https://feeds.test/broken"}
+    # Neither feed sends validators, so only the body hash could short-circuit them
+    pages = {url: SimpleNamespace(status_code=200, headers={}, content=url.encode(), raise_for_status=lambda: None)
+             for url in feeds.values()}
+
+    def parse(content, source=None, watermark=None, fast=None):
+        if source == "broken":
+            raise ValueError("truncated feed")
+        return []
+
+    history = str(tmp_path / "news.txt")
+    monkeypatch.setattr(HackingNews, "hacking_rss_list", feeds)
+    monkeypatch.setattr(HackingNews, "parse_feed", parse)
+    monkeypatch.setattr(HackingNews.NewsFeed, "history_file", history)
+    monkeypatch.setattr(HackingNews, "get_cache", lambda: cache)
+    monkeypatch.setattr(HackingNews, "conditional_get", lambda url: conditional_get(url, cache=cache))
+    monkeypatch.setattr("PythonProject3.Helpers.http_cache.get_session",
+                        lambda: SimpleNamespace(get=lambda url, headers=None, **kw: pages[url]))
+
+    news = HackingNews.NewsFeed()
+    news.get_news()
+    assert news.save_to_file(history) == {"sent": 0, "failed": 0}
+
+    assert conditional_get(feeds["good"], cache=cache) is None
+    assert conditional_get(feeds["broken"], cache=cache) is pages[feeds["broken"]]
+    close_global_seen(history)
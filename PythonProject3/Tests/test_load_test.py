@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from PythonProject3.Benchmarks.load_test import run_load_test
+from PythonProject3.Benchmarks.replay import Cassette, ReplayAdapter
+from PythonProject3.Helpers.http_client import create_session
+
+
+def test_cassette_round_trip_and_replay_adapter(tmp_path):
+    cassette = Cassette()
+    cassette.add("https://news.test/feed", b"<rss/>", headers={"ETag": '"v1"'})
+    cassette.save(str(tmp_path))
+
+    session = create_session(retries=0)
+    adapter = ReplayAdapter(Cassette.load(str(tmp_path)))
+    session.mount("https://", adapter)
+
+    response = session.get("https://news.test/feed")
+    assert (response.status_code, response.content, response.headers["ETag"]) == (200, b"<rss/>", '"v1"')
+    assert session.get("https://news.test/other").status_code == 404
+    assert adapter.misses == ["https://news.test/other"]
+
+
+def test_load_test_delivers_every_article_exactly_once_despite_failures():
+    report = run_load_test(sources=3, articles=20, webhooks=2, batch_size=1, latency=0, jitter=0,
+                           rate_429=0.15, rate_5xx=0.15, retry_after=0.01, seed=7)
+
+    assert report["responses"].get("429") and report["responses"].get("502")
+    assert (report["duplicates"], report["missing"], report["unexpected"]) == (0, 0, 0)
+    assert report["replay_misses"] == 0
+    assert report["rounds"][-1]["failed"] == 0
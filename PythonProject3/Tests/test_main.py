@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+
+from PythonProject3.main import run_sources
+
+
+def test_run_sources_runs_sources_concurrently_and_keeps_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def make_runner(sent):
+        def runner():
+            # Deadlocks (and times out) unless all three run at the same time
+            barrier.wait()
+            return {"sent": sent, "failed": 0}
+        return runner
+
+    sources = {name: make_runner(i) for i, name in enumerate(["a", "b", "c"])}
+    results = run_sources(sources, max_workers=3)
+
+    assert list(results) == ["a", "b", "c"]
+    assert [r["sent"] for r in results.values()] == [0, 1, 2]
+
+
+def test_run_sources_reports_failed_source_without_stopping_others():
+    def boom():
+        raise RuntimeError("network down")
+
+    results = run_sources({"bad": boom, "good": lambda: {"sent": 1, "failed": 0}}, max_workers=1)
+
+    assert results == {"bad": {"sent": 0, "failed": 0}, "good": {"sent": 1, "failed": 0}}
+
+
+def test_registry_selects_by_name_or_alias_and_matches_parsers():
+    import pytest
+
+    from PythonProject3.Source.registry import REGISTRY, load, select
+
+    assert [s.name for s in select("apex, DEADLOCK")] == ["Apex", "Deadlock"]
+    assert [s.name for s in select(None, ["hacker", "lol"])] == ["ArcRaiders", "Apex", "Deadlock"]
+    with pytest.raises(KeyError):
+        select("fortnite")
+    for spec in REGISTRY.values():
+        if spec.kind == "game":
+            assert load(spec.target).history_file == spec.history_file
+
+
+def test_importing_main_loads_no_parser_or_network_modules():
+    import subprocess
+    import sys
+
+    code = ("import sys, PythonProject3.main; "
+            "print(sorted(m for m in ('bs4', 'feedparser', 'requests', 'dotenv', 'PythonProject3.Game.ApexNews') "
+            "if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "[]"
+
+
+def test_dry_run_lists_new_articles_without_sending_or_saving(tmp_path, monkeypatch, capsys):
+    from datetime import datetime
+
+    from PythonProject3.Game.ApexNews import ApexNews
+    from PythonProject3.main import run_game_source
+
+    today = datetime.now().strftime("%B %d, %Y")
+
+    class Page:
+        text = "<html></html>"
+
+    def fake_parse(parser, _html):
+        parser.news = [{"title": "Fresh", "link": "https://www.ea.com/news/fresh", "date": today}]
+        return parser.news
+
+    monkeypatch.setattr(ApexNews, "history_file", str(tmp_path / "apex_news.txt"))
+    monkeypatch.setattr("PythonProject3.Helpers.http_cache.conditional_get", lambda *a, **k: Page())
+    monkeypatch.setattr("PythonProject3.Helpers.parse_pool.parse_news", fake_parse)
+    monkeypatch.setattr("PythonProject3.Helpers.pagination.fetch_more_pages", lambda parser: parser.news)
+    monkeypatch.setattr("PythonProject3.Game.ApexNews.try_send", lambda *a: (_ for _ in ()).throw(AssertionError))
+
+    result = run_game_source("Apex Legends", "PythonProject3.Game.ApexNews:ApexNews", "apexNews", dry_run=True)
+
+    assert result == {"sent": 0, "failed": 0}
+    assert "Fresh <https://www.ea.com/news/fresh>" in capsys.readouterr().out
+    assert not (tmp_path / "apex_news.txt").exists()
+
+
+def test_failed_parse_does_not_cache_validators(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from PythonProject3.Game.ApexNews import ApexNews
+    from PythonProject3.Helpers.http_cache import ValidatorCache, set_cache
+    from PythonProject3.main import run_game_source
+
+    page = SimpleNamespace(text="<html></html>", content=b"<html></html>", headers={"ETag": '"v1"'})
+
+    def broken_parse(_parser, _html):
+        raise ValueError("unexpected markup")
+
+    cache = ValidatorCache(str(tmp_path / "http_cache.json"))
+    set_cache(cache)
+    monkeypatch.setattr(ApexNews, "history_file", str(tmp_path / "apex_news.txt"))
+    monkeypatch.setattr("PythonProject3.Helpers.http_cache.conditional_get", lambda *a, **k: page)
+    monkeypatch.setattr("PythonProject3.Helpers.parse_pool.parse_news", broken_parse)
+    try:
+        result = run_game_source("Apex Legends", "PythonProject3.Game.ApexNews:ApexNews", "apexNews")
+    finally:
+        set_cache(None)
+
+    assert result == {"sent": 0, "failed": 0}
+    # No 304 next run: the page is fetched and parsed again
+    assert cache.get(ApexNews().feed_url) == {}
+
+
+def test_compact_history_applies_retention_to_registry_files(tmp_path, monkeypatch, capsys):
+    from datetime import date, timedelta
+
+    from PythonProject3.Helpers.dedup import close_seen_store
+    from PythonProject3.Helpers.seen import close_global_seen
+    from PythonProject3.main import compact_history
+    from PythonProject3.Source.registry import select
+
+    recent = date.today() - timedelta(days=1)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("PythonProject3.Helpers.retention.RETENTION_DAYS", 30)
+    (tmp_path / "apex_news.txt").write_text(
+        "Title: Old\nLink: https://ea.test/old\nDate: January 01, 2020\n\n"
+        f"Title: New\nLink: https://ea.test/new\nDate: {recent:%B %d, %Y}\n\n", encoding="utf-8")
+
+    compact_history(select("apex"))
+    close_seen_store("apex_news.txt")
+    close_global_seen("apex_news.txt")
+
+    assert "apex_news.txt: archived 1 old entries" in capsys.readouterr().out
+    assert "Title: Old" not in (tmp_path / "apex_news.txt").read_text(encoding="utf-8")
+
+
+def test_run_source_indexes_recorded_articles_after_the_run(tmp_path):
+    from datetime import datetime
+
+    from PythonProject3.Helpers.history import save_articles
+    from PythonProject3.Helpers.search import SearchIndex, close_search_index, search_index_path
+    from PythonProject3.Helpers.seen import close_global_seen
+
+    today = datetime.now().strftime("%B %d, %Y")
+    history = str(tmp_path / "apex_news.txt")
+    articles = [{"title": "Arena returns", "link": "https://ea.test/a", "date": today}]
+    ok = lambda _w, _a, sent, failed: (True, sent + 1, failed)
+    # A separate connection only sees what has been flushed to the database
+    index = SearchIndex(search_index_path(history))
+
+    def runner():
+        result = save_articles(articles, history, "https://discord.test/apex", ok, source="Apex")
+        assert len(index) == 0  # saving only queued it
+        return result
+
+    assert run_sources({"Apex": runner}, max_workers=1) == {"Apex": {"sent": 1, "failed": 0}}
+    assert [hit.link for hit in index.search("arena")] == ["https://ea.test/a"]
+    index.close()
+    close_search_index(history)
+    close_global_seen(history)
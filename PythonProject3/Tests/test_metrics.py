@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+
+from PythonProject3.Helpers.metrics import Metrics
+
+
+def test_metrics_attribute_stages_and_counters_to_current_source(tmp_path):
+    metrics = Metrics()
+    with metrics.source("Apex"):
+        with metrics.timer("fetch"):
+            pass
+        metrics.incr("bytes_downloaded", 1500)
+        metrics.incr("discord_messages", labels={"status": 204})
+    metrics.observe("parse", 0.25, source="League")
+
+    snapshot = metrics.snapshot()["sources"]
+
+    assert snapshot["Apex"]["stages"]["fetch"]["count"] == 1
+    assert snapshot["Apex"]["counters"] == {"bytes_downloaded": 1500, "discord_messages{status=204}": 1}
+    assert snapshot["League"]["stages"]["parse"]["seconds"] == 0.25
+
+    json_path = tmp_path / "metrics.json"
+    metrics.write_json(str(json_path))
+    assert json.loads(json_path.read_text())["sources"]["Apex"]["counters"]["bytes_downloaded"] == 1500
+
+
+def test_metrics_prometheus_textfile_format(tmp_path):
+    metrics = Metrics()
+    metrics.observe("parse", 0.5, source="Deadlock")
+    metrics.incr("dedup_hits", 3, source="Deadlock")
+
+    prom_path = tmp_path / "news.prom"
+    metrics.write_prometheus(str(prom_path))
+    text = prom_path.read_text()
+
+    assert 'news_stage_seconds_sum{source="Deadlock",stage="parse"} 0.500000' in text
+    assert 'news_stage_seconds_count{source="Deadlock",stage="parse"} 1' in text
+    assert 'news_dedup_hits_total{source="Deadlock"} 3' in text
+    assert "# TYPE news_dedup_hits_total counter" in text
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+import pytest
+
+from PythonProject3.Helpers.article import Article
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.outbox import DEAD, Outbox
+from PythonProject3.Helpers.seen import close_global_seen
+
+WEBHOOKS = {"apexNews": "https://discord.test/apex", "devNews": "None"}
+
+
+def test_save_queues_and_records_without_touching_discord(tmp_path):
+    today = datetime.now().strftime("%B %d, %Y")
+    history = str(tmp_path / "apex_news.txt")
+    outbox = Outbox(str(tmp_path / "outbox.sqlite3"))
+    articles = [{"title": "A", "link": "https://ea.test/a", "date": today},
+                {"title": "B", "link": "https://ea.test/b", "date": today}]
+
+    def no_discord(*_args):
+        raise AssertionError("sent inline")
+
+    assert save_articles(articles, history, WEBHOOKS["apexNews"], no_discord, outbox=outbox) == {
+        "sent": 0, "failed": 0}
+    # Recorded straight away, so the next run doesn't queue them again
+    assert save_articles(articles, history, WEBHOOKS["apexNews"], no_discord, outbox=outbox) == {
+        "sent": 0, "failed": 0}
+    assert open(history, encoding="utf-8").read().count("Title: ") == 2
+    assert outbox.stats() == {"pending": 2, "dead": 0}
+
+    sent = []
+    result = outbox.drain(lambda url, batch: sent.extend((url, a.title) for a in batch) or [True] * len(batch),
+                          WEBHOOKS)
+    assert result == {"sent": 2, "failed": 0, "dead": 0}
+    assert sent == [("https://discord.test/apex", "A"), ("https://discord.test/apex", "B")]
+    assert len(outbox) == 0
+    close_global_seen(history)
+    outbox.close()
+
+
+def test_failures_back_off_across_drains_then_park_dead_and_requeue(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.sqlite3"), max_attempts=2, backoff_base=60, backoff_max=60)
+    outbox.enqueue({WEBHOOKS["apexNews"]: [Article("A", "https://ea.test/a", "today")]}, now=0)
+
+    down = lambda _url, batch: [False] * len(batch)
+    assert outbox.drain(down, WEBHOOKS, now=0) == {"sent": 0, "failed": 1, "dead": 0}
+    # Not due again until its backoff has passed (a later drain or another process)
+    assert outbox.drain(down, WEBHOOKS, now=0) == {"sent": 0, "failed": 0, "dead": 0}
+    assert outbox.drain(down, WEBHOOKS, now=float("inf")) == {"sent": 0, "failed": 1, "dead": 1}
+    assert outbox.entries(DEAD)[0]["last_error"] == "rejected by Discord"
+
+    assert outbox.requeue() == 1
+    up = lambda _url, batch: [True] * len(batch)
+    assert outbox.drain(up, WEBHOOKS) == {"sent": 1, "failed": 0, "dead": 0}
+    assert len(outbox) == 0
+    outbox.close()
+
+
+def test_rows_leased_by_an_interrupted_drain_all_come_due_again(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.sqlite3"), lease=300)
+    outbox.enqueue({WEBHOOKS["apexNews"]: [Article("A", "https://ea.test/a", "today")]})
+
+    def killed(_url, _batch):
+        raise KeyboardInterrupt  # the process dies mid-send; nothing is settled
+
+    with pytest.raises(KeyboardInterrupt):
+        outbox.drain(killed, WEBHOOKS, now=float("inf"))  # drain --all
+    assert outbox.entries()[0]["next_at"] < time.time() + 301
+
+    up = lambda _url, batch: [True] * len(batch)
+    assert outbox.drain(up, WEBHOOKS) == {"sent": 0, "failed": 0, "dead": 0}  # still leased
+    assert outbox.drain(up, WEBHOOKS, now=time.time() + 301) == {"sent": 1, "failed": 0, "dead": 0}
+    outbox.close()
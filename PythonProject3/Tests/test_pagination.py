@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from PythonProject3.Game.DeadlockNews import DeadlockNews
+from PythonProject3.Helpers.dedup import SeenStore
+from PythonProject3.Helpers.pagination import fetch_more_pages
+
+
+def _articles(page, today, seen_link=None):
+    items = [{"title": f"p{page}-{i}", "date": today, "link": f"https://steam.test/{page}/{i}"} for i in range(2)]
+    if seen_link:
+        items.append({"title": "old", "date": today, "link": seen_link})
+    return items
+
+
+def _parser(tmp_path, monkeypatch, pages):
+    fetched = []
+
+    def fake_fetch(_parser, page):
+        fetched.append(page)
+        return pages[page]
+
+    monkeypatch.setattr("PythonProject3.Helpers.pagination._fetch_page", fake_fetch)
+    parser = DeadlockNews()
+    parser.history_file = str(tmp_path / "deadlock_news.txt")
+    parser.news = pages[1]
+    return parser, fetched
+
+
+def test_fetch_more_pages_skips_extra_requests_when_page_one_has_seen_items(tmp_path, monkeypatch):
+    today = datetime.now().strftime("%B %d, %Y")
+    store = SeenStore(str(tmp_path / "deadlock_news.txt"))
+    store.add("https://steam.test/seen")
+    parser, fetched = _parser(tmp_path, monkeypatch, {1: _articles(1, today, "https://steam.test/seen")})
+
+    assert fetch_more_pages(parser, max_pages=5, store=store) == parser.news
+    assert fetched == []
+    store.close()
+
+
+def test_fetch_more_pages_merges_until_first_page_with_seen_items(tmp_path, monkeypatch):
+    today = datetime.now().strftime("%B %d, %Y")
+    store = SeenStore(str(tmp_path / "deadlock_news.txt"))
+    store.add("https://steam.test/seen")
+    pages = {
+        1: _articles(1, today),
+        2: _articles(2, today, "https://steam.test/seen"),
+        3: _articles(3, today),
+    }
+    parser, fetched = _parser(tmp_path, monkeypatch, pages)
+
+    merged = fetch_more_pages(parser, max_pages=3, store=store)
+
+    assert [a["title"] for a in merged] == ["p1-0", "p1-1", "p2-0", "p2-1", "old"]
+    assert parser.news == merged
+    store.close()
+
+
+def test_fetched_pages_are_counted_under_the_running_source(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from PythonProject3.Helpers.metrics import Metrics
+
+    today = datetime.now().strftime("%B %d, %Y")
+    metrics = Metrics()
+    page = SimpleNamespace(content=b"<html>page</html>", text="<html>page</html>", raise_for_status=lambda: None)
+    monkeypatch.setattr("PythonProject3.Helpers.pagination.metrics", metrics)
+    monkeypatch.setattr("PythonProject3.Helpers.pagination.get_session",
+                        lambda: SimpleNamespace(get=lambda url: page))
+    monkeypatch.setattr("PythonProject3.Helpers.pagination.parse_news",
+                        lambda parser, html: _articles(2, today))
+    store = SeenStore(str(tmp_path / "deadlock_news.txt"))
+    parser = DeadlockNews()
+    parser.history_file = str(tmp_path / "deadlock_news.txt")
+    parser.news = _articles(1, today)
+
+    with metrics.source("Deadlock"):
+        fetch_more_pages(parser, max_pages=3, store=store)
+
+    sources = metrics.snapshot()["sources"]
+    assert set(sources) == {"Deadlock"}
+    assert sources["Deadlock"]["counters"]["bytes_downloaded"] == 2 * len(page.content)
+    assert sources["Deadlock"]["stages"]["fetch"]["count"] == 2
+    store.close()
+
+
+def test_deadlock_page_urls():
+    parser = DeadlockNews()
+    assert parser.page_url(1) == parser.base_url
+    assert parser.page_url(3) == f"{parser.base_url}?p=3"
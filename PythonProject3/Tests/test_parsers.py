@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from datetime import date
+
+import pytest
+
 from PythonProject3.Game.ApexNews import ApexNews
 from PythonProject3.Game.DeadlockNews import DeadlockNews, _parse_date
 from PythonProject3.Game.GamingNews import ArcRaidersNews
@@ -61,13 +65,41 @@ def test_apex_parser_requires_news_link_title_and_date():
     items = parser.get_news(html)
 
     assert len(items) == 1
-    assert items[0] == {
+    assert {key: value for key, value in items[0].items() if key != "published"} == {
         "title": "Season Update",
         "date": "June 23, 2026",
         "link": "https://www.ea.com/games/apex-legends/apex-legends/news/season-update",
     }
 
 
+def test_parsers_emit_published_date_next_to_display_date():
+    html = """
+    <html><body>
+      <a href="/games/apex-legends/apex-legends/news/season-update">
+        <h3>Season Update</h3>
+        <span>Published June 23, 2026</span>
+      </a>
+      <a data-testid="articlefeaturedcard-component" href="/en-us/news/game-updates/patch-14-2-notes/">
+        <div data-testid="card-title">Patch 14.2 Notes</div>
+        <time datetime="2026-06-22T23:30:00Z">ignored text</time>
+      </a>
+    </body></html>
+    """
+
+    apex = ApexNews().get_news(html)
+    league = LeagueNews().get_news(html)
+
+    assert (apex[0]["date"], apex[0].published) == ("June 23, 2026", date(2026, 6, 23))
+    assert (league[0]["date"], league[0].published) == ("June 22, 2026", date(2026, 6, 22))
+    assert DeadlockNews().get_news("""
+    <div class="apphub_PostSummaryFull">
+      <a class="apphub_CardContentPreviewImageLink" href="/view/1"></a>
+      <div class="apphub_CardContentTitle">Hotfix</div>
+      <div class="apphub_PostSummaryDate">Yesterday</div>
+    </div>
+    """)[0].published is None
+
+
 def test_deadlock_parser_extracts_title_date_and_link():
     html = """
     <div class="apphub_PostSummaryFull">
@@ -92,4 +124,62 @@ def test_parse_date_normalizes_supported_formats():
 
 
 def test_parse_date_returns_original_when_unknown_format():
-    assert _parse_date("Yesterday") == "Yesterday"
\ No newline at end of file
+    assert _parse_date("Yesterday") == "Yesterday"
+
+
+def test_parsers_give_identical_output_across_html_backends(monkeypatch):
+    pytest.importorskip("lxml")
+    page = """
+    <html><head><title>News</title><script>var x = "<a href='/news/fake'>";</script></head><body>
+      <nav><a href="/news/">News index</a></nav>
+      <a class="news-article-card_container__xsniv" href="/news/update-1">
+        <div class="news-article-card_title__7LpPs">Update 1</div>
+        <div class="news-article-card_date__fJqI_">June 23, 2026</div>
+      </a>
+      <a data-testid="articlefeaturedcard-component" href="/en-us/news/game-updates/patch-14-2-notes/">
+        <div data-testid="card-title">Patch 14.2 Notes</div>
+        <time datetime="2026-06-23T10:00:00Z">ignored text</time>
+      </a>
+      <a href="/games/apex-legends/apex-legends/news/season-update">
+        <img src="x.png"><span>News</span><span>June 23, 2026</span><h3>Season Update</h3>
+      </a>
+      <div class="apphub_PostSummaryFull other">
+        <a class="apphub_CardContentPreviewImageLink big" href="https://store.steampowered.com/news/app/1422450/view/123"></a>
+        <div class="apphub_CardContentTitle">Hotfix</div>
+        <div class="apphub_PostSummaryDate">Jun 23, 2026</div>
+      </div>
+    </body></html>
+    """
+
+    def run_all():
+        return [cls().get_news(page) for cls in (ArcRaidersNews, LeagueNews, ApexNews, DeadlockNews)]
+
+    monkeypatch.setattr("PythonProject3.Helpers.soup.HTML_PARSER", "html.parser")
+    reference = run_all()
+    monkeypatch.setattr("PythonProject3.Helpers.soup.HTML_PARSER", "lxml")
+
+    assert run_all() == reference
+    assert all(len(items) == 1 for items in reference)
+
+
+def test_parse_news_in_worker_process_matches_in_process_parse():
+    from PythonProject3.Helpers.parse_pool import parse_news, shutdown_parse_pool
+
+    html = """
+    <div class="apphub_PostSummaryFull">
+      <a class="apphub_CardContentPreviewImageLink" href="/view/123"></a>
+      <div class="apphub_CardContentTitle">Hotfix</div>
+      <div class="apphub_PostSummaryDate">Jun 23, 2026</div>
+    </div>
+    """
+    parser = DeadlockNews()
+    parser.base_url = "https://steamcommunity.com/app/1422450"
+
+    try:
+        items = parse_news(parser, html, workers=1)
+    finally:
+        shutdown_parse_pool()
+
+    assert items == DeadlockNews.get_news(parser, html)
+    assert parser.news == items
+    assert items[0]["link"] == "https://steamcommunity.com/app/1422450/view/123"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import gzip
+from datetime import date, datetime
+
+from PythonProject3.Helpers.dedup import close_seen_store, open_seen_store
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.retention import compact, read_records
+
+
+def _entry(heading, day, n):
+    return f"{heading}:\nTitle: Post {n}\nLink: https://example.com/{n}\nDate: {day:%B %d, %Y}\n\n"
+
+
+def test_compact_archives_old_entries_and_keeps_window(tmp_path):
+    history = tmp_path / "apex_news.txt"
+    history.write_text(
+        _entry("ApexNews_latest", date(2026, 1, 1), 1)
+        + _entry("ApexNews_latest", date(2026, 6, 20), 2)
+        + _entry("ApexNews_latest", date(2026, 6, 23), 3),
+        encoding="utf-8",
+    )
+
+    result = compact(str(history), keep_days=7, today=date(2026, 6, 23))
+
+    assert result["kept"] == 2 and result["archived"] == 1
+    assert history.read_text(encoding="utf-8") == (
+        _entry("ApexNews_latest", date(2026, 6, 20), 2) + _entry("ApexNews_latest", date(2026, 6, 23), 3)
+    )
+    with gzip.open(result["archive"], "rt", encoding="utf-8") as gz:
+        assert gz.read() == _entry("ApexNews_latest", date(2026, 1, 1), 1)
+
+
+def test_compact_drops_empty_section_headers(tmp_path):
+    history = tmp_path / "news.txt"
+    history.write_bytes(
+        b"\r\n\r\nbleepingcomputer:\r\n\r\n\r\nTheHackerNews_home:\r\n"
+        b"Title: Kept\r\nLink: https://example.com/kept\r\nDate: Tue, 23 Jun 2026 08:00:00 +0000\r\n\r\n"
+        b"\r\n\r\nbleepingcomputer:\r\n"
+    )
+
+    result = compact(str(history), keep_entries=10, archive=False, today=date(2026, 6, 23))
+
+    assert result == {"kept": 1, "archived": 0, "archive": None}
+    assert history.read_text(encoding="utf-8") == (
+        "\n\nTheHackerNews_home:\n"
+        "Title: Kept\nLink: https://example.com/kept\nDate: Tue, 23 Jun 2026 08:00:00 +0000\n\n"
+    )
+    records, grouped = read_records(str(history))
+    assert grouped is False and records[0].heading == "TheHackerNews_home"
+
+
+def test_compact_prunes_dedup_index_to_newest_entries(tmp_path):
+    history = tmp_path / "league_news.txt"
+    history.write_text("", encoding="utf-8")
+    store = open_seen_store(str(history))
+    for n in range(5):
+        store.add(f"https://example.com/{n}")
+
+    compact(str(history), keep_entries=2, archive=False)
+
+    assert len(store) == 2
+    assert "https://example.com/4" in store and "https://example.com/0" not in store
+    close_seen_store(str(history))
+
+
+def test_save_articles_writes_no_heading_when_nothing_is_saved(tmp_path):
+    history = tmp_path / "news.txt"
+    today = datetime.now().strftime("%B %d, %Y")
+
+    save_articles([], str(history), heading="bleepingcomputer")
+    assert history.read_text(encoding="utf-8") == ""
+
+    save_articles([{"title": "New", "link": "https://example.com/new", "date": today}],
+                  str(history), heading="bleepingcomputer")
+    assert history.read_text(encoding="utf-8").startswith("\n\nbleepingcomputer:\nTitle: New\n")
+    close_seen_store(str(history))
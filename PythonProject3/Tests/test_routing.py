@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.seen import close_global_seen
+from PythonProject3.Source.routing import DEFAULT_RULES, Router, Rule, parse_rules
+
+WEBHOOKS = {"hackerNews": "https://discord.test/sec", "devNews": "https://discord.test/dev",
+            "apexNews": "https://discord.test/apex", "leagueNews": "None"}
+
+
+def test_parse_rules_reads_destinations_sources_and_keywords():
+    assert parse_rules("devNews:HackerNews:cve|exploit; leagueNews:*:") == [
+        Rule("devNews", ("HackerNews",), ("cve", "exploit")),
+        Rule("leagueNews", (), ()),
+    ]
+
+
+def test_router_matches_whole_keywords_for_listed_sources_only():
+    rules = [Rule("devNews", ("HackerNews",), ("CVE", "npm")), Rule("leagueNews")]
+    router = Router("HackerNews", "hackerNews", rules, WEBHOOKS)
+
+    assert router.destinations({"title": "Critical CVE-2026-1234 in OpenSSH"}) == [
+        "https://discord.test/sec", "https://discord.test/dev"]
+    assert router.destinations({"title": "Ransomware hits hospitals (snpm)"}) == ["https://discord.test/sec"]
+    # leagueNews isn't configured, so it never becomes a destination
+    assert Router("Apex", "apexNews", rules, WEBHOOKS).destinations({"title": "CVE"}) == [
+        "https://discord.test/apex"]
+
+
+def test_default_rules_are_opt_in_and_only_route_developer_security_stories(monkeypatch):
+    monkeypatch.delenv("NEWS_ROUTES", raising=False)
+    monkeypatch.setattr("PythonProject3.Source.routing.DEFAULT_ROUTES", False)
+    assert Router("HackerNews", "hackerNews", webhooks=WEBHOOKS).destinations(
+        {"title": "Malicious npm packages steal tokens"}) == ["https://discord.test/sec"]
+
+    monkeypatch.setattr("PythonProject3.Source.routing.DEFAULT_ROUTES", True)
+    router = Router("HackerNews", "hackerNews", webhooks=WEBHOOKS)
+    assert router.destinations({"title": "Malicious npm packages steal tokens"}) == [
+        "https://discord.test/sec", "https://discord.test/dev"]
+    for title in ("New Linux API for Java library packages", "Python framework patches RCE bug"):
+        assert router.destinations({"title": title}) == ["https://discord.test/sec"]
+    assert Router("Apex", "apexNews", DEFAULT_RULES, WEBHOOKS).destinations({"title": "GitHub outage"}) == [
+        "https://discord.test/apex"]
+
+
+def test_fan_out_delivers_concurrently_and_retries_only_failed_channel(tmp_path):
+    today = datetime.now().strftime("%B %d, %Y")
+    history = str(tmp_path / "news.txt")
+    router = Router("HackerNews", "hackerNews", [Rule("devNews", ("HackerNews",), ("CVE",))], WEBHOOKS)
+    articles = [{"title": "New CVE in npm", "link": "https://example.com/cve", "date": today},
+                {"title": "Phishing wave", "link": "https://example.com/phish", "date": today}]
+    both_channels = threading.Barrier(2, timeout=5)
+    calls = []
+    dev_up = False
+
+    def send(webhook, article, s, f):
+        calls.append((webhook, article["link"]))
+        if article["link"].endswith("cve"):
+            both_channels.wait()  # times out unless both webhooks are served at once
+        if webhook.endswith("dev") and not dev_up:
+            return False, s, f + 1
+        return True, s + 1, f
+
+    assert save_articles(articles, history, router, send) == {"sent": 2, "failed": 1}
+    saved = (tmp_path / "news.txt").read_text(encoding="utf-8")
+    assert "example.com/phish" in saved and "example.com/cve" not in saved
+
+    calls.clear()
+    dev_up = True
+    both_channels = threading.Barrier(1)
+    assert save_articles(articles, history, router, send) == {"sent": 1, "failed": 0}
+    assert calls == [("https://discord.test/dev", "https://example.com/cve")]
+    assert "example.com/cve" in (tmp_path / "news.txt").read_text(encoding="utf-8")
+    close_global_seen(history)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import date
+
+from PythonProject3.Cyber.HackingNews import parse_feed
+from PythonProject3.Helpers.rss import extract_entries
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>
+<title>Feed</title><link>https://example.com/</link>
+<item><title> Patch &amp; pray </title><link>https://example.com/a</link>
+<description><![CDATA[<p>body</p>]]></description><pubDate>Tue, 23 Jun 2026 08:00:00 +0000</pubDate></item>
+<item><title>Second</title><link>https://example.com/b</link><pubDate>Mon, 22 Jun 2026 10:30:00 GMT</pubDate></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>
+<entry><title>Atom post</title><link rel="edit" href="https://example.com/edit/1"/>
+<link href="https://example.com/atom/1"/><updated>2026-06-24T09:00:00Z</updated>
+<published>2026-06-23T09:00:00Z</published></entry>
+</feed>"""
+
+
+def test_fast_path_matches_feedparser_for_rss_and_atom():
+    for feed in (RSS, ATOM):
+        assert parse_feed(feed, fast=True) == parse_feed(feed, fast=False)
+
+    assert [e["title"] for e in parse_feed(RSS)] == ["Patch & pray", "Second"]
+    assert parse_feed(ATOM)[0]["link"] == "https://example.com/atom/1"
+    assert parse_feed(ATOM)[0].published == date(2026, 6, 23)
+
+
+def test_extract_entries_falls_back_to_feedparser_on_malformed_feeds():
+    broken = RSS.replace(b"</channel>", b"&nbsp;</channel>")
+
+    entries = parse_feed(broken)
+
+    assert [e["link"] for e in entries] == ["https://example.com/a", "https://example.com/b"]
+    try:
+        extract_entries(b"<html><body>not a feed</body></html>")
+    except ValueError as e:
+        assert "not a feed" in str(e)
+    else:
+        raise AssertionError("expected the fast path to reject HTML")
+
+
+def test_preview_skips_entries_without_a_parseable_date(tmp_path):
+    from datetime import datetime
+
+    from PythonProject3.Cyber.HackingNews import NewsFeed
+    from PythonProject3.Helpers.seen import close_global_seen
+
+    now = datetime.now().astimezone().strftime("%a, %d %b %Y %H:%M:%S %z")
+    feed = RSS.replace(b"Tue, 23 Jun 2026 08:00:00 +0000", now.encode()).replace(
+        b"Mon, 22 Jun 2026 10:30:00 GMT", b"sometime soon")
+    history = str(tmp_path / "news.txt")
+    news = NewsFeed()
+    news.news = {"Feed": parse_feed(feed, source="Feed")}
+
+    preview = news.preview(history)
+
+    assert [article["link"] for article in preview["Feed"]] == ["https://example.com/a"]
+    close_global_seen(history)
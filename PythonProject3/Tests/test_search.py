@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import gzip
+from datetime import date, datetime
+
+import pytest
+
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.search import QueryError, SearchIndex, close_search_index, open_search_index
+from PythonProject3.Helpers.seen import close_global_seen
+
+
+def _article(title, day, n):
+    return {"title": title, "link": f"https://news.test/{n}", "date": day.strftime("%B %d, %Y")}
+
+
+def test_boolean_prefix_source_and_date_queries(tmp_path):
+    index = SearchIndex(str(tmp_path / "search_index.sqlite3"))
+    index.add([_article("Patch notes: ranked changes", date(2026, 5, 2), 1),
+               _article("Ranked season rewards", date(2026, 6, 10), 2)], source="Apex")
+    index.add([_article("Patch 25.12 notes", date(2026, 6, 11), 3),
+               _article("Ranked split begins", date(2026, 6, 12), 4)], source="League")
+    # Already indexed links are skipped
+    assert index.add([_article("Patch notes: ranked changes", date(2026, 5, 2), 1)], source="Apex") == 0
+
+    titles = lambda query, **kwargs: [hit.title for hit in index.search(query, **kwargs)]
+    assert titles("ranked") == ["Ranked split begins", "Ranked season rewards", "Patch notes: ranked changes"]
+    assert titles("patch notes") == ["Patch 25.12 notes", "Patch notes: ranked changes"]
+    assert titles("ranked -patch source:apex") == ["Ranked season rewards"]
+    assert titles("(season OR split) AND NOT source:league") == ["Ranked season rewards"]
+    assert titles("reward*") == ["Ranked season rewards"]
+    assert titles("date:2026-06 patch") == ["Patch 25.12 notes"]
+    assert titles("", since="2026-06-11", until=date(2026, 6, 11)) == ["Patch 25.12 notes"]
+    assert titles("NOT ranked") == ["Patch 25.12 notes"]
+    assert index.search("ranked", limit=1)[0].published == date(2026, 6, 12)
+    with pytest.raises(QueryError):
+        index.search("(ranked")
+    index.close()
+
+
+def test_save_indexes_recorded_articles(tmp_path):
+    today = datetime.now().strftime("%B %d, %Y")
+    history = str(tmp_path / "apex_news.txt")
+    articles = [{"title": "Legend balance update", "link": "https://ea.test/a", "date": today},
+                {"title": "Arena mode returns", "link": "https://ea.test/b", "date": today}]
+    ok = lambda _w, _a, sent, failed: (True, sent + 1, failed)
+
+    save_articles(articles, history, "https://discord.test/apex", ok, source="Apex")
+    save_articles(articles, history, "https://discord.test/apex", ok, source="Apex")
+
+    index = open_search_index(history)
+    # Saving only queues them; the run's flush indexes both saves in one batch
+    assert index.flush() == 2
+    assert len(index) == 2
+    assert [hit.link for hit in index.search("source:apex balance")] == ["https://ea.test/a"]
+    close_search_index(history)
+    close_global_seen(history)
+
+
+def test_rebuild_reads_history_files_and_archives(tmp_path):
+    current = tmp_path / "apex_news.txt"
+    current.write_text("Title: Arena returns\nLink: https://ea.test/new\nDate: June 12, 2026\n\n", encoding="utf-8")
+    archive = tmp_path / "apex_news.2025.txt.gz"
+    with gzip.open(archive, "wt", encoding="utf-8") as f:
+        f.write("Title: Arena launches\nLink: https://ea.test/old\nDate: May 07, 2025\n\n")
+    feed = tmp_path / "news.txt"
+    feed.write_text("TheHackerNews_home:\nTitle: Arena exploit\nLink: https://thn.test/1\nDate: June 01, 2026\n\n",
+                    encoding="utf-8")
+
+    index = SearchIndex(str(tmp_path / "search_index.sqlite3"))
+    index.add([_article("Stale entry", date(2024, 1, 1), 9)])
+    assert index.rebuild([str(current), str(archive), str(feed)]) == 3
+
+    hits = index.search("arena")
+    assert [(hit.link, hit.source) for hit in hits] == [
+        ("https://ea.test/new", "Apex"), ("https://thn.test/1", "TheHackerNews_home"), ("https://ea.test/old", "Apex")]
+    assert [hit.link for hit in index.search("arena source:thehackernews")] == ["https://thn.test/1"]
+    assert index.search("stale") == []
+    index.close()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.seen import GlobalSeen, close_global_seen, open_global_seen
+from PythonProject3.Helpers.urls import canonical_url
+
+
+def test_canonical_url_drops_tracking_scheme_and_trailing_slash():
+    expected = "https://bleepingcomputer.com/news/security/story?id=7&page=2"
+
+    assert canonical_url("http://www.BleepingComputer.com:80/news//security/story/"
+                         "?page=2&utm_source=rss&id=7&fbclid=abc#comments") == expected
+    assert canonical_url("https://bleepingcomputer.com/news/security/story?id=7&page=2") == expected
+    assert canonical_url("https://example.com:8443/a/") == "https://example.com:8443/a"
+    assert canonical_url("mailto:someone@example.com") == "mailto:someone@example.com"
+
+
+def test_global_seen_persists_and_rebuilds_bloom(tmp_path):
+    path = str(tmp_path / "seen_urls.sqlite3")
+    seen = GlobalSeen(path, capacity=4)
+
+    assert seen.claim("hook-a", "https://example.com/story/?utm_medium=x") is True
+    assert seen.claim("hook-a", "http://www.example.com/story") is False
+    assert seen.claim("hook-b", "https://example.com/story") is True
+    for n in range(10):  # grows past the filter's capacity
+        seen.claim("hook-a", f"https://example.com/{n}")
+    seen.release("hook-b", "https://example.com/story")
+    seen.close()
+
+    reopened = GlobalSeen(path, capacity=4)
+    assert ("hook-a", "https://example.com/story") in reopened
+    assert ("hook-a", "https://example.com/9") in reopened
+    assert ("hook-b", "https://example.com/story") not in reopened
+    assert len(reopened) == 11
+    reopened.close()
+
+
+def test_same_story_from_two_sources_is_posted_once_per_webhook(tmp_path):
+    today = datetime.now().strftime("%B %d, %Y")
+    calls = []
+
+    def send(webhook, article, s, f):
+        calls.append((webhook, article["link"]))
+        return True, s + 1, f
+
+    first = [{"title": "Story", "link": "https://example.com/story?utm_source=bleeping", "date": today}]
+    second = [{"title": "Story!", "link": "http://www.example.com/story/", "date": today}]
+
+    assert save_articles(first, str(tmp_path / "news.txt"), "hook-a", send) == {"sent": 1, "failed": 0}
+    assert save_articles(second, str(tmp_path / "apex_news.txt"), "hook-a", send) == {"sent": 0, "failed": 0}
+    assert save_articles(second, str(tmp_path / "league_news.txt"), "hook-b", send) == {"sent": 1, "failed": 0}
+    assert [hook for hook, _ in calls] == ["hook-a", "hook-b"]
+    close_global_seen(str(tmp_path / "news.txt"))
+
+
+def test_failed_delivery_releases_the_global_claim(tmp_path):
+    today = datetime.now().strftime("%B %d, %Y")
+    article = {"title": "Retry me", "link": "https://example.com/retry", "date": today}
+    history = str(tmp_path / "deadlock_news.txt")
+
+    save_articles([article], history, "hook", lambda _w, _a, s, f: (False, s, f + 1))
+
+    assert ("hook", "https://example.com/retry") not in open_global_seen(history)
+    close_global_seen(history)
+
+
+def test_claim_many_reports_each_link_once(tmp_path):
+    seen = GlobalSeen(str(tmp_path / "seen_urls.sqlite3"))
+    seen.claim("hook", "https://example.com/old")
+
+    results = seen.claim_many("hook", ["https://example.com/new", "https://example.com/old",
+                                       "http://example.com/new/", "https://example.com/other"])
+
+    assert results == [True, False, False, True]
+    assert len(seen) == 3
+    seen.release_many("hook", ["https://example.com/new", "https://example.com/other"])
+    assert len(seen) == 1
+    seen.close()
+
+
+def test_stored_bloom_filter_keeps_its_sizing_when_the_config_changes(tmp_path):
+    path = str(tmp_path / "seen_urls.sqlite3")
+    seen = GlobalSeen(path, capacity=1000, error_rate=0.001)
+    links = [f"https://example.com/{n}" for n in range(50)]
+    seen.claim_many("hook", links)
+    seen.close()
+
+    # Reopened under a different NEWS_BLOOM_ERROR_RATE: the stored bits are read with their own hash count
+    reopened = GlobalSeen(path, capacity=1000, error_rate=0.2)
+    assert reopened._bloom.params == (1000, 0.001, *seen._bloom.params[2:])
+    assert all(("hook", link) in reopened for link in links)
+    assert reopened.claim_many("hook", links[:2] + ["https://example.com/new"]) == [False, False, True]
+    reopened.close()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from PythonProject3.Game.LeagueNews import LeagueNews
+from PythonProject3.Helpers.dates import format_date
+from PythonProject3.Helpers.dedup import SeenStore
+from PythonProject3.Helpers.history import save_articles
+from PythonProject3.Helpers.seen import close_global_seen
+from PythonProject3.Helpers.watermark import Watermark, window_start
+
+
+def _card(i, day):
+    return (f'<a data-testid="articlefeaturedcard-component" href="/en-us/news/{i}/">'
+            f'<div data-testid="card-title">Patch {i}</div><time datetime="{day.isoformat()}T10:00:00Z"></time></a>')
+
+
+def test_window_reaches_back_to_mark_after_downtime_but_not_past_the_cap():
+    today = date(2026, 10, 18)
+    assert window_start(None, today) == date(2026, 10, 17)
+    assert window_start(Watermark(date(2026, 10, 14), "x"), today) == date(2026, 10, 14)
+    assert window_start(Watermark(date(2026, 1, 1), "x"), today) == date(2026, 10, 11)
+
+
+def test_mark_advances_only_after_a_clean_run_and_widens_the_window(tmp_path):
+    history = str(tmp_path / "league_news.txt")
+    store = SeenStore(history)
+    today = date.today()
+    outage = [{"title": "Old", "link": "https://lol.test/old", "date": format_date(today - timedelta(days=4))}]
+
+    # No mark yet: four days ago is outside the default one-day lookback
+    assert save_articles(outage, history, "https://discord.test/hook", lambda *a: (True, 1, 0),
+                         store=store, source="League") == {"sent": 0, "failed": 0}
+
+    store.advance_watermark("League", today - timedelta(days=5), "https://lol.test/older")
+    latest = [{"title": "New", "link": "https://lol.test/new", "date": format_date(today)}, *outage]
+    result = save_articles(latest, history, "https://discord.test/hook",
+                           lambda w, a, s, f: (a["title"] == "New", s + (a["title"] == "New"), f + (a["title"] != "New")),
+                           store=store, source="League")
+    assert result == {"sent": 1, "failed": 1}
+    assert store.watermark("League").link == "https://lol.test/older"
+
+    assert save_articles(latest, history, "https://discord.test/hook", lambda w, a, s, f: (True, s + 1, f),
+                         store=store, source="League") == {"sent": 1, "failed": 0}
+    assert store.watermark("League") == Watermark(today - timedelta(days=4), "https://lol.test/old")
+    close_global_seen(history)
+    store.close()
+
+
+def test_parser_stops_walking_at_the_mark():
+    today = date.today()
+    html = "".join(_card(i, today - timedelta(days=i // 2)) for i in range(10))
+    parser = LeagueNews()
+    assert len(parser.get_news(html)) == 10
+
+    parser.watermark = Watermark(today - timedelta(days=1), f"{parser.base_url}/en-us/news/3/")
+    assert [a.title for a in parser.get_news(html)] == ["Patch 0", "Patch 1", "Patch 2", "Patch 3"]
+
+    # A mark that dropped off the page: stop after a few articles older than the window
+    parser.watermark = Watermark(today - timedelta(days=1), "https://gone.test/")
+    assert len(parser.get_news(html)) == 4 + 3
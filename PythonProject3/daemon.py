@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+import random
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PythonProject3.Helpers.delivery import set_delivery_queue
+from PythonProject3.Helpers.outbox import drain_outbox, get_outbox
+from PythonProject3.Helpers.parse_pool import shutdown_parse_pool
+from PythonProject3.main import DEFAULT_MAX_WORKERS, SOURCES, compact_history, export_metrics, run_source
+
+# Seconds between polls of each source.  RSS feeds are cheap and fast moving,
+# the game pages change a few times a week.  Override with e.g.
+# NEWS_POLL_INTERVALS="HackerNews=120,Deadlock=900".
+DEFAULT_INTERVALS = {
+    'HackerNews': 120,
+    'ArcRaiders': 600,
+    'League': 600,
+    'Apex': 600,
+    'Deadlock': 600,
+}
+DEFAULT_INTERVAL = 600
+# Each interval is randomised by +/- this fraction so polls don't line up.
+DEFAULT_JITTER = float(os.getenv("NEWS_POLL_JITTER", "0.1"))
+# Seconds between retention passes over the history files (see Helpers/retention.py).
+COMPACT_INTERVAL = float(os.getenv("NEWS_COMPACT_INTERVAL", "86400"))
+# Seconds between outbox drains when NEWS_OUTBOX is set (see Helpers/outbox.py).
+OUTBOX_INTERVAL = float(os.getenv("NEWS_OUTBOX_INTERVAL", "10"))
+
+
+def parse_intervals(value: str | None) -> dict[str, float]:
+    """Parse "Name=seconds,Name=seconds" into a dict."""
+    intervals = {}
+    for item in (value or '').split(','):
+        name, _, seconds = item.partition('=')
+        if name.strip() and seconds.strip():
+            intervals[name.strip()] = float(seconds)
+    return intervals
+
+
+class NewsDaemon:
+    """
+    Long-running poller that keeps sessions, caches and dedup indexes warm.
+
+    Every source runs on its own jittered interval on a shared thread pool.
+    If a source is still running when it comes due again the new run is
+    skipped rather than stacked.  SIGTERM/SIGINT stop scheduling, let
+    in-flight runs finish and then return from ``run``.
+    """
+
+    def __init__(self, sources=None, intervals=None, jitter: float = DEFAULT_JITTER, max_workers=None):
+        self.sources = SOURCES if sources is None else sources
+        configured = {**DEFAULT_INTERVALS, **parse_intervals(os.getenv("NEWS_POLL_INTERVALS")), **(intervals or {})}
+        self.intervals = {name: float(configured.get(name, DEFAULT_INTERVAL)) for name in self.sources}
+        self.jitter = max(0.0, min(jitter, 0.9))
+        self.max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+        self._stop = threading.Event()
+        self._running = {}
+        self._next_run = {}
+        self._next_compact = 0.0
+        self._next_drain = 0.0
+        self._draining = None
+        self.runs = {name: 0 for name in self.sources}
+        self.skipped = {name: 0 for name in self.sources}
+
+    def _interval(self, name: str) -> float:
+        interval = self.intervals[name]
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _finished(self, name, future):
+        result = future.result()
+        self.runs[name] += 1
+        print(f"{name}: Sent {result['sent']}, Failed: {result['failed']}")
+        try:
+            export_metrics()
+        except OSError as e:
+            print(f"Failed to write metrics: {e}")
+
+    def _poll_due(self, pool, now: float):
+        for name, runner in self.sources.items():
+            if self._next_run[name] > now:
+                continue
+            self._next_run[name] = now + self._interval(name)
+            previous = self._running.get(name)
+            if previous is not None and not previous.done():
+                self.skipped[name] += 1
+                print(f"{name}: previous run still in progress, skipping")
+                continue
+            future = pool.submit(run_source, name, runner)
+            future.add_done_callback(lambda f, name=name: self._finished(name, f))
+            self._running[name] = future
+
+    def _compact_due(self, now: float):
+        # History files are rewritten, so only compact while nothing is appending to them
+        if now < self._next_compact or any(not f.done() for f in self._running.values()):
+            return
+        self._next_compact = now + COMPACT_INTERVAL
+        try:
+            compact_history()
+        except Exception as e:  # a bad pass must not take the poller down; retry next interval
+            print(f"Failed to compact history: {e}")
+
+    def _drain_due(self, pool, now: float):
+        # Sources only queue into the outbox; delivery runs beside them, one drain at a time
+        if get_outbox() is None or now < self._next_drain:
+            return
+        self._next_drain = now + OUTBOX_INTERVAL
+        if self._draining is not None and not self._draining.done():
+            return
+        self._draining = pool.submit(self._drain)
+
+    def _drain(self):
+        try:
+            result = drain_outbox()
+        except Exception as e:
+            print(f"Failed to drain the outbox: {e}")
+            return
+        if result and (result['sent'] or result['failed']):
+            print(f"Outbox: Sent {result['sent']}, Failed: {result['failed']}, Dead: {result['dead']}")
+
+    def stop(self, *_args):
+        self._stop.set()
+
+    def run(self, install_signals: bool = True):
+        if install_signals and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        start = time.monotonic()
+        # Stagger the first round a little instead of hitting everything at once
+        self._next_run = {
+            name: start + random.uniform(0, min(5.0, self.intervals[name] * self.jitter))
+            for name in self.sources
+        }
+        self._next_compact = start + COMPACT_INTERVAL
+        print(f"Polling {len(self.sources)} sources: "
+              + ", ".join(f"{name} every {int(seconds)}s" for name, seconds in self.intervals.items()))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                self._compact_due(now)
+                self._poll_due(pool, now)
+                self._drain_due(pool, now)
+                wake = min(self._next_run.values(), default=now + 1.0)
+                self._stop.wait(max(0.05, min(wake - time.monotonic(), 5.0)))
+            print("Shutting down, waiting for running sources to finish...")
+        # Every run has already waited for its deliveries; stop the Discord workers
+        set_delivery_queue(None)
+        shutdown_parse_pool()
+
+
+def main():
+    NewsDaemon().run()
+
+
+if __name__ == "__main__":
+    main()
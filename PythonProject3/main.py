@@ -1,79 +1,240 @@
 from __future__ import annotations
 
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 
-import requests
+# Only light modules at import time: parsers, bs4, feedparser, requests and
+# dotenv are imported by a source's runner when (and if) it actually runs.
+from PythonProject3.Helpers.coordination import lease
+from PythonProject3.Helpers.metrics import METRICS_JSON, METRICS_PROM, metrics
+from PythonProject3.Helpers.outbox import drain_outbox
+from PythonProject3.Helpers.retention import compact_all
+from PythonProject3.Helpers.search import flush_search_indexes
+from PythonProject3.Source.registry import REGISTRY, load, select
 
-from PythonProject3.Game.ApexNews import ApexNews
-from PythonProject3.Game.DeadlockNews import DeadlockNews
-from PythonProject3.Game.GamingNews import ArcRaidersNews
-from PythonProject3.Game.LeagueNews import LeagueNews
-from PythonProject3.Cyber.HackingNews import NewsFeed
-from PythonProject3.Source.webhook import webhook
+# Upper bound on how many sources are fetched/parsed/sent at the same time.
+# Override with the NEWS_MAX_WORKERS environment variable (1 = sequential).
+DEFAULT_MAX_WORKERS = int(os.getenv("NEWS_MAX_WORKERS", "4"))
 
 
-def main():
-    news = NewsFeed()
+def _router(source, webhook_key):
+    # The source's own webhook plus any channels its routing rules add
+    from PythonProject3.Source.routing import Router
+    return Router(source, webhook_key)
 
-    # Get today's date
-    today = datetime.now().date()
 
-    print(f"Today's date: {today}")
+def _print_preview(label, articles):
+    print(f"{label}: {len(articles)} new article(s) would be sent")
+    for article in articles:
+        print(f"  {article['title']} <{article['link']}>")
 
-    # Send the news to the specific discord webhook hackernews
-    result = news.save_to_file(webhook=webhook["hackerNews"])
-    print(f"HackerNews: Sent {result['sent']}, Failed: {result['failed']}")
 
-    # --- Game news section ---
-    game_news = ArcRaidersNews()
-    # Fetch HTML from the Arc Raiders news page
+def run_hacker_news(dry_run=False):
+    from PythonProject3.Cyber.HackingNews import NewsFeed
+
+    news = NewsFeed()
+    news.get_news()
+    if dry_run:
+        for key, articles in news.preview(webhook=_router("HackerNews", "hackerNews")).items():
+            _print_preview(key, articles)
+        return {"sent": 0, "failed": 0}
+
+    # Send the news to the hackernews webhook (and any routed channels)
+    return news.save_to_file(webhook=_router("HackerNews", "hackerNews"))
+
+
+def run_game_source(label, parser_cls, webhook_key, headers=None, dry_run=False):
+    """
+    Fetch one game news page, parse it and send new articles to Discord.
+    Returns the usual { 'sent': int, 'failed': int } result.
+
+    ``parser_cls`` may be a registry target ("module:Class") that is only
+    imported here.  A 304 Not Modified answer short-circuits parsing, dedup
+    and sending; ``dry_run`` lists the new articles instead of sending them.
+    """
+    from PythonProject3.Helpers.dedup import open_seen_store
+    from PythonProject3.Helpers.history import preview_articles
+    from PythonProject3.Helpers.http_cache import conditional_get, get_cache
+    from PythonProject3.Helpers.pagination import fetch_more_pages
+    from PythonProject3.Helpers.parse_pool import parse_news
+
+    if isinstance(parser_cls, str):
+        parser_cls = load(parser_cls)
+    parser = parser_cls()
+    # Parsing stops at the last article this source settled
+    parser.watermark = open_seen_store(parser.history_file).watermark(parser.source)
+    response = None
+    parsed_ok = False
     try:
-        response = requests.get(f"{game_news.base_url}/news")
-        response.raise_for_status()
-        html = response.text
-        game_news.get_news(html)
+        response = conditional_get(parser.feed_url, headers=headers)
+        if response is None:
+            print(f"{label} news unchanged since last run")
+            return {"sent": 0, "failed": 0}
+        with metrics.timer('parse'):
+            parse_news(parser, response.text)
+        # Paginated sources catch up on later pages after downtime / busy days
+        fetch_more_pages(parser)
+        metrics.incr('articles_found', len(parser.news))
+        parsed_ok = True
     except Exception as e:
-        print(f"Failed to fetch game news: {e}")
-
-    result = game_news.save_to_file(webhook=webhook["arcRaiderNews"])
-    print(f"ArcRaiders: Sent {result['sent']}, Failed: {result['failed']}")
-
-    # --- League of Legends patch notes section ---
-    league_news = LeagueNews()
+        print(f"Failed to fetch {label} news: {e}")
+
+    if dry_run:
+        _print_preview(label, preview_articles(parser.news, parser.history_file,
+                                               _router(parser.source, webhook_key)))
+        return {"sent": 0, "failed": 0}
+
+    result = parser.save_to_file(webhook=_router(parser.source, webhook_key))
+    # Only trust the validators once the page was parsed and everything on it delivered
+    if parsed_ok and result['failed'] == 0:
+        get_cache().remember(parser.feed_url, response)
+    return result
+
+
+def build_sources(specs=None, dry_run=False):
+    """Display name -> zero-argument runner for each spec; nothing is imported yet."""
+    specs = REGISTRY.values() if specs is None else specs
+    sources = {}
+    for spec in specs:
+        if spec.kind == 'rss':
+            sources[spec.name] = partial(run_hacker_news, dry_run=dry_run)
+        else:
+            sources[spec.name] = partial(run_game_source, spec.label, spec.target, spec.webhook_key,
+                                         dry_run=dry_run)
+    return sources
+
+
+# Display name -> callable returning { 'sent': int, 'failed': int }
+SOURCES = build_sources()
+
+
+def run_source(name, runner):
+    """
+    Run one source under its lease (NEWS_COORDINATION), so with several
+    instances only one polls a source at a time.  What the run recorded is
+    added to the search index afterwards, in one batch.
+    """
     try:
-        response = requests.get(league_news.feed_url)
-        response.raise_for_status()
-        league_news.get_news(response.text)
+        with lease(f"source:{name}") as leased:
+            if not leased:
+                print(f"{name}: running on another instance, skipping")
+                return {"sent": 0, "failed": 0}
+            with metrics.source(name):
+                try:
+                    with metrics.timer('run'):
+                        return runner()
+                finally:
+                    _flush_search_index(name)
     except Exception as e:
-        print(f"Failed to fetch League news: {e}")
+        print(f"{name}: run failed: {e}")
+        return {"sent": 0, "failed": 0}
 
-    result = league_news.save_to_file(webhook=webhook["leagueNews"])
-    print(f"League: Sent {result['sent']}, Failed: {result['failed']}")
 
-    # --- Apex Legends news section ---
-    apex_news = ApexNews()
+def _flush_search_index(name):
+    # The articles are already posted and recorded; a failed flush is retried after the next run
     try:
-        response = requests.get(apex_news.feed_url)
-        response.raise_for_status()
-        apex_news.get_news(response.text)
+        with metrics.timer('index'):
+            flush_search_indexes()
     except Exception as e:
-        print(f"Failed to fetch Apex Legends news: {e}")
+        print(f"{name}: failed to update the search index: {e}")
 
-    result = apex_news.save_to_file(webhook=webhook["apexNews"])
-    print(f"Apex: Sent {result['sent']}, Failed: {result['failed']}")
 
-    # --- Deadlock news section ---
-    deadlock_news = DeadlockNews()
-    try:
-        response = requests.get(deadlock_news.base_url, headers={'User-Agent': 'Mozilla/5.0'})
-        response.raise_for_status()
-        deadlock_news.get_news(response.text)
-    except Exception as e:
-        print(f"Failed to fetch Deadlock news: {e}")
+def run_sources(sources=None, max_workers=None):
+    """
+    Run every source concurrently on a bounded thread pool.
+
+    Each source is independent (own page, own history file, own webhook), so
+    they can be fetched, parsed and sent in parallel.  Returns a dict of
+    source name -> { 'sent': int, 'failed': int } in the order of ``sources``.
+    """
+    sources = SOURCES if sources is None else sources
+    max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+
+    if max_workers == 1:
+        return {name: run_source(name, runner) for name, runner in sources.items()}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sources) or 1)) as pool:
+        futures = {name: pool.submit(run_source, name, runner) for name, runner in sources.items()}
+        return {name: future.result() for name, future in futures.items()}
 
-    result = deadlock_news.save_to_file(webhook=webhook["deadlockNews"])
-    print(f"Deadlock: Sent {result['sent']}, Failed: {result['failed']}")
+
+def export_metrics(json_path=None, prom_path=None):
+    """Write the collected metrics as JSON and/or a Prometheus textfile."""
+    json_path = json_path or METRICS_JSON
+    prom_path = prom_path or METRICS_PROM
+    if json_path:
+        metrics.write_json(json_path)
+    if prom_path:
+        metrics.write_prometheus(prom_path)
+
+
+def history_files(specs=None) -> list[str]:
+    specs = REGISTRY.values() if specs is None else specs
+    return [spec.history_file for spec in specs]
+
+
+def compact_history(specs=None):
+    """Apply the NEWS_RETENTION_* policy to the history files (no-op when unset)."""
+    with lease('compact') as leased:
+        results = compact_all(history_files(specs)) if leased else {}
+    for name, result in results.items():
+        if result['archived']:
+            print(f"{name}: archived {result['archived']} old entries")
+
+
+def main(max_workers=None, metrics_json=None, metrics_prom=None, only=None, exclude=None, dry_run=False):
+    # Get today's date
+    today = datetime.now().date()
+
+    print(f"Today's date: {today}")
+
+    specs = select(only, exclude)
+    results = run_sources(build_sources(specs, dry_run), max_workers=max_workers)
+    if dry_run:
+        return results
+    for name, result in results.items():
+        print(f"{name}: Sent {result['sent']}, Failed: {result['failed']}")
+
+    # With NEWS_OUTBOX the runs above only queued; deliver (and retry) now
+    drained = drain_outbox()
+    if drained is not None:
+        print(f"Outbox: Sent {drained['sent']}, Failed: {drained['failed']}, Dead: {drained['dead']}")
+
+    compact_history(specs)
+    export_metrics(metrics_json, metrics_prom)
+    return results
+
+
+def cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fetch news and post new articles to Discord.")
+    parser.add_argument('--only', action='append', metavar='NAMES',
+                        help=f"comma-separated sources to run (default: all of {', '.join(REGISTRY)})")
+    parser.add_argument('--exclude', action='append', metavar='NAMES', help="comma-separated sources to skip")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="fetch and parse, print what would be sent, but send and record nothing")
+    parser.add_argument('--workers', type=int, help="sources run at the same time (default NEWS_MAX_WORKERS)")
+    parser.add_argument('--list', action='store_true', help="list the available sources and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for spec in REGISTRY.values():
+            aliases = f" (also: {', '.join(spec.aliases)})" if spec.aliases else ''
+            print(f"{spec.name}{aliases}")
+        return 0
+
+    only = [name for value in args.only or [] for name in value.split(',')]
+    exclude = [name for value in args.exclude or [] for name in value.split(',')]
+    try:
+        select(only, exclude)
+    except KeyError as e:
+        parser.error(e.args[0])
+    main(max_workers=args.workers, only=only, exclude=exclude, dry_run=args.dry_run)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(cli())